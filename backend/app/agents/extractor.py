@@ -86,6 +86,7 @@ class SignalExtractorAgent:
                 "item_number": sig.item_number,
                 "filing_accession": sig.filing_accession,
                 "filing_type": sig.filing_type,
+                "prompt_version": sig.prompt_version,
             })
 
         if update_callback:
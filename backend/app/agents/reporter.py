@@ -5,12 +5,16 @@ NO risk scores, NO predictions. Just facts from SEC filings.
 
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# A going concern not repeated for ~15 months is considered removed
+# (10-K is annual, so 15 months gives buffer)
+GOING_CONCERN_REMOVED_DAYS = 450
+
 
 @dataclass
 class TimelineEvent:
@@ -195,50 +199,27 @@ class ReportGeneratorAgent:
         - first_seen: date when first appeared
         - last_seen: date when last appeared
         """
-        gc_signals = [s for s in signals if s.get("type") == "GOING_CONCERN"]
-
-        if not gc_signals:
+        gc_dates = [
+            s["date"] for s in signals
+            if s.get("type") == "GOING_CONCERN" and s.get("date")
+        ]
+        if not gc_dates:
             return {"status": "NEVER"}
 
-        # Sort by date
-        gc_signals_sorted = sorted(
-            [s for s in gc_signals if s.get("date")],
-            key=lambda x: x["date"]
-        )
-
-        if not gc_signals_sorted:
-            return {"status": "NEVER"}
-
-        first_seen = gc_signals_sorted[0]["date"]
-        last_seen = gc_signals_sorted[-1]["date"]
+        # ISO date strings order chronologically, so min/max replace the sort
+        first_seen = min(gc_dates)[:10]
+        last_seen = max(gc_dates)[:10]
 
         # Determine if going concern is still active
+        status = "ACTIVE"
         try:
-            last_gc_date = datetime.fromisoformat(
-                last_seen.replace("Z", "").replace("T", " ").split("+")[0].split(" ")[0]
-            )
-            days_since = (datetime.now() - last_gc_date).days
-
-            # If last going concern was more than 15 months ago, likely removed
-            if days_since > 450:
-                return {
-                    "status": "REMOVED",
-                    "first_seen": first_seen[:10] if first_seen else None,
-                    "last_seen": last_seen[:10] if last_seen else None,
-                }
-            else:
-                return {
-                    "status": "ACTIVE",
-                    "first_seen": first_seen[:10] if first_seen else None,
-                    "last_seen": last_seen[:10] if last_seen else None,
-                }
+            days_since = (date.today() - date.fromisoformat(last_seen)).days
+            if days_since > GOING_CONCERN_REMOVED_DAYS:
+                status = "REMOVED"
         except (ValueError, TypeError) as e:
             logger.warning(f"Error parsing going concern dates: {e}")
-            return {
-                "status": "ACTIVE",
-                "first_seen": first_seen[:10] if first_seen else None,
-                "last_seen": last_seen[:10] if last_seen else None,
-            }
+
+        return {"status": status, "first_seen": first_seen, "last_seen": last_seen}
 
     def _calculate_timeline_context(
         self,
@@ -145,39 +145,26 @@ class SignalValidatorAgent:
                 "risk_score": 0,
             })
 
-            filings_stored = set()
-            for signal in signals:
-                filing_accession = signal.get("filing_accession", "")
-                filing_type = signal.get("filing_type", "")
-                date = signal.get("date", "")
-
-                if filing_accession and filing_accession not in filings_stored:
-                    await neo4j_service.store_filing(
-                        ticker=ticker,
-                        filing_data={
-                            "accession_number": filing_accession,
-                            "filing_type": filing_type,
-                            "filed_at": date,
-                            "url": "",
-                        },
-                    )
-                    filings_stored.add(filing_accession)
-
-                if filing_accession:
-                    await neo4j_service.store_signal(
-                        ticker=ticker,
-                        filing_accession=filing_accession,
-                        signal_data={
-                            "signal_id": signal.get("signal_id"),
-                            "type": signal.get("type"),
-                            "severity": signal.get("severity"),
-                            "confidence": signal.get("confidence"),
-                            "evidence": signal.get("evidence", ""),
-                            "date": date,
-                            "item_number": signal.get("item_number", ""),
-                            "person": signal.get("person"),
-                        },
-                    )
+            # Signals without a filing accession are not stored; the rest go
+            # through the shared write queue and are committed when this returns
+            await neo4j_service.write_queue.submit([
+                {
+                    "ticker": ticker,
+                    "filing_accession": signal["filing_accession"],
+                    "filing_type": signal.get("filing_type", ""),
+                    "url": "",
+                    "signal_id": signal.get("signal_id"),
+                    "type": signal.get("type"),
+                    "severity": signal.get("severity"),
+                    "confidence": signal.get("confidence"),
+                    "evidence": signal.get("evidence", ""),
+                    "date": signal.get("date", ""),
+                    "item_number": signal.get("item_number", ""),
+                    "person": signal.get("person"),
+                }
+                for signal in signals
+                if signal.get("filing_accession")
+            ])
 
             logger.info(f"Stored {len(signals)} signals in Neo4j")
 
@@ -0,0 +1,34 @@
+"""HTTP caching helpers for read-mostly API responses."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+# Filing-derived data changes at most a few times per day
+CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=900"
+
+
+def cached_json_response(request: Request, body: Any) -> Response:
+    """
+    Build a JSON response with a weak ETag and Cache-Control headers.
+
+    Returns 304 Not Modified when the client already holds the same payload.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        body: JSON-serializable response body
+
+    Returns:
+        Response with caching headers
+    """
+    content = orjson.dumps(body)
+    etag = 'W/"' + hashlib.blake2b(content, digest_size=8).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=content, media_type="application/json", headers=headers)
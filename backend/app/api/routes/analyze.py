@@ -48,8 +48,12 @@ async def start_analysis(request: AnalyzeRequest):
     if not ticker or len(ticker) > 10:
         raise HTTPException(status_code=400, detail="Invalid ticker symbol")
 
-    # Check cache first (completed analysis in Supabase)
-    cached = await supabase_service.get_cached_analysis(ticker)
+    # Cache lookup (Supabase) and running-job lookup (Redis) are independent,
+    # so run them concurrently; the cache still takes precedence below
+    cached, existing_job_id = await asyncio.gather(
+        supabase_service.get_cached_analysis(ticker),
+        asyncio.to_thread(get_running_job_for_ticker, ticker),
+    )
     if cached and cached.get("status") == "completed":
         # Check if there are new SEC filings since the analysis was cached
         analyzed_at = cached.get("analyzed_at") or cached.get("created_at")
@@ -74,7 +78,6 @@ async def start_analysis(request: AnalyzeRequest):
             )
 
     # Check if there's already a running job for this ticker
-    existing_job_id = get_running_job_for_ticker(ticker)
     if existing_job_id:
         logger.info(f"Returning existing job {existing_job_id} for {ticker}")
         return AnalyzeResponse(
@@ -84,7 +87,7 @@ async def start_analysis(request: AnalyzeRequest):
         )
 
     # Create new job
-    job_id = str(uuid.uuid4())
+    job_id = uuid.uuid4().hex
 
     # Initialize job status in Redis
     set_job_status(job_id, {
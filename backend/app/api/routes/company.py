@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from app.api.http_cache import cached_json_response
 from app.services.supabase_service import supabase_service
 from app.services.neo4j_service import neo4j_service
 
@@ -6,7 +7,7 @@ router = APIRouter()
 
 
 @router.get("/company/{ticker}")
-async def get_company(ticker: str):
+async def get_company(ticker: str, request: Request):
     """Get cached analysis for a company if it exists."""
     ticker = ticker.upper().strip()
 
@@ -14,16 +15,16 @@ async def get_company(ticker: str):
     if not cached:
         raise HTTPException(status_code=404, detail="No analysis found for this ticker")
 
-    return cached
+    return cached_json_response(request, cached)
 
 
 @router.get("/similar/{ticker}")
-async def get_similar_companies(ticker: str):
+async def get_similar_companies(ticker: str, request: Request):
     """Get companies with similar risk profiles."""
     ticker = ticker.upper().strip()
 
     similar = await neo4j_service.find_similar_companies(ticker)
-    return {"ticker": ticker, "similar_companies": similar}
+    return cached_json_response(request, {"ticker": ticker, "similar_companies": similar})
 
 
 @router.get("/patterns/{ticker}")
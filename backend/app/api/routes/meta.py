@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from app.services.cache import graph_cache
+
+router = APIRouter()
+
+
+@router.get("/meta/cache-stats")
+async def cache_stats():
+    """Graph read cache hit/miss counters for this process."""
+    return {"graph_cache": graph_cache.stats()}
@@ -4,9 +4,10 @@ Shows signal timeline with evidence and filing context.
 User interprets the data themselves.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import List, Optional
 
+from app.api.http_cache import cached_json_response
 from app.repositories.neo4j_repository import neo4j_repository
 from app.services.neo4j_service import neo4j_service
 from app.models.timeline_models import (
@@ -24,6 +25,19 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/timeline", tags=["timeline"])
 
 
+class _NullJobStore:
+    """Job store for synchronous pipeline runs whose progress nobody polls."""
+
+    def __contains__(self, key) -> bool:
+        return False
+
+    def get(self, key, default=None):
+        return default
+
+    def update_job(self, key, updates):
+        pass
+
+
 async def ensure_neo4j_connected():
     """Ensure Neo4j is connected, reconnect if needed."""
     if not await neo4j_service.health_check():
@@ -33,8 +47,16 @@ async def ensure_neo4j_connected():
             raise HTTPException(status_code=503, detail=f"Neo4j unavailable: {e}")
 
 
+async def ensure_neo4j_driver():
+    """Ensure a Neo4j driver exists without pinging the server first."""
+    try:
+        await neo4j_service.ensure_driver()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Neo4j unavailable: {e}")
+
+
 @router.get("/{ticker}", response_model=CompanyTimeline)
-async def get_company_timeline(ticker: str):
+async def get_company_timeline(ticker: str, request: Request):
     """
     Get complete signal timeline for a company.
 
@@ -45,7 +67,9 @@ async def get_company_timeline(ticker: str):
 
     NO risk scores or predictions - facts only.
     """
-    await ensure_neo4j_connected()
+    # Liveness is implied by the timeline query; the repository reconnects
+    # and retries once if the connection turns out to be dead.
+    await ensure_neo4j_driver()
     ticker = ticker.upper()
 
     timeline = await neo4j_repository.get_company_timeline(ticker)
@@ -53,7 +77,7 @@ async def get_company_timeline(ticker: str):
     if not timeline:
         raise HTTPException(status_code=404, detail=f"Company {ticker} not found")
 
-    return timeline
+    return cached_json_response(request, timeline.model_dump(mode="json"))
 
 
 @router.get("/{ticker}/going-concern", response_model=GoingConcernHistory)
@@ -147,17 +171,12 @@ async def sync_company_to_neo4j(ticker: str):
     from app.agents.orchestrator import AnalysisPipeline
     from app.services.neo4j_sync_service import neo4j_sync_service
 
-    class SimpleJobStore(dict):
-        def update_job(self, key, updates):
-            if key in self:
-                self[key].update(updates)
-
-    jobs = SimpleJobStore()
+    # The endpoint blocks until the pipeline finishes, so progress updates
+    # are discarded instead of being accumulated in an unread dict
     job_id = f"sync-{ticker.lower()}"
-    jobs[job_id] = {"id": job_id, "ticker": ticker, "status": "processing"}
 
     try:
-        pipeline = AnalysisPipeline(job_id, jobs)
+        pipeline = AnalysisPipeline(job_id, _NullJobStore())
         result = await pipeline.run(ticker)
 
         # Sync to Neo4j using facts-only sync service
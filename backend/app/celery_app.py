@@ -1,6 +1,10 @@
 """Celery application configuration for background task processing."""
 
+import asyncio
+
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import worker_process_init
 from app.config import get_settings
 
 settings = get_settings()
@@ -33,4 +37,28 @@ celery_app.conf.update(
     # Worker settings
     worker_prefetch_multiplier=1,  # Process one task at a time
     worker_concurrency=4,  # 4 concurrent workers
+
+    # Periodic tasks (beat runs embedded in the worker, see start.sh)
+    beat_schedule={
+        "refresh-recent-filings": {
+            "task": "refresh_recent_filings",
+            "schedule": crontab(hour=3, minute=0),
+        },
+    },
 )
+
+
+@worker_process_init.connect
+def _warm_settings(**kwargs):
+    """Make sure each worker process reuses the parsed settings."""
+    get_settings()
+
+
+@worker_process_init.connect
+def _use_uvloop(**kwargs):
+    """Tasks build their loops with asyncio.new_event_loop(); make those uvloop loops."""
+    try:
+        import uvloop
+    except ImportError:  # installed with uvicorn[standard], absent on Windows
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
 
@@ -13,11 +13,22 @@ class Settings(BaseSettings):
     neo4j_uri: str
     neo4j_username: str
     neo4j_password: str
+    neo4j_max_pool_size: int = 100
+    neo4j_acquisition_timeout_s: int = 30
+    neo4j_max_connection_lifetime_s: int = 3600
+    neo4j_fetch_size: int = 1000
 
     # Supabase
     supabase_url: str
     supabase_anon_key: str
     supabase_service_key: str
+    # Direct Postgres connection string (port 5432, not the transaction pooler,
+    # which breaks asyncpg's prepared statements)
+    supabase_db_url: str
+    supabase_db_pool_min_size: int = 2
+    supabase_db_pool_max_size: int = 20
+    # Schema the pgvector extension is installed in
+    supabase_db_vector_schema: str = "public"
 
     # SEC EDGAR
     sec_user_agent: str = "InsightLookinsight contact@lookinsight.ai"
@@ -29,9 +40,11 @@ class Settings(BaseSettings):
     debug: bool = True
     api_v1_prefix: str = "/api/v1"
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
 
 
 @lru_cache()
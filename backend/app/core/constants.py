@@ -1,5 +1,9 @@
 """Centralized constants for signal processing."""
 
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import FrozenSet, Mapping
+
 # Base severity by signal type (can be adjusted by context)
 BASE_SEVERITY = {
     "BANKRUPTCY_FILING": 10,
@@ -109,97 +113,115 @@ PREDICTIVE_WEIGHTS = {
     "BANKRUPTCY_FILING": 2,   # Already happened - confirmation only
 }
 
+@dataclass(frozen=True, slots=True)
+class SignalCombination:
+    """A set of signal types that together indicate elevated risk."""
+    signals: FrozenSet[str]
+    multiplier: float
+    description: str
+    risk_level: str
+
+
 # Dangerous signal combinations - these patterns are highly predictive
 # Each combination has a multiplier applied to combined weight
-SIGNAL_COMBINATIONS = {
+SIGNAL_COMBINATIONS: Mapping[str, SignalCombination] = MappingProxyType({
     # Insider Flight Pattern (Critical)
-    "INSIDER_FLIGHT": {
-        "signals": ["CFO_DEPARTURE", "AUDITOR_CHANGE"],
-        "multiplier": 1.5,
-        "description": "CFO and Auditor both exiting - insiders fleeing",
-        "risk_level": "CRITICAL",
-    },
+    "INSIDER_FLIGHT": SignalCombination(
+        signals=frozenset({"CFO_DEPARTURE", "AUDITOR_CHANGE"}),
+        multiplier=1.5,
+        description="CFO and Auditor both exiting - insiders fleeing",
+        risk_level="CRITICAL",
+    ),
 
     # Financial Collapse Pattern (Critical)
-    "FINANCIAL_COLLAPSE": {
-        "signals": ["COVENANT_VIOLATION", "DEBT_DEFAULT"],
-        "multiplier": 1.5,
-        "description": "Covenant breach followed by default - debt spiral",
-        "risk_level": "CRITICAL",
-    },
+    "FINANCIAL_COLLAPSE": SignalCombination(
+        signals=frozenset({"COVENANT_VIOLATION", "DEBT_DEFAULT"}),
+        multiplier=1.5,
+        description="Covenant breach followed by default - debt spiral",
+        risk_level="CRITICAL",
+    ),
 
     # Leadership Crisis Pattern (High)
-    "LEADERSHIP_CRISIS": {
-        "signals": ["CEO_DEPARTURE", "CFO_DEPARTURE"],
-        "multiplier": 1.4,
-        "description": "Both CEO and CFO leaving - leadership vacuum",
-        "risk_level": "HIGH",
-    },
+    "LEADERSHIP_CRISIS": SignalCombination(
+        signals=frozenset({"CEO_DEPARTURE", "CFO_DEPARTURE"}),
+        multiplier=1.4,
+        description="Both CEO and CFO leaving - leadership vacuum",
+        risk_level="HIGH",
+    ),
 
     # Confirmed Distress Pattern (Critical)
-    "CONFIRMED_DISTRESS": {
-        "signals": ["GOING_CONCERN", "RESTRUCTURING"],
-        "multiplier": 1.5,
-        "description": "Auditor warning plus restructuring - confirmed crisis",
-        "risk_level": "CRITICAL",
-    },
+    "CONFIRMED_DISTRESS": SignalCombination(
+        signals=frozenset({"GOING_CONCERN", "RESTRUCTURING"}),
+        multiplier=1.5,
+        description="Auditor warning plus restructuring - confirmed crisis",
+        risk_level="CRITICAL",
+    ),
 
     # Operational Meltdown Pattern (High)
-    "OPERATIONAL_MELTDOWN": {
-        "signals": ["MASS_LAYOFFS", "RESTRUCTURING"],
-        "multiplier": 1.3,
-        "description": "Layoffs plus restructuring - deep operational cuts",
-        "risk_level": "HIGH",
-    },
+    "OPERATIONAL_MELTDOWN": SignalCombination(
+        signals=frozenset({"MASS_LAYOFFS", "RESTRUCTURING"}),
+        multiplier=1.3,
+        description="Layoffs plus restructuring - deep operational cuts",
+        risk_level="HIGH",
+    ),
 
     # Cash Crisis Pattern (High)
-    "CASH_CRISIS": {
-        "signals": ["MASS_LAYOFFS", "EQUITY_DILUTION"],
-        "multiplier": 1.3,
-        "description": "Cutting staff and raising equity - cash desperation",
-        "risk_level": "HIGH",
-    },
+    "CASH_CRISIS": SignalCombination(
+        signals=frozenset({"MASS_LAYOFFS", "EQUITY_DILUTION"}),
+        multiplier=1.3,
+        description="Cutting staff and raising equity - cash desperation",
+        risk_level="HIGH",
+    ),
 
     # Accounting Red Flag Pattern (High)
-    "ACCOUNTING_RED_FLAG": {
-        "signals": ["AUDITOR_CHANGE", "MATERIAL_WEAKNESS"],
-        "multiplier": 1.4,
-        "description": "Auditor change plus material weakness - accounting issues",
-        "risk_level": "HIGH",
-    },
+    "ACCOUNTING_RED_FLAG": SignalCombination(
+        signals=frozenset({"AUDITOR_CHANGE", "MATERIAL_WEAKNESS"}),
+        multiplier=1.4,
+        description="Auditor change plus material weakness - accounting issues",
+        risk_level="HIGH",
+    ),
 
     # Delisting Spiral Pattern (Critical)
-    "DELISTING_SPIRAL": {
-        "signals": ["DELISTING_WARNING", "MASS_LAYOFFS", "CFO_DEPARTURE"],
-        "multiplier": 1.6,
-        "description": "Delisting warning with layoffs and CFO exit - collapse imminent",
-        "risk_level": "CRITICAL",
-    },
+    "DELISTING_SPIRAL": SignalCombination(
+        signals=frozenset({"DELISTING_WARNING", "MASS_LAYOFFS", "CFO_DEPARTURE"}),
+        multiplier=1.6,
+        description="Delisting warning with layoffs and CFO exit - collapse imminent",
+        risk_level="CRITICAL",
+    ),
 
     # Triple Threat Pattern (Critical)
-    "TRIPLE_THREAT": {
-        "signals": ["CFO_DEPARTURE", "COVENANT_VIOLATION", "MASS_LAYOFFS"],
-        "multiplier": 1.8,
-        "description": "CFO exits + covenant breach + layoffs - imminent collapse",
-        "risk_level": "CRITICAL",
-    },
-}
+    "TRIPLE_THREAT": SignalCombination(
+        signals=frozenset({"CFO_DEPARTURE", "COVENANT_VIOLATION", "MASS_LAYOFFS"}),
+        multiplier=1.8,
+        description="CFO exits + covenant breach + layoffs - imminent collapse",
+        risk_level="CRITICAL",
+    ),
+})
+
+@dataclass(frozen=True, slots=True)
+class VelocityThreshold:
+    """Signal count within a window that marks a velocity level."""
+    signals_count: int
+    days: int
+    multiplier: float
+    description: str
+
 
 # Signal velocity thresholds (signals within time period)
-VELOCITY_THRESHOLDS = {
-    "HIGH_VELOCITY": {
-        "signals_count": 3,
-        "days": 90,
-        "multiplier": 1.3,
-        "description": "3+ signals in 90 days indicates rapid deterioration",
-    },
-    "EXTREME_VELOCITY": {
-        "signals_count": 5,
-        "days": 90,
-        "multiplier": 1.5,
-        "description": "5+ signals in 90 days indicates crisis",
-    },
-}
+VELOCITY_THRESHOLDS: Mapping[str, VelocityThreshold] = MappingProxyType({
+    "HIGH_VELOCITY": VelocityThreshold(
+        signals_count=3,
+        days=90,
+        multiplier=1.3,
+        description="3+ signals in 90 days indicates rapid deterioration",
+    ),
+    "EXTREME_VELOCITY": VelocityThreshold(
+        signals_count=5,
+        days=90,
+        multiplier=1.5,
+        description="5+ signals in 90 days indicates crisis",
+    ),
+})
 
 # Validation thresholds
 MIN_CONFIDENCE = 0.6
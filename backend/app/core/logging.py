@@ -2,8 +2,22 @@
 
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 
+# Third-party loggers quieted to WARNING to reduce noise
+_NOISY_LOGGERS = ("httpx", "httpcore", "neo4j", "urllib3", "openai")
+
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+_initialized = False
+
 
 def setup_logging(
     level: str = "INFO",
@@ -12,6 +26,9 @@ def setup_logging(
     """
     Set up application logging.
 
+    Only the first call configures handlers; later calls (e.g. on reimport in
+    worker processes or tests) just return the application logger.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: Optional custom log format
@@ -19,6 +36,11 @@ def setup_logging(
     Returns:
         Root logger instance
     """
+    global _initialized
+    if _initialized:
+        return logging.getLogger("insight")
+    _initialized = True
+
     if log_format is None:
         log_format = (
             "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d | %(message)s"
@@ -26,7 +48,7 @@ def setup_logging(
 
     # Configure root logger
     logging.basicConfig(
-        level=getattr(logging, level.upper()),
+        level=_LEVELS.get(level.upper(), logging.INFO),
         format=log_format,
         handlers=[
             logging.StreamHandler(sys.stdout),
@@ -34,26 +56,27 @@ def setup_logging(
     )
 
     # Set third-party loggers to WARNING to reduce noise
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("neo4j").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("openai").setLevel(logging.WARNING)
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
 
     return logging.getLogger("insight")
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
 
+    Cached, so repeated calls with the same name skip the string concat and
+    the logging manager lookup.
+
     Args:
         name: Logger name (typically __name__)
 
     Returns:
         Logger instance
     """
-    return logging.getLogger(f"insight.{name}")
+    return logging.getLogger("insight." + name)
 
 
 # Initialize default logger
@@ -2,7 +2,7 @@
 
 import asyncio
 import time
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from threading import Lock
 
@@ -16,6 +16,14 @@ class RateLimiter:
     """
     Token bucket rate limiter.
 
+    Every refill-and-take (_take) runs under one threading lock, shared by
+    the sync path (acquire) and the async path (acquire_async), so sync and
+    async callers of one limiter never spend the same tokens. The lock is only
+    held for that arithmetic, never across a sleep. Async callers additionally
+    queue on an asyncio lock created on first use; it follows the current
+    event loop, and using one limiter from several event loops at the same
+    time is not supported.
+
     Attributes:
         requests_per_second: Maximum requests per second
         burst_size: Maximum burst size (bucket capacity)
@@ -23,23 +31,43 @@ class RateLimiter:
 
     requests_per_second: float
     burst_size: int = 10
-    _tokens: float = field(init=False)
-    _last_update: float = field(init=False)
-    _lock: Lock = field(default_factory=Lock, init=False)
+    _state: Tuple[float, float] = field(init=False)
+    _thread_lock: Lock = field(default_factory=Lock, init=False)
+    _async_lock: Optional[asyncio.Lock] = field(default=None, init=False)
+    _async_lock_loop: Optional[asyncio.AbstractEventLoop] = field(default=None, init=False)
 
     def __post_init__(self):
-        self._tokens = float(self.burst_size)
-        self._last_update = time.monotonic()
+        self._state = (float(self.burst_size), time.monotonic())
+
+    def _check_tokens(self, tokens: int) -> None:
+        """Reject requests the bucket can never satisfy (it refills up to burst_size)."""
+        if tokens > self.burst_size:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens from a bucket of burst_size {self.burst_size}"
+            )
+
+    def _take(self, tokens: int) -> float:
+        """
+        Refill the bucket and take tokens if enough are available.
+
+        Reads and writes the bucket state, so callers must hold _thread_lock.
 
-    def _refill(self):
-        """Refill tokens based on elapsed time."""
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds to wait
+        """
+        available, last_update = self._state
         now = time.monotonic()
-        elapsed = now - self._last_update
-        self._tokens = min(
+        available = min(
             self.burst_size,
-            self._tokens + elapsed * self.requests_per_second,
+            available + (now - last_update) * self.requests_per_second,
         )
-        self._last_update = now
+
+        if available >= tokens:
+            self._state = (available - tokens, now)
+            return 0.0
+
+        self._state = (available, now)
+        return (tokens - available) / self.requests_per_second
 
     def acquire(self, tokens: int = 1) -> float:
         """
@@ -50,24 +78,24 @@ class RateLimiter:
 
         Returns:
             Time waited in seconds
-        """
-        with self._lock:
-            self._refill()
 
-            if self._tokens >= tokens:
-                self._tokens -= tokens
-                return 0.0
-
-            # Calculate wait time
-            tokens_needed = tokens - self._tokens
-            wait_time = tokens_needed / self.requests_per_second
-
-            logger.debug(f"Rate limit: waiting {wait_time:.2f}s for {tokens} tokens")
+        Raises:
+            ValueError: If tokens exceeds burst_size
+        """
+        self._check_tokens(tokens)
+
+        total_waited = 0.0
+        while True:
+            with self._thread_lock:
+                wait_time = self._take(tokens)
+            if not wait_time:
+                return total_waited
+
+            # Sleep outside the lock so concurrent callers can wait in parallel;
+            # tokens accrued meanwhile are picked up by the next refill
+            logger.debug("Rate limit: waiting %.2fs for %d tokens", wait_time, tokens)
             time.sleep(wait_time)
-
-            self._tokens = 0
-            self._last_update = time.monotonic()
-            return wait_time
+            total_waited += wait_time
 
     async def acquire_async(self, tokens: int = 1) -> float:
         """
@@ -78,25 +106,31 @@ class RateLimiter:
 
         Returns:
             Time waited in seconds
-        """
-        with self._lock:
-            self._refill()
 
-            if self._tokens >= tokens:
-                self._tokens -= tokens
-                return 0.0
+        Raises:
+            ValueError: If tokens exceeds burst_size
+        """
+        self._check_tokens(tokens)
 
-            tokens_needed = tokens - self._tokens
-            wait_time = tokens_needed / self.requests_per_second
+        # Created lazily because asyncio.Lock needs a running loop, and again
+        # whenever a new loop shows up (Celery tasks each run asyncio.run)
+        loop = asyncio.get_running_loop()
+        if self._async_lock is None or self._async_lock_loop is not loop:
+            self._async_lock = asyncio.Lock()
+            self._async_lock_loop = loop
 
-        logger.debug(f"Rate limit: waiting {wait_time:.2f}s for {tokens} tokens")
-        await asyncio.sleep(wait_time)
+        total_waited = 0.0
+        while True:
+            async with self._async_lock:
+                # Shared with sync callers; held only for the arithmetic
+                with self._thread_lock:
+                    wait_time = self._take(tokens)
+            if not wait_time:
+                return total_waited
 
-        with self._lock:
-            self._tokens = 0
-            self._last_update = time.monotonic()
-
-        return wait_time
+            logger.debug("Rate limit: waiting %.2fs for %d tokens", wait_time, tokens)
+            await asyncio.sleep(wait_time)
+            total_waited += wait_time
 
 
 class RateLimiterRegistry:
@@ -118,13 +152,21 @@ class RateLimiterRegistry:
         Returns:
             RateLimiter instance
         """
+        # Fast path: dict reads are atomic under the GIL, so existing
+        # limiters are returned without taking the registry lock
+        limiter = self._limiters.get(name)
+        if limiter is not None:
+            return limiter
+
         with self._lock:
-            if name not in self._limiters:
-                self._limiters[name] = RateLimiter(
+            limiter = self._limiters.get(name)
+            if limiter is None:
+                limiter = RateLimiter(
                     requests_per_second=requests_per_second,
                     burst_size=burst_size,
                 )
-            return self._limiters[name]
+                self._limiters[name] = limiter
+            return limiter
 
 
 # Global registry
@@ -1,32 +1,41 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import get_settings
-from app.api.routes import analyze, company, health, timeline
+from app.api.routes import analyze, company, health, meta, timeline
 from app.services.neo4j_service import neo4j_service
 from app.services.supabase_service import supabase_service
+from app.repositories.neo4j_repository import neo4j_repository
+from app.core.logging import get_logger
 
+logger = get_logger(__name__)
 settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("Starting up Insight Lookinsight API...")
+    logger.info("Starting up Insight Lookinsight API...")
     try:
         await neo4j_service.connect()
-        print("Connected to Neo4j")
+        await neo4j_repository.ensure_schema()
+        logger.info("Connected to Neo4j")
     except Exception as e:
-        print(f"Warning: Could not connect to Neo4j: {e}")
-        print("App will continue without Neo4j graph features")
+        logger.warning(f"Could not connect to Neo4j: {e}")
+        logger.warning("App will continue without Neo4j graph features")
     yield
     # Shutdown
-    print("Shutting down...")
+    logger.info("Shutting down...")
     try:
         await neo4j_service.close()
     except Exception:
         pass
+    try:
+        await supabase_service.close()
+    except Exception:
+        pass
 
 
 app = FastAPI(
@@ -34,6 +43,7 @@ app = FastAPI(
     description="Multi-agent SEC filing analysis for bankruptcy risk detection",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -50,6 +60,7 @@ app.include_router(health.router, tags=["Health"])
 app.include_router(analyze.router, prefix=settings.api_v1_prefix, tags=["Analysis"])
 app.include_router(company.router, prefix=settings.api_v1_prefix, tags=["Company"])
 app.include_router(timeline.router, prefix=settings.api_v1_prefix, tags=["Timeline"])
+app.include_router(meta.router, prefix=settings.api_v1_prefix, tags=["Meta"])
 
 
 @app.get("/")
@@ -1,11 +1,13 @@
 """Analysis models."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
 class TimelineEvent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     date: str
     type: str
     severity: int
@@ -13,6 +15,8 @@ class TimelineEvent(BaseModel):
 
 
 class SimilarCompany(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     name: str
     status: str
@@ -22,6 +26,8 @@ class SimilarCompany(BaseModel):
 
 
 class PatternMatch(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     company: str
     name: str
     bankruptcy_date: Optional[str]
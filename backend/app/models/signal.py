@@ -23,13 +23,18 @@ class SignalType(str, Enum):
     EQUITY_DILUTION = "EQUITY_DILUTION"
 
 
-class Signal(BaseModel):
+class SignalBase(BaseModel):
+    """Fields shared by every signal representation."""
     id: str
-    type: SignalType
+    type: str
     date: str
+    evidence: str
+
+
+class Signal(SignalBase):
+    type: SignalType
     severity: int
     confidence: float
-    evidence: str
     source_filing: str
     item_number: str
     person: Optional[str] = None
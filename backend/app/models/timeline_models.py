@@ -1,8 +1,11 @@
 """Timeline models for Neo4j - Facts-only, no scoring."""
 
-from pydantic import BaseModel
-from typing import Optional, List
-from datetime import date, datetime
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from enum import IntEnum
+from typing import Optional, List, Tuple
+
+from app.models.signal import SignalBase
+from app.prompts.types import SIGNAL_TYPE_CODES
 
 
 # ==================== NODE MODELS ====================
@@ -19,12 +22,8 @@ class CompanyNode(BaseModel):
     going_concern_last_seen: Optional[str] = None
 
 
-class SignalNode(BaseModel):
+class SignalNode(SignalBase):
     """Signal node for Neo4j storage."""
-    id: str
-    type: str
-    date: str
-    evidence: str
     fiscal_year: int
 
 
@@ -46,6 +45,8 @@ class FilingNode(BaseModel):
 
 class FilingInfo(BaseModel):
     """Filing info attached to a signal."""
+    model_config = ConfigDict(frozen=True)
+
     type: str
     item: Optional[str] = None
     date: str
@@ -53,12 +54,10 @@ class FilingInfo(BaseModel):
     accession: str
 
 
-class SignalDetail(BaseModel):
+class SignalDetail(SignalBase):
     """Detailed signal with filing context."""
-    id: str
-    type: str
-    date: str
-    evidence: str
+    model_config = ConfigDict(frozen=True)
+
     fiscal_year: Optional[int] = None
     days_to_next: Optional[int] = None
     filing: Optional[FilingInfo] = None
@@ -66,6 +65,8 @@ class SignalDetail(BaseModel):
 
 class FilingDetail(BaseModel):
     """Detailed filing information."""
+    model_config = ConfigDict(frozen=True)
+
     accession: str
     type: str
     item: Optional[str] = None
@@ -98,8 +99,8 @@ class CompanyInfo(BaseModel):
 class CompanyTimeline(BaseModel):
     """Complete company timeline - facts only, no scores."""
     company: CompanyInfo
-    signals: List[SignalDetail] = []
-    recent_filings: List[FilingDetail] = []
+    signals: Tuple[SignalDetail, ...] = ()
+    recent_filings: Tuple[FilingDetail, ...] = ()
 
 
 class GoingConcernYear(BaseModel):
@@ -111,24 +112,30 @@ class GoingConcernYear(BaseModel):
 
 
 class GoingConcernHistory(BaseModel):
-    """Track going concern status across 10-K filings."""
+    """Track going concern status across 10-K filings (most recent year first)."""
     ticker: str
     years: List[GoingConcernYear] = []
 
+    _status_changed: bool = PrivateAttr(default=False)
+    _was_removed: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context) -> None:
+        # Both flags only compare the two latest years, so derive them once
+        if len(self.years) >= 2:
+            latest = self.years[0].has_going_concern
+            previous = self.years[1].has_going_concern
+            self._status_changed = latest != previous
+            self._was_removed = previous and not latest
+
     @property
     def status_changed(self) -> bool:
         """Did going concern status change between years?"""
-        if len(self.years) < 2:
-            return False
-        return self.years[0].has_going_concern != self.years[1].has_going_concern
+        return self._status_changed
 
     @property
     def was_removed(self) -> bool:
         """Was going concern removed in most recent filing?"""
-        if len(self.years) < 2:
-            return False
-        return (not self.years[0].has_going_concern and
-                self.years[1].has_going_concern)
+        return self._was_removed
 
 
 class SimilarCase(BaseModel):
@@ -145,7 +152,8 @@ class SimilarCase(BaseModel):
 
 # ==================== SIGNAL TYPE CONSTANTS ====================
 
-DISTRESS_SIGNAL_TYPES = [
+# Frozenset for O(1) membership tests and direct set intersection
+DISTRESS_SIGNAL_TYPES = frozenset({
     "GOING_CONCERN",
     "MATERIAL_WEAKNESS",
     "RESTRUCTURING",
@@ -158,8 +166,44 @@ DISTRESS_SIGNAL_TYPES = [
     "COVENANT_VIOLATION",
     "DELISTING_WARNING",
     "SEC_INVESTIGATION",
-    "BANKRUPTCY_FILING"
-]
+    "BANKRUPTCY_FILING",
+})
+
+class SignalTypeCode(IntEnum):
+    """
+    Stable integer code per signal type (stored as Signal.type_code).
+
+    The code is also the type's bit in Company.signal_type_mask. Stored data
+    depends on these values: append new types, never renumber.
+    """
+    GOING_CONCERN = 0
+    BANKRUPTCY_FILING = 1
+    CEO_DEPARTURE = 2
+    CFO_DEPARTURE = 3
+    MASS_LAYOFFS = 4
+    DEBT_DEFAULT = 5
+    COVENANT_VIOLATION = 6
+    AUDITOR_CHANGE = 7
+    BOARD_RESIGNATION = 8
+    DELISTING_WARNING = 9
+    CREDIT_DOWNGRADE = 10
+    ASSET_SALE = 11
+    RESTRUCTURING = 12
+    SEC_INVESTIGATION = 13
+    MATERIAL_WEAKNESS = 14
+    EQUITY_DILUTION = 15
+
+
+# The codes mirror app.prompts.types.SignalType (same names, same order); a type
+# added there without a code here would silently drop out of the mask
+if [code.name for code in SignalTypeCode] != SIGNAL_TYPE_CODES:
+    raise RuntimeError(
+        "SignalTypeCode is out of sync with app.prompts.types.SignalType: "
+        f"{[code.name for code in SignalTypeCode]} != {SIGNAL_TYPE_CODES}"
+    )
+
+# Bit per signal type for Company.signal_type_mask
+SIGNAL_TYPE_BITS = {code.name: 1 << code for code in SignalTypeCode}
 
 FILING_CATEGORIES = {
     "DISTRESS": "Contains distress signals",
@@ -1,10 +1,17 @@
 # Prompts module
 from app.prompts.extraction import SIGNAL_EXTRACTION_PROMPT, SIGNAL_TYPES
-from app.prompts.validation import LLM_VALIDATION_PROMPT, VALID_SIGNAL_TYPES
+from app.prompts.validation import (
+    LLM_VALIDATION_PROMPT,
+    LLM_VALIDATION_TEMPLATE,
+    MAX_VALIDATION_BATCH,
+    VALID_SIGNAL_TYPES,
+)
 
 __all__ = [
     "SIGNAL_EXTRACTION_PROMPT",
     "SIGNAL_TYPES",
     "LLM_VALIDATION_PROMPT",
+    "LLM_VALIDATION_TEMPLATE",
+    "MAX_VALIDATION_BATCH",
     "VALID_SIGNAL_TYPES",
 ]
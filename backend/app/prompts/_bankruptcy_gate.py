@@ -0,0 +1,68 @@
+"""Deterministic BANKRUPTCY_FILING vs GOING_CONCERN check run before LLM validation."""
+
+import re
+from typing import List, Literal
+
+BankruptcyVerdict = Literal["FILED", "CONDITIONAL", "UNCLEAR"]
+
+# Conditional wording this close to a filing phrase makes the evidence ambiguous
+COND_WINDOW_CHARS = 30
+
+# Conditional wording; "may" followed by a number is the month ("May 14, 2023")
+_COND_WORDS = r"\b(?:may(?!\W+\d)|could|might|would|if|unless|unlikely|no assurance)\b"
+
+# Same rule as the prompts: past-tense filing language vs hypothetical wording.
+# Both alternations live in one pattern so the evidence is scanned once.
+_GATE_PATTERN = re.compile(
+    r"(?P<filed>"
+    r"filed (?:a |the )?(?:voluntary )?petitions?"
+    r"|filed (?:for|under) (?:relief under )?(?:chapter (?:7|11)|bankruptcy)"
+    r"|commenced (?:voluntary )?(?:chapter (?:7|11)|bankruptcy|cases? under chapter)"
+    r")"
+    r"|(?P<cond>" + _COND_WORDS + r")"
+)
+
+# A hypothetical filing: conditional wording that governs the bankruptcy
+# phrase itself ("may be forced to file for bankruptcy", "if we seek
+# protection under Chapter 11"). A conditional word elsewhere in the
+# evidence says nothing about whether the filing happened.
+_CONDITIONAL_FILING = re.compile(
+    _COND_WORDS
+    + r"(?:\W+\w+){0,6}?\W+"
+    + r"(?:file|filing|seek|seeking|commence|petition|enter|entering|reorganiz)\w*"
+    + r"(?:\W+\w+){0,5}?\W+"
+    + r"(?:bankruptcy|chapter (?:7|11)|insolvency|receivership)"
+)
+
+
+def classify_bankruptcy(evidence: str) -> BankruptcyVerdict:
+    """
+    Classify bankruptcy evidence without an LLM call.
+
+    Args:
+        evidence: Evidence text for a BANKRUPTCY_FILING signal
+
+    Returns:
+        "FILED" for an actual filing with no nearby conditional wording,
+        "CONDITIONAL" when the only filing language is hypothetical (a going
+        concern disclosure), otherwise "UNCLEAR" (leave it to the LLM)
+    """
+    text = evidence.lower()
+    filed_spans: List[tuple] = []
+    cond_positions: List[int] = []
+    for match in _GATE_PATTERN.finditer(text):
+        if match.lastgroup == "filed":
+            filed_spans.append(match.span())
+        else:
+            cond_positions.append(match.start())
+
+    if not filed_spans:
+        return "CONDITIONAL" if _CONDITIONAL_FILING.search(text) else "UNCLEAR"
+
+    for start, end in filed_spans:
+        if not any(
+            start - COND_WINDOW_CHARS <= pos <= end + COND_WINDOW_CHARS
+            for pos in cond_positions
+        ):
+            return "FILED"
+    return "UNCLEAR"
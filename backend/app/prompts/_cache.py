@@ -0,0 +1,96 @@
+"""Cache of raw LLM extraction responses keyed by filing and prompt version."""
+
+import asyncio
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import redis.asyncio as aioredis
+
+from app.config import get_settings
+from app.core.logging import get_logger
+from app.prompts.extraction import (
+    EXTRACT_8K_SYSTEM,
+    EXTRACT_8K_USER_TEMPLATE,
+    EXTRACT_10K_GOING_CONCERN_PROMPT,
+    EXTRACT_10K_ITEMS_PROMPT,
+)
+from app.prompts.schemas import GOING_CONCERN_SCHEMA, SIGNAL_EXTRACTION_SCHEMA
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Responses are immutable for a given (filing, prompt version), the TTL only bounds memory
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+_PROMPTS: Dict[str, tuple] = {
+    "8k": (EXTRACT_8K_SYSTEM + EXTRACT_8K_USER_TEMPLATE, SIGNAL_EXTRACTION_SCHEMA),
+    "10k_going_concern": (EXTRACT_10K_GOING_CONCERN_PROMPT, GOING_CONCERN_SCHEMA),
+    "10k_items": (EXTRACT_10K_ITEMS_PROMPT, SIGNAL_EXTRACTION_SCHEMA),
+}
+
+
+@lru_cache(maxsize=None)
+def prompt_version_hash(prompt: str, model: str) -> str:
+    """
+    Hash of everything that shapes a response: prompt text, model and schema.
+
+    Any prompt or schema edit changes the hash, so stale entries are never read.
+
+    Args:
+        prompt: Prompt key ("8k", "10k_going_concern" or "10k_items")
+        model: Model id
+
+    Returns:
+        16-char hex digest
+    """
+    text, schema = _PROMPTS[prompt]
+    payload = text + model + json.dumps(schema, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def extraction_cache_key(prompt: str, model: str, accession_number: str) -> Optional[str]:
+    """Build the cache key for one filing's extraction response (None without an accession)."""
+    if not accession_number:
+        return None
+    return f"extract:{accession_number}:{prompt}:{prompt_version_hash(prompt, model)}"
+
+
+class ExtractionCache:
+    """
+    Redis-backed store of raw JSON extraction responses.
+
+    Errors are logged and treated as misses, so the cache never blocks extraction.
+    """
+
+    def __init__(self):
+        self._client: Optional[aioredis.Redis] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> aioredis.Redis:
+        """Client bound to the running event loop (Celery tasks each run asyncio.run)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = aioredis.from_url(settings.redis_url, decode_responses=True)
+            self._client_loop = loop
+        return self._client
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None."""
+        try:
+            return await self._get_client().get(key)
+        except Exception as e:
+            logger.warning(f"Extraction cache read failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, content: Any) -> None:
+        """Store a raw response under key."""
+        try:
+            await self._get_client().setex(key, CACHE_TTL_SECONDS, content)
+        except Exception as e:
+            logger.warning(f"Extraction cache write failed for {key}: {e}")
+
+
+# Singleton instance
+extraction_cache = ExtractionCache()
@@ -0,0 +1,68 @@
+"""Token budgeting for filing text interpolated into extraction prompts."""
+
+from functools import lru_cache
+from typing import Dict
+
+import tiktoken
+
+from app.prompts.extraction import (
+    EXTRACT_8K_SYSTEM,
+    EXTRACT_8K_USER_TEMPLATE,
+    EXTRACT_10K_GOING_CONCERN_PROMPT,
+    EXTRACT_10K_ITEMS_PROMPT,
+)
+
+# gpt-4o / gpt-4o-mini
+MODEL_CONTEXT_TOKENS = 128_000
+MAX_OUTPUT_TOKENS = 2000  # Matches max_tokens in SignalExtractor._call_with_retry
+SAFETY_TOKENS = 256
+
+_PROMPT_BODIES: Dict[str, str] = {
+    "8k": EXTRACT_8K_SYSTEM + EXTRACT_8K_USER_TEMPLATE,
+    "10k_going_concern": EXTRACT_10K_GOING_CONCERN_PROMPT,
+    "10k_items": EXTRACT_10K_ITEMS_PROMPT,
+}
+
+
+@lru_cache(maxsize=1)
+def get_encoder() -> tiktoken.Encoding:
+    """Load the BPE encoder once per process (initialisation is slow)."""
+    return tiktoken.get_encoding("o200k_base")
+
+
+@lru_cache(maxsize=None)
+def filing_text_budget(prompt: str) -> int:
+    """
+    Tokens left for filing text after a prompt's fixed overhead.
+
+    Args:
+        prompt: Prompt key ("8k", "10k_going_concern" or "10k_items")
+
+    Returns:
+        Maximum number of filing-text tokens
+    """
+    fixed = len(get_encoder().encode(_PROMPT_BODIES[prompt], disallowed_special=()))
+    return MODEL_CONTEXT_TOKENS - fixed - MAX_OUTPUT_TOKENS - SAFETY_TOKENS
+
+
+def fit_filing_text(text: str, budget: int) -> str:
+    """
+    Trim text to at most `budget` tokens.
+
+    Args:
+        text: Filing text
+        budget: Maximum number of tokens
+
+    Returns:
+        The text unchanged if it fits, otherwise its first `budget` tokens
+    """
+    # Every token covers at least one UTF-8 byte, so short texts skip encoding
+    if len(text.encode("utf-8")) <= budget:
+        return text
+
+    encoder = get_encoder()
+    # Filings are untrusted input: treat special-token text as plain text
+    ids = encoder.encode(text, disallowed_special=())
+    if len(ids) <= budget:
+        return text
+    return encoder.decode(ids[:budget])
@@ -1,23 +1,13 @@
 """LLM prompts for signal extraction - full filing approach with marker phrases."""
 
-SIGNAL_TYPES = [
-    "GOING_CONCERN",
-    "BANKRUPTCY_FILING",
-    "CEO_DEPARTURE",
-    "CFO_DEPARTURE",
-    "MASS_LAYOFFS",
-    "DEBT_DEFAULT",
-    "COVENANT_VIOLATION",
-    "AUDITOR_CHANGE",
-    "BOARD_RESIGNATION",
-    "DELISTING_WARNING",
-    "CREDIT_DOWNGRADE",
-    "ASSET_SALE",
-    "RESTRUCTURING",
-    "SEC_INVESTIGATION",
-    "MATERIAL_WEAKNESS",
-    "EQUITY_DILUTION",
-]
+import re
+import string
+from collections import defaultdict
+from typing import Dict, FrozenSet, List
+
+from app.prompts.types import SIGNAL_TYPE_CODES
+
+SIGNAL_TYPES = SIGNAL_TYPE_CODES
 
 # Map 8-K items to signal types for context
 ITEM_SIGNAL_MAP = {
@@ -36,16 +26,126 @@ ITEM_SIGNAL_MAP = {
     "8.01": ["CREDIT_DOWNGRADE", "SEC_INVESTIGATION", "EQUITY_DILUTION"],
 }
 
+# Reverse index (signal type -> 8-K items it may appear under), built once at import
+_signal_items = defaultdict(set)
+for _item, _signal_types in ITEM_SIGNAL_MAP.items():
+    for _signal_type in _signal_types:
+        _signal_items[_signal_type].add(_item)
+
+SIGNAL_TO_ITEMS: Dict[str, FrozenSet[str]] = {
+    signal_type: frozenset(items) for signal_type, items in _signal_items.items()
+}
+VALID_ITEMS: FrozenSet[str] = frozenset(ITEM_SIGNAL_MAP)
+del _signal_items, _item, _signal_types, _signal_type
+
+# Single alternation over all mapped 8-K item numbers, compiled once
+ITEM_PATTERN = re.compile(
+    r"\b(" + "|".join(re.escape(item) for item in ITEM_SIGNAL_MAP) + r")\b"
+)
+
+_SEPARATOR_LINE = re.compile(r"^#+ =+[ \t]*\n", re.MULTILINE)
+_TRAILING_SPACE = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_RUN = re.compile(r"\n{3,}")
+_INNER_SPACES = re.compile(r"(?<=\S) {2,}")
+
+
+def _normalize(prompt: str) -> str:
+    """
+    Strip decoration that costs tokens but carries no meaning for the model.
+
+    Drops "# ====" separator lines, trailing whitespace and blank-line runs,
+    and squashes repeated spaces inside lines (leading indentation is kept).
+    """
+    prompt = _SEPARATOR_LINE.sub("", prompt)
+    prompt = _TRAILING_SPACE.sub("", prompt)
+    prompt = _BLANK_RUN.sub("\n\n", prompt)
+    return _INNER_SPACES.sub(" ", prompt)
+
+
+def compile_prompt(template: str) -> string.Template:
+    """
+    Convert a str.format-style prompt into a string.Template, once at import.
+
+    Rendering a Template only scans for "$" placeholders, instead of parsing
+    every brace pair in a multi-KB body on each call.
+
+    Args:
+        template: Prompt using {name} placeholders and {{ }} escapes
+
+    Returns:
+        Equivalent (normalized) template to render with .substitute(...)
+    """
+    parts = []
+    for literal, field_name, _, _ in string.Formatter().parse(_normalize(template)):
+        parts.append(literal.replace("$", "$$"))
+        if field_name is not None:
+            parts.append("${" + field_name + "}")
+    return string.Template("".join(parts))
+
+
 # =============================================================================
-# 8-K FULL TEXT EXTRACTION PROMPT - WITH MARKER PHRASES
+# SHARED SIGNAL DEFINITIONS
 # =============================================================================
 
-EXTRACT_8K_PROMPT = """You are an expert SEC filing analyst. Extract bankruptcy warning signals from this 8-K filing.
+# One canonical taxonomy for every prompt, so the wording cannot drift and the
+# same text sits in each cacheable prompt prefix. Must stay free of braces:
+# it is concatenated into .format() templates.
+SIGNAL_DEFINITIONS_BLOCK = """Code | Definition
+GOING_CONCERN | "substantial doubt" about continuing operations
+BANKRUPTCY_FILING | actual Ch. 7/11 or receivership filing (Item 1.03)
+CEO_DEPARTURE | current CEO resigns, is terminated, retires or is replaced
+CFO_DEPARTURE | current CFO resigns, is terminated, retires or is replaced
+BOARD_RESIGNATION | director resigns from board
+MASS_LAYOFFS | workforce cut >10% or >100 employees
+DEBT_DEFAULT | missed payment, acceleration, event of default
+COVENANT_VIOLATION | loan covenant breach or waiver
+AUDITOR_CHANGE | change of independent auditor
+DELISTING_WARNING | exchange compliance notice
+CREDIT_DOWNGRADE | rating agency downgrade
+ASSET_SALE | sale of significant assets or segments
+RESTRUCTURING | restructuring plan, debt exchange, supplemental indentures, closures
+SEC_INVESTIGATION | SEC subpoena, enforcement or investigation
+MATERIAL_WEAKNESS | internal control deficiency
+EQUITY_DILUTION | stock issuance, equity offering, ATM program
+Rule: *_DEPARTURE and BOARD_RESIGNATION need an outbound event (not appointments)."""
+
+# Shorter form for validation, where the model only checks a given type
+SIGNAL_DEFINITIONS_COMPACT = """- GOING_CONCERN: Language about substantial doubt, ability to continue operations, may not survive
+- BANKRUPTCY_FILING: ACTUAL Chapter 7/11 filing (past tense "filed", specific date)
+- CEO_DEPARTURE: CEO leaves (resignation, termination, retirement, being replaced)
+- CFO_DEPARTURE: CFO leaves
+- BOARD_RESIGNATION: Director resigns from board
+- MASS_LAYOFFS: Workforce reduction, layoffs, headcount reduction
+- DEBT_DEFAULT: Missed payment, event of default, acceleration, or RISK of default
+- COVENANT_VIOLATION: Breach of covenants, waiver requests, or covenant-related issues
+- AUDITOR_CHANGE: Change of independent auditor
+- DELISTING_WARNING: Exchange compliance notice
+- CREDIT_DOWNGRADE: Rating downgrade
+- ASSET_SALE: Sale of assets or subsidiaries
+- RESTRUCTURING: Debt restructuring, exchange offers, reorganization, cost-cutting
+- SEC_INVESTIGATION: SEC subpoena, enforcement, Wells notice
+- MATERIAL_WEAKNESS: Internal control deficiency
+- EQUITY_DILUTION: Stock issuance, equity offering, ATM program"""
 
-## FILING INFORMATION
-Company: {company_name}
-Filing Date: {filing_date}
-Accession Number: {accession_number}
+# =============================================================================
+# PROMPT VERSIONS
+# =============================================================================
+
+# Bump when a prompt changes. The version is the first line of the prompt, so
+# it also changes the response-cache hash, and extracted signals record it.
+EXTRACT_8K_PROMPT_VERSION = "8k-v2"
+EXTRACT_10K_GOING_CONCERN_PROMPT_VERSION = "10k-going-concern-v2"
+EXTRACT_10K_ITEMS_PROMPT_VERSION = "10k-items-v2"
+
+# =============================================================================
+# 8-K FULL TEXT EXTRACTION PROMPT - WITH MARKER PHRASES
+# =============================================================================
+
+# Static instructions go in the system message and the per-filing values in the
+# user message, so every call shares an identical prefix that the provider's
+# prompt cache can reuse. EXTRACT_8K_SYSTEM is sent as-is (never formatted).
+EXTRACT_8K_SYSTEM = "## PROMPT_VERSION: " + EXTRACT_8K_PROMPT_VERSION + """
+You are an expert SEC filing analyst. Extract bankruptcy warning signals from 8-K filings with VERBATIM marker phrases. Return valid JSON only.
 
 ## 8-K ITEM REFERENCE
 8-K filings are organized by Item numbers. Key items for distress signals:
@@ -59,23 +159,11 @@ Accession Number: {accession_number}
 - Item 5.02: Director/Officer departures
 - Item 7.01/8.01: Other material events (credit downgrades, SEC investigations)
 
-## SIGNAL TYPES TO EXTRACT
-
-1. BANKRUPTCY_FILING - Company files for Chapter 7, Chapter 11 bankruptcy, or receivership (Item 1.03)
-2. CEO_DEPARTURE - Current CEO leaving role: resigns, is terminated, steps down, retirement, OR is being replaced/succeeded by new CEO. Key trigger: existing CEO will no longer be CEO.
-3. CFO_DEPARTURE - Current CFO leaving role: resigns, is terminated, steps down, retirement, OR is being replaced/succeeded by new CFO.
-4. BOARD_RESIGNATION - Director resigns from board (NOT appointments)
-5. MASS_LAYOFFS - Workforce reduction >10% or >100 employees
-6. DEBT_DEFAULT - Missed payments, acceleration, events of default
-7. COVENANT_VIOLATION - Loan covenant breach or waiver
-8. AUDITOR_CHANGE - Change in independent auditor
-9. DELISTING_WARNING - Exchange compliance notice
-10. CREDIT_DOWNGRADE - Rating agency downgrade
-11. ASSET_SALE - Sale of significant assets
-12. RESTRUCTURING - Formal restructuring plan, debt exchange, supplemental indentures
-13. SEC_INVESTIGATION - SEC subpoena or enforcement
-14. MATERIAL_WEAKNESS - Internal control deficiency
-15. EQUITY_DILUTION - Stock issuance, equity offering, ATM program
+## SIGNAL TYPES
+
+Valid types are enumerated in the schema; use exactly those codes.
+
+""" + SIGNAL_DEFINITIONS_BLOCK + """
 
 ## CRITICAL DISTINCTION - BANKRUPTCY_FILING vs GOING_CONCERN
 
@@ -103,23 +191,9 @@ it is NOT a BANKRUPTCY_FILING. Do not extract it as such.
 5. Extract the EVENT DATE if mentioned (often different from filing date)
 6. If NO signals found, return empty array
 
-## RESPONSE FORMAT (JSON)
-
-{{
-  "signals": [
-    {{
-      "type": "SIGNAL_TYPE",
-      "item_number": "5.02",
-      "severity": 1-10,
-      "confidence": 0.0-1.0,
-      "marker_phrase": "EXACT 10-25 word phrase copied verbatim from filing that identifies this signal",
-      "summary": "1-2 sentence plain English explanation of what happened and why it matters",
-      "key_facts": ["fact 1", "fact 2", "fact 3"],
-      "event_date": "YYYY-MM-DD or null if not specified",
-      "person": "Name and Title if applicable, or null"
-    }}
-  ]
-}}
+## RESPONSE FORMAT
+
+Return JSON matching the attached schema.
 
 ## FIELD GUIDELINES
 
@@ -133,23 +207,23 @@ it is NOT a BANKRUPTCY_FILING. Do not extract it as such.
 - "CEO John Smith resigned effective January 15, 2025"
 - "Material weakness in revenue recognition controls"
 
-## MARKER PHRASE EXAMPLES
-
-GOOD markers (verbatim, unique, 10-25 words):
-- "John Smith notified the Board of Directors of his resignation as Chief Executive Officer effective January 15"
-- "the Company entered into supplemental indentures to the applicable Indentures with respect to each series"
-- "announced a workforce reduction affecting approximately 2,500 employees, representing 12% of its global workforce"
+## MARKER PHRASE EXAMPLE
 
-BAD markers (paraphrased, too short, or generic):
-- "CEO resigned" (too short, not verbatim)
-- "The company restructured its debt" (paraphrased)
-- "pursuant to the terms of the agreement" (too generic, appears everywhere)
+Good (verbatim, 10-25 words): "John Smith notified the Board of Directors of his resignation as Chief Executive Officer effective January 15"
+Bad (paraphrased, too short): "CEO resigned"
 
 Severity scale:
 - 1-3: Minor/routine
 - 4-6: Moderate concern
 - 7-8: Significant risk
 - 9-10: Critical/immediate bankruptcy risk
+"""
+EXTRACT_8K_SYSTEM = _normalize(EXTRACT_8K_SYSTEM)
+
+EXTRACT_8K_USER_TEMPLATE = """## FILING INFORMATION
+Company: {company_name}
+Filing Date: {filing_date}
+Accession Number: {accession_number}
 
 ## 8-K FILING TEXT
 
@@ -157,14 +231,57 @@ Severity scale:
 
 ## END OF FILING
 
-Extract all bankruptcy warning signals with VERBATIM marker phrases. Return {{"signals": []}} if none found.
+Extract all bankruptcy warning signals with VERBATIM marker phrases. Return an empty signals list if none found.
 """
 
+EXTRACT_8K_USER = compile_prompt(EXTRACT_8K_USER_TEMPLATE)
+
+# Single-template form of the 8-K prompt, kept for callers that still use .format()
+EXTRACT_8K_PROMPT = (
+    EXTRACT_8K_SYSTEM.replace("{", "{{").replace("}", "}}")
+    + "\n"
+    + EXTRACT_8K_USER_TEMPLATE
+)
+
+
+def build_8k_messages(
+    company_name: str,
+    filing_date: str,
+    accession_number: str,
+    filing_text: str,
+) -> List[Dict[str, str]]:
+    """
+    Build chat messages for 8-K extraction with the static prompt first.
+
+    Args:
+        company_name: Company name
+        filing_date: Filing date
+        accession_number: SEC accession number
+        filing_text: Cleaned filing text
+
+    Returns:
+        System + user messages for the chat completions API
+    """
+    # Deliberately not memoized: retries reuse the built messages, repeated
+    # filings are served by the response cache (prompts/_cache.py), and caching
+    # rendered ~50 KB prompts would cost far more memory than it saves in time
+    return [
+        {"role": "system", "content": EXTRACT_8K_SYSTEM},
+        {"role": "user", "content": EXTRACT_8K_USER.substitute(
+            company_name=company_name,
+            filing_date=filing_date,
+            accession_number=accession_number,
+            filing_text=filing_text,
+        )},
+    ]
+
+
 # =============================================================================
 # 10-K GOING CONCERN EXTRACTION PROMPT - WITH MARKER PHRASES
 # =============================================================================
 
-EXTRACT_10K_GOING_CONCERN_PROMPT = """You are an expert SEC filing analyst. Analyze this excerpt from a 10-K filing to determine if there is a GOING CONCERN warning.
+EXTRACT_10K_GOING_CONCERN_PROMPT = "## PROMPT_VERSION: " + EXTRACT_10K_GOING_CONCERN_PROMPT_VERSION + """
+You are an expert SEC filing analyst. Analyze this excerpt from a 10-K filing to determine if there is a GOING CONCERN warning.
 
 ## FILING INFORMATION
 Company: {company_name}
@@ -193,19 +310,9 @@ NEGATIVE (NOT a going concern signal - do not extract):
 - "The going concern issue has been resolved"
 - Simply mentioning "going concern" in accounting policy context without expressing doubt
 
-## RESPONSE FORMAT (JSON)
+## RESPONSE FORMAT
 
-{{
-  "has_going_concern": true/false,
-  "signal": {{
-    "type": "GOING_CONCERN",
-    "severity": 9,
-    "confidence": 0.0-1.0,
-    "marker_phrase": "EXACT 10-25 word phrase copied verbatim containing going concern language",
-    "event_date": "{filing_date}",
-    "source": "Auditor Report" or "MD&A" or "Notes to Financial Statements"
-  }} or null if no going concern
-}}
+Return JSON matching the attached schema. Use severity 9 and the filing date ({filing_date}) as event_date; set signal to null if there is no going concern.
 
 ## 10-K EXCERPT
 
@@ -216,12 +323,15 @@ NEGATIVE (NOT a going concern signal - do not extract):
 Analyze carefully. If going concern warning exists, provide a VERBATIM marker phrase.
 """
 
+EXTRACT_10K_GOING_CONCERN_TEMPLATE = compile_prompt(EXTRACT_10K_GOING_CONCERN_PROMPT)
+
 
 # =============================================================================
 # 10-K ITEM-BASED EXTRACTION PROMPT - FOR STRUCTURED ITEMS
 # =============================================================================
 
-EXTRACT_10K_ITEMS_PROMPT = """You are an expert SEC filing analyst. Extract bankruptcy warning signals from these 10-K sections.
+EXTRACT_10K_ITEMS_PROMPT = "## PROMPT_VERSION: " + EXTRACT_10K_ITEMS_PROMPT_VERSION + """
+You are an expert SEC filing analyst. Extract bankruptcy warning signals from these 10-K sections.
 
 ## FILING INFORMATION
 Company: {company_name}
@@ -234,18 +344,11 @@ You are analyzing extracted sections from a 10-K annual report:
 - Item 8 (Financial Statements): Contains auditor report with going concern opinions
 - Item 9A (Controls): Discloses material weaknesses in internal controls
 
-## SIGNAL TYPES TO EXTRACT
+## SIGNAL TYPES
+
+Valid types are enumerated in the schema; use exactly those codes.
 
-1. GOING_CONCERN - Auditor or management expresses "substantial doubt about ability to continue as a going concern"
-2. MATERIAL_WEAKNESS - "Material weakness in internal control over financial reporting" disclosed in Item 9A
-3. RESTRUCTURING - Formal restructuring plans, workforce reductions, facility closures mentioned in MD&A
-4. MASS_LAYOFFS - Workforce reduction >10% or >100 employees
-5. DEBT_DEFAULT - Missed payments, acceleration events, events of default
-6. COVENANT_VIOLATION - Loan covenant breach or waiver requests
-7. AUDITOR_CHANGE - Change in independent auditor
-8. CREDIT_DOWNGRADE - Rating agency downgrade mentioned
-9. ASSET_SALE - Sale of significant assets or business segments
-10. SEC_INVESTIGATION - SEC subpoena, enforcement action, or investigation disclosed
+""" + SIGNAL_DEFINITIONS_BLOCK + """
 
 ## CRITICAL INSTRUCTIONS
 
@@ -255,22 +358,9 @@ You are analyzing extracted sections from a 10-K annual report:
 4. If NO signals found, return empty array
 5. Be thorough - check ALL provided sections
 
-## RESPONSE FORMAT (JSON)
-
-{{
-  "signals": [
-    {{
-      "type": "SIGNAL_TYPE",
-      "item_number": "Item 9A" or "Item 7" or "Item 8",
-      "severity": 1-10,
-      "confidence": 0.0-1.0,
-      "marker_phrase": "EXACT 10-25 word phrase copied verbatim from filing",
-      "summary": "1-2 sentence plain English explanation of what happened and why it matters",
-      "key_facts": ["fact 1", "fact 2", "fact 3"],
-      "event_date": "YYYY-MM-DD or null"
-    }}
-  ]
-}}
+## RESPONSE FORMAT
+
+Return JSON matching the attached schema.
 
 ## FIELD GUIDELINES
 
@@ -296,8 +386,10 @@ Severity scale:
 
 ## END OF SECTIONS
 
-Extract all signals with VERBATIM marker phrases. Return {{"signals": []}} if none found.
+Extract all signals with VERBATIM marker phrases. Return an empty signals list if none found.
 """
 
+EXTRACT_10K_ITEMS_TEMPLATE = compile_prompt(EXTRACT_10K_ITEMS_PROMPT)
+
 # Keep old prompt name for backward compatibility
 SIGNAL_EXTRACTION_PROMPT = EXTRACT_8K_PROMPT
@@ -0,0 +1,141 @@
+"""JSON schemas for structured LLM output (OpenAI response_format=json_schema)."""
+
+from typing import Any, Dict
+
+from app.prompts.types import SIGNAL_TYPE_CODES
+
+# Strict mode requires every property to be listed in "required" and
+# additionalProperties=false on every object; optional values are nullable.
+
+_NULLABLE_STRING = {"type": ["string", "null"]}
+
+_EXTRACTED_SIGNAL = {
+    "type": "object",
+    "properties": {
+        "type": {"type": "string", "enum": SIGNAL_TYPE_CODES},
+        "item_number": {
+            "type": "string",
+            "description": "Item where the signal appears, e.g. \"5.02\" or \"Item 9A\"",
+        },
+        "severity": {"type": "integer", "description": "1-10"},
+        "confidence": {"type": "number", "description": "0.0-1.0"},
+        "marker_phrase": {
+            "type": "string",
+            "description": "EXACT 10-25 word phrase copied verbatim from the filing that identifies this signal",
+        },
+        "summary": {
+            "type": "string",
+            "description": "1-2 sentence plain English explanation of what happened and why it matters",
+        },
+        "key_facts": {"type": "array", "items": {"type": "string"}},
+        "event_date": {**_NULLABLE_STRING, "description": "YYYY-MM-DD, or null if not specified"},
+        "person": {**_NULLABLE_STRING, "description": "Name and title if applicable"},
+    },
+    "required": [
+        "type", "item_number", "severity", "confidence", "marker_phrase",
+        "summary", "key_facts", "event_date", "person",
+    ],
+    "additionalProperties": False,
+}
+
+SIGNAL_EXTRACTION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "signals": {"type": "array", "items": _EXTRACTED_SIGNAL},
+    },
+    "required": ["signals"],
+    "additionalProperties": False,
+}
+
+GOING_CONCERN_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "has_going_concern": {"type": "boolean"},
+        "signal": {
+            "anyOf": [
+                {
+                    "type": "object",
+                    "properties": {
+                        "type": {"type": "string", "enum": ["GOING_CONCERN"]},
+                        "severity": {"type": "integer", "description": "1-10"},
+                        "confidence": {"type": "number", "description": "0.0-1.0"},
+                        "marker_phrase": {
+                            "type": "string",
+                            "description": "EXACT 10-25 word phrase copied verbatim containing going concern language",
+                        },
+                        "event_date": {**_NULLABLE_STRING, "description": "YYYY-MM-DD"},
+                        "source": {
+                            "type": "string",
+                            "enum": ["Auditor Report", "MD&A", "Notes to Financial Statements"],
+                        },
+                    },
+                    "required": [
+                        "type", "severity", "confidence", "marker_phrase",
+                        "event_date", "source",
+                    ],
+                    "additionalProperties": False,
+                },
+                {"type": "null"},
+            ],
+        },
+    },
+    "required": ["has_going_concern", "signal"],
+    "additionalProperties": False,
+}
+
+_VALIDATION_VERDICT = {
+    "type": "object",
+    "properties": {
+        "index": {"type": "integer", "description": "The \"i\" of the signal this verdict is for"},
+        "is_valid": {"type": "boolean"},
+        "corrected_type": {
+            "type": ["string", "null"],
+            "enum": SIGNAL_TYPE_CODES + [None],
+            "description": "Correct type if misclassified, otherwise null",
+        },
+        "corrected_severity": {
+            "type": ["integer", "null"],
+            "description": "1-10 if the severity needs adjustment, otherwise null",
+        },
+        "rejection_reason": {
+            **_NULLABLE_STRING,
+            "description": "Brief reason if is_valid is false, otherwise null",
+        },
+        "confidence": {"type": "number", "description": "0.0-1.0"},
+    },
+    "required": [
+        "index", "is_valid", "corrected_type", "corrected_severity",
+        "rejection_reason", "confidence",
+    ],
+    "additionalProperties": False,
+}
+
+VALIDATION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "validations": {"type": "array", "items": _VALIDATION_VERDICT},
+    },
+    "required": ["validations"],
+    "additionalProperties": False,
+}
+
+def json_schema_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wrap a schema as an OpenAI strict structured-output response_format.
+
+    Args:
+        name: Schema name reported to the API
+        schema: JSON schema for the response object
+
+    Returns:
+        Value for the response_format parameter
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": schema, "strict": True},
+    }
+
+
+SIGNAL_EXTRACTION_FORMAT = json_schema_format("signals", SIGNAL_EXTRACTION_SCHEMA)
+GOING_CONCERN_FORMAT = json_schema_format("going_concern", GOING_CONCERN_SCHEMA)
+VALIDATION_FORMAT = json_schema_format("validation", VALIDATION_SCHEMA)
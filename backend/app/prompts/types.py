@@ -0,0 +1,25 @@
+"""Signal type vocabulary shared by prompts, schemas and validation."""
+
+from typing import List, Literal, get_args
+
+# Single source of truth for the signal codes the LLM may emit
+SignalType = Literal[
+    "GOING_CONCERN",
+    "BANKRUPTCY_FILING",
+    "CEO_DEPARTURE",
+    "CFO_DEPARTURE",
+    "MASS_LAYOFFS",
+    "DEBT_DEFAULT",
+    "COVENANT_VIOLATION",
+    "AUDITOR_CHANGE",
+    "BOARD_RESIGNATION",
+    "DELISTING_WARNING",
+    "CREDIT_DOWNGRADE",
+    "ASSET_SALE",
+    "RESTRUCTURING",
+    "SEC_INVESTIGATION",
+    "MATERIAL_WEAKNESS",
+    "EQUITY_DILUTION",
+]
+
+SIGNAL_TYPE_CODES: List[str] = list(get_args(SignalType))
@@ -1,62 +1,34 @@
 """LLM prompts for signal validation."""
 
+from app.prompts.extraction import SIGNAL_DEFINITIONS_COMPACT, compile_prompt
+from app.prompts.types import SIGNAL_TYPE_CODES
+
 # Signal types for reference
-VALID_SIGNAL_TYPES = [
-    "GOING_CONCERN",
-    "BANKRUPTCY_FILING",
-    "CEO_DEPARTURE",
-    "CFO_DEPARTURE",
-    "MASS_LAYOFFS",
-    "DEBT_DEFAULT",
-    "COVENANT_VIOLATION",
-    "AUDITOR_CHANGE",
-    "BOARD_RESIGNATION",
-    "DELISTING_WARNING",
-    "CREDIT_DOWNGRADE",
-    "ASSET_SALE",
-    "RESTRUCTURING",
-    "SEC_INVESTIGATION",
-    "MATERIAL_WEAKNESS",
-    "EQUITY_DILUTION",
-]
+VALID_SIGNAL_TYPES = SIGNAL_TYPE_CODES
 
 # =============================================================================
 # LLM VALIDATION PROMPT
 # =============================================================================
 
-LLM_VALIDATION_PROMPT = """You are an SEC filing analyst validating signal classification.
+# Bump when the prompt changes (first prompt line, recorded on validated signals)
+VALIDATION_PROMPT_VERSION = "validation-v2"
 
-## SIGNAL TO VALIDATE
+# Upper bound on signals per validation call, keeps the verdict array well
+# inside the response token limit
+MAX_VALIDATION_BATCH = 20
 
-Type: {signal_type}
-Evidence: "{evidence}"
-Severity: {severity}/10
-Filing Type: {filing_type}
-Filing Date: {filing_date}
-Person: {person}
+# Everything except {signals_json} (definitions table, rules, examples) is
+# assembled here once at import; a validation call only substitutes the batch.
+LLM_VALIDATION_PROMPT = "## PROMPT_VERSION: " + VALIDATION_PROMPT_VERSION + """
+You are an SEC filing analyst validating signal classification.
 
 ## SIGNAL TYPE DEFINITIONS
 
-- GOING_CONCERN: Language about substantial doubt, ability to continue operations, may not survive
-- BANKRUPTCY_FILING: ACTUAL Chapter 7/11 filing (past tense "filed", specific date)
-- CEO_DEPARTURE: CEO leaves (resignation, termination, retirement, being replaced)
-- CFO_DEPARTURE: CFO leaves
-- BOARD_RESIGNATION: Director resigns from board
-- MASS_LAYOFFS: Workforce reduction, layoffs, headcount reduction
-- DEBT_DEFAULT: Missed payment, event of default, acceleration, or RISK of default
-- COVENANT_VIOLATION: Breach of covenants, waiver requests, or covenant-related issues
-- AUDITOR_CHANGE: Change of independent auditor
-- DELISTING_WARNING: Exchange compliance notice
-- CREDIT_DOWNGRADE: Rating downgrade
-- ASSET_SALE: Sale of assets or subsidiaries
-- RESTRUCTURING: Debt restructuring, exchange offers, reorganization, cost-cutting
-- SEC_INVESTIGATION: SEC subpoena, enforcement, Wells notice
-- MATERIAL_WEAKNESS: Internal control deficiency
-- EQUITY_DILUTION: Stock issuance, equity offering, ATM program
+""" + SIGNAL_DEFINITIONS_COMPACT + """
 
 ## TASK: VERIFY CLASSIFICATION ONLY
 
-Your ONLY job is to check if the signal TYPE matches the evidence.
+Your ONLY job is to check if each signal's TYPE matches its evidence.
 - Does the evidence describe this type of event?
 - If misclassified, suggest the correct type
 
@@ -70,32 +42,21 @@ ONLY reject if:
 - Evidence is about an appointment when type says departure
 - BANKRUPTCY_FILING with only conditional language (reclassify to GOING_CONCERN)
 
-## RESPONSE FORMAT (JSON)
+## RESPONSE FORMAT
 
-{{
-  "is_valid": true or false,
-  "corrected_type": "SIGNAL_TYPE" if misclassified, otherwise null,
-  "corrected_severity": 1-10 if needs adjustment, otherwise null,
-  "rejection_reason": "brief reason" if is_valid is false, otherwise null,
-  "confidence": 0.0-1.0
-}}
+Return JSON matching the attached schema: one verdict per signal, with "index" set to the signal's "i", in the same order as the input.
 
-## EXAMPLES
+## EXAMPLES (JSONL, "in" = signal, "out" = verdict)
 
-Example 1 - Valid (conditional language is OK):
-Type: DEBT_DEFAULT
-Evidence: "if we fail to raise capital, we may be unable to meet debt obligations"
-Response: {{"is_valid": true, "corrected_type": null, "corrected_severity": null, "rejection_reason": null, "confidence": 0.85}}
+{{"in": {{"type": "DEBT_DEFAULT", "evidence": "if we fail to raise capital, we may be unable to meet debt obligations"}}, "out": {{"is_valid": true, "corrected_type": null, "confidence": 0.85}}}}
+{{"in": {{"type": "CEO_DEPARTURE", "evidence": "John Smith was appointed as Chief Executive Officer"}}, "out": {{"is_valid": false, "rejection_reason": "Appointment, not departure", "confidence": 0.95}}}}
+{{"in": {{"type": "BANKRUPTCY_FILING", "evidence": "may be forced to file for bankruptcy protection"}}, "out": {{"is_valid": true, "corrected_type": "GOING_CONCERN", "confidence": 0.9}}}}
 
-Example 2 - Misclassified (appointment, not departure):
-Type: CEO_DEPARTURE
-Evidence: "John Smith was appointed as Chief Executive Officer"
-Response: {{"is_valid": false, "corrected_type": null, "corrected_severity": null, "rejection_reason": "Appointment, not departure", "confidence": 0.95}}
+## SIGNALS TO VALIDATE
 
-Example 3 - Reclassify (not actual bankruptcy):
-Type: BANKRUPTCY_FILING
-Evidence: "may be forced to file for bankruptcy protection"
-Response: {{"is_valid": true, "corrected_type": "GOING_CONCERN", "corrected_severity": null, "rejection_reason": null, "confidence": 0.9}}
+{signals_json}
 
-Validate the signal above.
+Validate each signal in the JSON array above; return an array of verdicts in the same order.
 """
+
+LLM_VALIDATION_TEMPLATE = compile_prompt(LLM_VALIDATION_PROMPT)
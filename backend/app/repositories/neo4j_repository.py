@@ -1,173 +1,685 @@
 """Neo4j Repository - Facts-only queries, no scoring."""
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import functools
+import sys
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from datetime import date
+from typing import List, Optional, Dict, Any, Tuple
+from neo4j import AsyncSession
+from neo4j.exceptions import ClientError, ServiceUnavailable, SessionExpired
 from app.services.neo4j_service import neo4j_service
 from app.models.timeline_models import (
     CompanyNode, SignalNode, FilingNode,
     CompanyTimeline, CompanyInfo, SignalDetail, FilingDetail, FilingInfo,
-    SimilarCase, GoingConcernHistory, GoingConcernYear
+    SimilarCase, GoingConcernHistory, GoingConcernYear, SIGNAL_TYPE_BITS, SignalTypeCode
 )
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Filings dated within this many months carry the :RecentFiling label
+# (set on write, expired by refresh_recent_filings)
+RECENT_FILING_MONTHS = 12
+
+# How long a similar-cases mask snapshot is reused. Syncs in this process clear
+# it; syncs in the Celery worker become visible after at most this long.
+MASK_SNAPSHOT_TTL_SECONDS = 60
+
+# NEXT links committed per inner transaction by the APOC chain rebuild
+CHAIN_BATCH_SIZE = 1000
+
+# Timeline: company + its signals (each with source filing and gap to the next signal)
+_Q_COMPANY_AND_SIGNALS = """
+MATCH (c:Company {ticker: $ticker})
+
+// Signals are ordered and collected per company inside the subquery, so the
+// outer query carries one row and no DISTINCT over wide joined rows is needed
+CALL {
+    WITH c
+    MATCH (c)-[:HAS_SIGNAL]->(s:Signal)
+    OPTIONAL MATCH (s)-[:EXTRACTED_FROM]->(sf:Filing)
+    OPTIONAL MATCH (s)-[nx:NEXT]->(:Signal)
+    WITH s, sf, nx
+    ORDER BY s.date
+    RETURN collect({
+        id: s.id,
+        type: s.type,
+        date: toString(s.date),
+        evidence: s.evidence,
+        fiscal_year: s.fiscal_year,
+        days_to_next: nx.days,
+        filing: {
+            type: sf.type,
+            item: sf.item,
+            date: toString(sf.date),
+            url: sf.url,
+            accession: sf.accession
+        }
+    }) as signals
+}
+
+RETURN {
+    ticker: c.ticker,
+    name: c.name,
+    cik: c.cik,
+    status: c.status,
+    bankruptcy_date: toString(c.bankruptcy_date),
+    first_signal_date: toString(c.first_signal_date),
+    last_signal_date: toString(c.last_signal_date),
+    days_since_last_signal: c.days_since_last_signal,
+    total_signals: c.total_signals,
+    going_concern_status: c.going_concern_status,
+    going_concern_first_seen: toString(c.going_concern_first_seen),
+    going_concern_last_seen: toString(c.going_concern_last_seen)
+} as company,
+signals
+"""
+
+# Timeline: filings from the last 12 months, newest first. The label narrows
+# the match to recent filings; the date filter covers labels not yet expired.
+_Q_RECENT_FILINGS = """
+MATCH (c:Company {ticker: $ticker})-[:FILED]->(rf:RecentFiling)
+WHERE rf.date >= date() - duration('P12M')
+
+WITH rf
+ORDER BY rf.date DESC
+
+RETURN collect(DISTINCT {
+    accession: rf.accession,
+    type: rf.type,
+    item: rf.item,
+    date: toString(rf.date),
+    url: rf.url,
+    category: rf.category,
+    summary: rf.summary
+}) as recent_filings
+"""
+
+
+@functools.lru_cache(maxsize=2)
+def _recent_filings_query(recent_only: bool) -> str:
+    """
+    Cypher for get_recent_filings, built once per shape.
+
+    months/category are parameters, so the only structural choice is whether
+    the window fits inside RECENT_FILING_MONTHS and can match :RecentFiling
+    alone. Returning the same string object lets the driver and server query
+    caches hit without rebuilding the text.
+    """
+    label = "RecentFiling" if recent_only else "Filing"
+    return f"""
+        MATCH (c:Company {{ticker: $ticker}})-[:FILED]->(f:{label})
+        WHERE f.date >= date() - duration({{months: $months}})
+          AND ($category IS NULL OR f.category = $category)
+        RETURN f.accession as accession,
+               f.type as type,
+               f.item as item,
+               toString(f.date) as date,
+               f.url as url,
+               f.category as category,
+               f.summary as summary
+        ORDER BY f.date DESC
+        """
+
+
+# Company node, facts only (dates arrive as ISO strings or None)
+_Q_UPSERT_COMPANY = """
+MERGE (c:Company {ticker: $ticker})
+SET c.name = $name,
+    c.cik = $cik,
+    c.status = $status,
+    c.bankruptcy_date = CASE WHEN $bankruptcy_date IS NOT NULL
+        THEN date($bankruptcy_date) ELSE null END,
+    c.going_concern_status = $going_concern_status,
+    c.going_concern_first_seen = CASE WHEN $going_concern_first_seen IS NOT NULL
+        THEN date($going_concern_first_seen) ELSE null END,
+    c.going_concern_last_seen = CASE WHEN $going_concern_last_seen IS NOT NULL
+        THEN date($going_concern_last_seen) ELSE null END,
+    c.updated_at = datetime()
+RETURN c
+"""
+
+# Signal date range, count, recency and type mask on the company
+_Q_UPDATE_SIGNAL_STATS = """
+MATCH (c:Company {ticker: $ticker})
+OPTIONAL MATCH (c)-[:HAS_SIGNAL]->(s:Signal)
+WITH c,
+     min(s.date) as first_signal,
+     max(s.date) as last_signal,
+     count(s) as signal_count,
+     collect(DISTINCT s.type) as signal_types
+SET c.first_signal_date = first_signal,
+    c.last_signal_date = last_signal,
+    c.total_signals = signal_count,
+    c.days_since_last_signal = CASE
+        WHEN last_signal IS NOT NULL
+        THEN duration.inDays(last_signal, date()).days
+        ELSE null
+    END,
+    c.signal_type_mask = reduce(
+        mask = 0, t IN signal_types | mask + coalesce($type_bits[t], 0)
+    )
+RETURN c
+"""
+
+# One signal with its source filing
+_Q_CREATE_SIGNAL = """
+MATCH (c:Company {ticker: $ticker})
+
+MERGE (f:Filing {accession: $accession})
+SET f.type = $filing_type,
+    f.item = $item,
+    f.date = CASE WHEN $filing_date IS NOT NULL AND $filing_date <> ''
+        THEN date($filing_date) ELSE null END,
+    f.url = $url,
+    f.fiscal_year = $fiscal_year,
+    f.category = $category,
+    f.summary = $summary,
+    f.has_going_concern = $has_going_concern,
+    f.has_material_weakness = $has_material_weakness
+FOREACH (_ IN CASE WHEN f.date >= date() - duration({months: $recent_months})
+        THEN [1] ELSE [] END | SET f:RecentFiling)
+
+MERGE (s:Signal {id: $signal_id})
+SET s.type = $signal_type,
+    s.type_code = $type_code,
+    s.date = CASE WHEN $signal_date IS NOT NULL AND $signal_date <> ''
+        THEN date($signal_date) ELSE null END,
+    s.evidence = $evidence,
+    s.fiscal_year = $signal_fiscal_year,
+    s.created_at = datetime()
+
+MERGE (c)-[:HAS_SIGNAL]->(s)
+MERGE (s)-[:EXTRACTED_FROM]->(f)
+MERGE (c)-[:FILED]->(f)
+
+RETURN s.id as signal_id
+"""
+
+# Signals with their source filings, one row per (signal, filing) pair
+_Q_CREATE_SIGNALS_BATCH = """
+MATCH (c:Company {ticker: $ticker})
+UNWIND $rows AS row
+
+MERGE (f:Filing {accession: row.accession})
+SET f.type = row.filing_type,
+    f.item = row.item,
+    f.date = CASE WHEN row.filing_date IS NOT NULL AND row.filing_date <> ''
+        THEN date(row.filing_date) ELSE null END,
+    f.url = row.url,
+    f.fiscal_year = row.fiscal_year,
+    f.category = row.category,
+    f.summary = row.summary,
+    f.has_going_concern = row.has_going_concern,
+    f.has_material_weakness = row.has_material_weakness
+FOREACH (_ IN CASE WHEN f.date >= date() - duration({months: $recent_months})
+        THEN [1] ELSE [] END | SET f:RecentFiling)
+
+MERGE (s:Signal {id: row.signal_id})
+SET s.type = row.signal_type,
+    s.type_code = row.type_code,
+    s.date = CASE WHEN row.signal_date IS NOT NULL AND row.signal_date <> ''
+        THEN date(row.signal_date) ELSE null END,
+    s.evidence = row.evidence,
+    s.fiscal_year = row.signal_fiscal_year,
+    s.created_at = datetime()
+
+MERGE (c)-[:HAS_SIGNAL]->(s)
+MERGE (s)-[:EXTRACTED_FROM]->(f)
+MERGE (c)-[:FILED]->(f)
+
+RETURN count(s) as signals_created
+"""
+
+# Splice signals into the NEXT chain between their chronological neighbours
+_Q_LINK_SIGNALS = """
+MATCH (c:Company {ticker: $ticker})
+UNWIND $signal_ids as sid
+MATCH (c)-[:HAS_SIGNAL]->(s:Signal {id: sid})
+WHERE s.date IS NOT NULL
+
+OPTIONAL MATCH (c)-[:HAS_SIGNAL]->(p:Signal)
+WHERE p.date < s.date OR (p.date = s.date AND p.id < s.id)
+WITH c, s, p ORDER BY p.date DESC, p.id DESC
+WITH c, s, head(collect(p)) as pred
+
+OPTIONAL MATCH (c)-[:HAS_SIGNAL]->(n:Signal)
+WHERE n.date > s.date OR (n.date = s.date AND n.id > s.id)
+WITH s, pred, n ORDER BY n.date, n.id
+WITH s, pred, head(collect(n)) as succ
+
+// A chain node has one outgoing NEXT: drop any that now skip over a neighbour
+OPTIONAL MATCH (pred)-[stale_rel:NEXT]->(x) WHERE x <> s
+WITH s, pred, succ, collect(stale_rel) as stale_pred
+OPTIONAL MATCH (s)-[stale_rel:NEXT]->(y) WHERE succ IS NULL OR y <> succ
+WITH s, pred, succ, stale_pred + collect(stale_rel) as stale
+FOREACH (r IN stale | DELETE r)
+
+FOREACH (_ IN CASE WHEN pred IS NULL THEN [] ELSE [1] END |
+    MERGE (pred)-[r:NEXT]->(s)
+    SET r.days = duration.inDays(pred.date, s.date).days
+)
+FOREACH (_ IN CASE WHEN succ IS NULL THEN [] ELSE [1] END |
+    MERGE (s)-[r:NEXT]->(succ)
+    SET r.days = duration.inDays(s.date, succ.date).days
+)
+
+RETURN count(s) as signals_linked
+"""
+
+# Full chain rebuild, committed in CHAIN_BATCH_SIZE batches by APOC
+_Q_BUILD_CHAIN_APOC = """
+CALL apoc.periodic.iterate(
+    "MATCH (c:Company {ticker: $ticker})-[:HAS_SIGNAL]->(s:Signal)
+     WHERE s.date IS NOT NULL
+     WITH s ORDER BY s.date, s.id
+     WITH collect(s) as signals
+     UNWIND range(0, size(signals)-2) as i
+     RETURN signals[i] as s1, signals[i+1] as s2",
+    "MERGE (s1)-[r:NEXT]->(s2)
+     SET r.days = duration.inDays(s1.date, s2.date).days",
+    {batchSize: $batch_size, parallel: false, params: {ticker: $ticker}}
+)
+YIELD committedOperations, failedOperations, errorMessages
+RETURN committedOperations, failedOperations, errorMessages
+"""
+
+# Full chain rebuild in one transaction (no APOC)
+_Q_BUILD_CHAIN = """
+MATCH (c:Company {ticker: $ticker})-[:HAS_SIGNAL]->(s:Signal)
+WHERE s.date IS NOT NULL
+WITH s ORDER BY s.date, s.id
+WITH collect(s) as signals
+UNWIND range(0, size(signals)-2) as i
+WITH signals[i] as s1, signals[i+1] as s2
+MERGE (s1)-[r:NEXT]->(s2)
+SET r.days = duration.inDays(s1.date, s2.date).days
+RETURN count(r) as relationships_created
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _types_in_mask(mask: int) -> Tuple[str, ...]:
+    """Signal type names whose bits are set in a signal_type_mask, in code order."""
+    return tuple(code.name for code in SignalTypeCode if mask >> code & 1)
+
+
+def _type_code(signal_type: str) -> Optional[int]:
+    """SignalTypeCode value for a signal type name, None for unknown types."""
+    code = SignalTypeCode.__members__.get(signal_type)
+    return int(code) if code is not None else None
+
+
+def _cypher_date(value: Any) -> Optional[str]:
+    """
+    YYYY-MM-DD for Cypher's date(), or None when the value isn't an ISO date.
+
+    Inside sync_all one date() failure would roll back the whole company sync,
+    so unparseable dates are stored as null (the signal itself is kept).
+    """
+    if not value:
+        return None
+    day = str(value)[:10]
+    try:
+        date.fromisoformat(day)
+    except ValueError:
+        logger.warning(f"Ignoring unparseable date {value!r}")
+        return None
+    return day
+
+
+def neo4j_guard(default: Any):
+    """
+    Log and swallow errors from a repository call, returning a fallback instead.
+
+    Inside a caller's transaction (session= anything but an AsyncSession, e.g.
+    the managed transaction execute_write passes) errors propagate instead, so
+    the transaction rolls back (and execute_write can retry it) as a whole.
+
+    Args:
+        default: Value returned on error; callables (list, dict) are called so
+            each failure gets a fresh object
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            except Exception as e:
+                session = kwargs.get("session")
+                if session is not None and not isinstance(session, AsyncSession):
+                    raise
+                # First positional argument is the ticker or the node being written
+                subject = args[0] if args else ""
+                logger.error(
+                    "Neo4j %s failed for %s: %s",
+                    fn.__name__, getattr(subject, "ticker", subject), e
+                )
+                return default() if callable(default) else default
+        return wrapper
+    return decorator
+
 
 class Neo4jRepository:
-    """Repository for Neo4j timeline operations - facts only, no scores."""
+    """
+    Repository for Neo4j timeline operations - facts only, no scores.
 
-    # ==================== COMPANY OPERATIONS ====================
+    Most methods take an optional keyword-only session so a caller making
+    several calls in a row can run them all on one session. A session runs one
+    query at a time: share it across sequential calls, not concurrent ones.
+    """
 
-    async def upsert_company(self, company: CompanyNode) -> bool:
-        """Create or update company node - NO SCORES."""
-        query = """
-        MERGE (c:Company {ticker: $ticker})
-        SET c.name = $name,
-            c.cik = $cik,
-            c.status = $status,
-            c.bankruptcy_date = CASE WHEN $bankruptcy_date IS NOT NULL
-                THEN date($bankruptcy_date) ELSE null END,
-            c.going_concern_status = $going_concern_status,
-            c.going_concern_first_seen = CASE WHEN $going_concern_first_seen IS NOT NULL
-                THEN date($going_concern_first_seen) ELSE null END,
-            c.going_concern_last_seen = CASE WHEN $going_concern_last_seen IS NOT NULL
-                THEN date($going_concern_last_seen) ELSE null END,
-            c.updated_at = datetime()
-        RETURN c
+    # Whether the server has apoc.periodic.iterate; None until the first chain build
+    _apoc_iterate_available: Optional[bool] = None
+
+    # (loaded_at, mask by ticker, [(ticker, mask)] of companies with an outcome)
+    _mask_snapshot: Optional[Tuple[float, Dict[str, int], List[Tuple[str, int]]]] = None
+
+    def _session(self, session: Optional[AsyncSession] = None):
+        """Reuse the caller's session, or open one for this call."""
+        return nullcontext(session) if session is not None else neo4j_service.session()
+
+    # ==================== SCHEMA ====================
+
+    async def ensure_schema(self) -> None:
         """
-        try:
-            async with neo4j_service.session() as session:
+        Create the constraints and indexes behind this repository's lookup keys.
+
+        Every query here matches Company.ticker or MERGEs on Filing.accession /
+        Signal.id; the unique constraints turn those label scans into index seeks.
+        Idempotent (IF NOT EXISTS), safe to run on every startup.
+        """
+        statements = [
+            "CREATE CONSTRAINT company_ticker IF NOT EXISTS FOR (c:Company) REQUIRE c.ticker IS UNIQUE",
+            "CREATE CONSTRAINT filing_accession_key IF NOT EXISTS FOR (f:Filing) REQUIRE f.accession IS UNIQUE",
+            "CREATE CONSTRAINT signal_id_key IF NOT EXISTS FOR (s:Signal) REQUIRE s.id IS UNIQUE",
+            "CREATE INDEX signal_date IF NOT EXISTS FOR (s:Signal) ON (s.date)",
+            "CREATE INDEX filing_date IF NOT EXISTS FOR (f:Filing) ON (f.date)",
+        ]
+        async with neo4j_service.session() as session:
+            for statement in statements:
+                try:
+                    await session.run(statement)
+                except Exception as e:
+                    logger.warning(f"Could not apply schema statement ({statement}): {e}")
+
+            # Companies synced before signal_type_mask existed
+            try:
                 await session.run(
-                    query,
-                    ticker=company.ticker,
-                    name=company.name,
-                    cik=company.cik,
-                    status=company.status,
-                    bankruptcy_date=company.bankruptcy_date,
-                    going_concern_status=company.going_concern_status,
-                    going_concern_first_seen=company.going_concern_first_seen,
-                    going_concern_last_seen=company.going_concern_last_seen
+                    """
+                    MATCH (c:Company)
+                    WHERE c.signal_type_mask IS NULL
+                    OPTIONAL MATCH (c)-[:HAS_SIGNAL]->(s:Signal)
+                    WITH c, collect(DISTINCT s.type) as signal_types
+                    SET c.signal_type_mask = reduce(
+                        mask = 0, t IN signal_types | mask + coalesce($type_bits[t], 0)
+                    )
+                    """,
+                    type_bits=SIGNAL_TYPE_BITS
                 )
-                return True
-        except Exception as e:
-            logger.error(f"Error upserting company {company.ticker}: {e}")
-            return False
+            except Exception as e:
+                logger.warning(f"Could not backfill signal type masks: {e}")
+
+            # Label recent filings written before :RecentFiling existed
+            await self.refresh_recent_filings(session=session)
+        logger.info("Neo4j timeline schema ensured")
+
+    # ==================== COMPANY OPERATIONS ====================
 
-    async def update_company_signal_stats(self, ticker: str) -> bool:
+    @neo4j_guard(False)
+    async def upsert_company(
+        self,
+        company: CompanyNode,
+        *,
+        session: Optional[AsyncSession] = None
+    ) -> bool:
+        """Create or update company node - NO SCORES."""
+        async with self._session(session) as session:
+            await session.run(
+                _Q_UPSERT_COMPANY,
+                ticker=company.ticker,
+                name=company.name,
+                cik=company.cik,
+                status=company.status,
+                bankruptcy_date=_cypher_date(company.bankruptcy_date),
+                going_concern_status=company.going_concern_status,
+                going_concern_first_seen=_cypher_date(company.going_concern_first_seen),
+                going_concern_last_seen=_cypher_date(company.going_concern_last_seen)
+            )
+            return True
+
+    @neo4j_guard(False)
+    async def update_company_signal_stats(
+        self,
+        ticker: str,
+        *,
+        session: Optional[AsyncSession] = None
+    ) -> bool:
         """Update company's signal statistics (no scores)."""
-        query = """
-        MATCH (c:Company {ticker: $ticker})
-        OPTIONAL MATCH (c)-[:HAS_SIGNAL]->(s:Signal)
-        WITH c,
-             min(s.date) as first_signal,
-             max(s.date) as last_signal,
-             count(s) as signal_count
-        SET c.first_signal_date = first_signal,
-            c.last_signal_date = last_signal,
-            c.total_signals = signal_count,
-            c.days_since_last_signal = CASE
-                WHEN last_signal IS NOT NULL
-                THEN duration.inDays(last_signal, date()).days
-                ELSE null
-            END
-        RETURN c
+        async with self._session(session) as session:
+            await session.run(
+                _Q_UPDATE_SIGNAL_STATS, ticker=ticker, type_bits=SIGNAL_TYPE_BITS
+            )
+            self._mask_snapshot = None
+            return True
+
+    @neo4j_guard((0, 0))
+    async def sync_all(
+        self,
+        company: CompanyNode,
+        items: List[Tuple[SignalNode, FilingNode]],
+    ) -> Tuple[int, int]:
         """
-        try:
-            async with neo4j_service.session() as session:
-                await session.run(query, ticker=ticker)
-                return True
-        except Exception as e:
-            logger.error(f"Error updating signal stats for {ticker}: {e}")
-            return False
+        Upsert a company, write its signals, splice them into the chain and
+        refresh its stats in one managed write transaction (one commit).
+
+        Args:
+            company: Company node
+            items: (signal, filing) pairs
+
+        Returns:
+            (signals written, signals linked into the chain)
+        """
+        ticker = company.ticker
+        signal_ids = [signal.id for signal, _ in items]
+
+        async def work(tx) -> Tuple[int, int]:
+            await self.upsert_company(company, session=tx)
+            signals_created = await self.create_signals_batch(ticker, items, session=tx)
+            chain_count = 0
+            if signals_created:
+                chain_count = await self.link_signals(ticker, signal_ids, session=tx)
+            await self.update_company_signal_stats(ticker, session=tx)
+            return signals_created, chain_count
+
+        async with neo4j_service.session() as session:
+            return await session.execute_write(work)
 
     # ==================== SIGNAL OPERATIONS ====================
 
+    @neo4j_guard(False)
     async def create_signal(
         self,
         ticker: str,
         signal: SignalNode,
-        filing: FilingNode
+        filing: FilingNode,
+        *,
+        session: Optional[AsyncSession] = None
     ) -> bool:
         """Create signal node with filing and link to company."""
-        query = """
-        MATCH (c:Company {ticker: $ticker})
+        async with self._session(session) as session:
+            await session.run(
+                _Q_CREATE_SIGNAL,
+                ticker=ticker,
+                accession=filing.accession,
+                filing_type=filing.type,
+                item=filing.item,
+                filing_date=filing.date,
+                url=filing.url,
+                fiscal_year=filing.fiscal_year,
+                category=filing.category,
+                summary=filing.summary,
+                has_going_concern=filing.has_going_concern,
+                has_material_weakness=filing.has_material_weakness,
+                signal_id=signal.id,
+                signal_type=signal.type,
+                type_code=_type_code(signal.type),
+                signal_date=signal.date,
+                evidence=signal.evidence,
+                signal_fiscal_year=signal.fiscal_year,
+                recent_months=RECENT_FILING_MONTHS
+            )
+            return True
 
-        MERGE (f:Filing {accession: $accession})
-        SET f.type = $filing_type,
-            f.item = $item,
-            f.date = CASE WHEN $filing_date IS NOT NULL AND $filing_date <> ''
-                THEN date($filing_date) ELSE null END,
-            f.url = $url,
-            f.fiscal_year = $fiscal_year,
-            f.category = $category,
-            f.summary = $summary,
-            f.has_going_concern = $has_going_concern,
-            f.has_material_weakness = $has_material_weakness
+    @neo4j_guard(0)
+    async def create_signals_batch(
+        self,
+        ticker: str,
+        items: List[Tuple[SignalNode, FilingNode]],
+        *,
+        session: Optional[AsyncSession] = None
+    ) -> int:
+        """
+        Create many signal nodes with their filings in one round-trip.
 
-        MERGE (s:Signal {id: $signal_id})
-        SET s.type = $signal_type,
-            s.date = CASE WHEN $signal_date IS NOT NULL AND $signal_date <> ''
-                THEN date($signal_date) ELSE null END,
-            s.evidence = $evidence,
-            s.fiscal_year = $signal_fiscal_year,
-            s.created_at = datetime()
+        Same graph writes as create_signal, applied per row server-side via UNWIND.
 
-        MERGE (c)-[:HAS_SIGNAL]->(s)
-        MERGE (s)-[:EXTRACTED_FROM]->(f)
-        MERGE (c)-[:FILED]->(f)
+        Args:
+            ticker: Company ticker
+            items: (signal, filing) pairs
+            session: Session or transaction to reuse (default: a new session)
 
-        RETURN s.id as signal_id
+        Returns:
+            Number of signals written
         """
-        try:
-            async with neo4j_service.session() as session:
-                await session.run(
-                    query,
-                    ticker=ticker,
-                    accession=filing.accession,
-                    filing_type=filing.type,
-                    item=filing.item,
-                    filing_date=filing.date,
-                    url=filing.url,
-                    fiscal_year=filing.fiscal_year,
-                    category=filing.category,
-                    summary=filing.summary,
-                    has_going_concern=filing.has_going_concern,
-                    has_material_weakness=filing.has_material_weakness,
-                    signal_id=signal.id,
-                    signal_type=signal.type,
-                    signal_date=signal.date,
-                    evidence=signal.evidence,
-                    signal_fiscal_year=signal.fiscal_year
-                )
-                return True
-        except Exception as e:
-            logger.error(f"Error creating signal for {ticker}: {e}")
-            return False
+        if not items:
+            return 0
 
-    async def build_signal_chain(self, ticker: str) -> int:
-        """Create NEXT relationships between signals chronologically."""
-        query = """
-        MATCH (c:Company {ticker: $ticker})-[:HAS_SIGNAL]->(s:Signal)
-        WHERE s.date IS NOT NULL
-        WITH s ORDER BY s.date
-        WITH collect(s) as signals
-        UNWIND range(0, size(signals)-2) as i
-        WITH signals[i] as s1, signals[i+1] as s2
-        MERGE (s1)-[r:NEXT]->(s2)
-        SET r.days = duration.inDays(s1.date, s2.date).days
-        RETURN count(r) as relationships_created
+        rows = [
+            {
+                "accession": filing.accession,
+                "filing_type": filing.type,
+                "item": filing.item,
+                "filing_date": _cypher_date(filing.date),
+                "url": filing.url,
+                "fiscal_year": filing.fiscal_year,
+                "category": filing.category,
+                "summary": filing.summary,
+                "has_going_concern": filing.has_going_concern,
+                "has_material_weakness": filing.has_material_weakness,
+                "signal_id": signal.id,
+                "signal_type": signal.type,
+                "type_code": _type_code(signal.type),
+                "signal_date": _cypher_date(signal.date),
+                "evidence": signal.evidence,
+                "signal_fiscal_year": signal.fiscal_year,
+            }
+            for signal, filing in items
+        ]
+
+        async def work(tx) -> int:
+            result = await tx.run(
+                _Q_CREATE_SIGNALS_BATCH,
+                ticker=ticker,
+                rows=rows,
+                recent_months=RECENT_FILING_MONTHS,
+            )
+            record = await result.single()
+            return record["signals_created"] if record else 0
+
+        # One managed (retried) write transaction for the whole batch; inside a
+        # caller's transaction just run it there
+        async with self._session(session) as session:
+            if isinstance(session, AsyncSession):
+                return await session.execute_write(work)
+            return await work(session)
+
+    @neo4j_guard(0)
+    async def build_signal_chain(
+        self,
+        ticker: str,
+        *,
+        session: Optional[AsyncSession] = None
+    ) -> int:
         """
-        try:
-            async with neo4j_service.session() as session:
-                result = await session.run(query, ticker=ticker)
-                record = await result.single()
-                return record["relationships_created"] if record else 0
-        except Exception as e:
-            logger.error(f"Error building signal chain for {ticker}: {e}")
+        Create NEXT relationships between signals chronologically.
+
+        Full rebuild over all of the company's signals; routine syncs use
+        link_signals instead and this serves as a one-shot repair.
+
+        Pairs up the ordered signals and links them with apoc.periodic.iterate,
+        committing every CHAIN_BATCH_SIZE links, so a long history doesn't hold
+        its locks in one large transaction. Falls back to the plain Cypher chain
+        (one transaction) when APOC is not installed.
+        """
+        if self._apoc_iterate_available is not False:
+            try:
+                async with self._session(session) as chain_session:
+                    result = await chain_session.run(
+                        _Q_BUILD_CHAIN_APOC, ticker=ticker, batch_size=CHAIN_BATCH_SIZE
+                    )
+                    record = await result.single()
+                    Neo4jRepository._apoc_iterate_available = True
+                    if record["failedOperations"]:
+                        logger.warning(
+                            f"Signal chain for {ticker}: {record['failedOperations']} links "
+                            f"failed: {record['errorMessages']}"
+                        )
+                    return record["committedOperations"]
+            except ClientError as e:
+                # Unknown procedure: APOC not installed
+                logger.warning(f"apoc.periodic.iterate unavailable, using Cypher signal chain: {e}")
+                Neo4jRepository._apoc_iterate_available = False
+
+        async with self._session(session) as chain_session:
+            result = await chain_session.run(_Q_BUILD_CHAIN, ticker=ticker)
+            record = await result.single()
+            return record["relationships_created"] if record else 0
+
+    @neo4j_guard(0)
+    async def link_signals(
+        self,
+        ticker: str,
+        signal_ids: List[str],
+        *,
+        session: Optional[AsyncSession] = None
+    ) -> int:
+        """
+        Splice signals into the company's NEXT chain without rebuilding it.
+
+        For each signal, finds its chronological neighbours (date, then id for
+        ties, the same order build_signal_chain uses), drops the predecessor's
+        outgoing NEXT that skips over it, and links predecessor -> signal ->
+        successor. Writes touch only the neighbours instead of the whole chain.
+
+        Args:
+            ticker: Company ticker
+            signal_ids: Ids of signals just written (re-linking existing ones is a no-op)
+
+        Returns:
+            Number of signals linked
+        """
+        if not signal_ids:
             return 0
 
+        async with self._session(session) as session:
+            result = await session.run(_Q_LINK_SIGNALS, ticker=ticker, signal_ids=signal_ids)
+            record = await result.single()
+            return record["signals_linked"] if record else 0
+
     # ==================== FILING OPERATIONS ====================
 
-    async def create_filing(self, ticker: str, filing: FilingNode) -> bool:
+    @neo4j_guard(False)
+    async def create_filing(
+        self,
+        ticker: str,
+        filing: FilingNode,
+        *,
+        session: Optional[AsyncSession] = None
+    ) -> bool:
         """Create filing node (for routine filings without signals)."""
         query = """
         MATCH (c:Company {ticker: $ticker})
@@ -183,174 +695,178 @@ class Neo4jRepository:
             f.summary = $summary,
             f.has_going_concern = $has_going_concern,
             f.has_material_weakness = $has_material_weakness
+        FOREACH (_ IN CASE WHEN f.date >= date() - duration({months: $recent_months})
+                THEN [1] ELSE [] END | SET f:RecentFiling)
 
         MERGE (c)-[:FILED]->(f)
 
         RETURN f.accession as accession
         """
-        try:
-            async with neo4j_service.session() as session:
-                await session.run(
-                    query,
-                    ticker=ticker,
-                    accession=filing.accession,
-                    type=filing.type,
-                    item=filing.item,
-                    date=filing.date,
-                    url=filing.url,
-                    fiscal_year=filing.fiscal_year,
-                    category=filing.category,
-                    summary=filing.summary,
-                    has_going_concern=filing.has_going_concern,
-                    has_material_weakness=filing.has_material_weakness
-                )
-                return True
-        except Exception as e:
-            logger.error(f"Error creating filing for {ticker}: {e}")
-            return False
+        async with self._session(session) as session:
+            await session.run(
+                query,
+                ticker=ticker,
+                accession=filing.accession,
+                type=filing.type,
+                item=filing.item,
+                date=filing.date,
+                url=filing.url,
+                fiscal_year=filing.fiscal_year,
+                category=filing.category,
+                summary=filing.summary,
+                has_going_concern=filing.has_going_concern,
+                has_material_weakness=filing.has_material_weakness,
+                recent_months=RECENT_FILING_MONTHS
+            )
+            return True
 
     # ==================== TIMELINE QUERIES ====================
 
+    @neo4j_guard(0)
+    async def refresh_recent_filings(self, *, session: Optional[AsyncSession] = None) -> int:
+        """
+        Move the :RecentFiling label along with the calendar.
+
+        Drops it from filings that aged out of the window and adds it to any
+        recent filing written before the label existed. Run daily.
+
+        Returns:
+            Number of filings whose label changed
+        """
+        expire_query = """
+        MATCH (f:RecentFiling)
+        WHERE f.date IS NULL OR f.date < date() - duration({months: $recent_months})
+        REMOVE f:RecentFiling
+        RETURN count(f) as changed
+        """
+        backfill_query = """
+        MATCH (f:Filing)
+        WHERE f.date >= date() - duration({months: $recent_months})
+          AND NOT f:RecentFiling
+        SET f:RecentFiling
+        RETURN count(f) as changed
+        """
+        changed = 0
+        async with self._session(session) as session:
+            for query in (expire_query, backfill_query):
+                result = await session.run(query, recent_months=RECENT_FILING_MONTHS)
+                record = await result.single()
+                changed += record["changed"] if record else 0
+        logger.info(f"Refreshed :RecentFiling labels ({changed} changed)")
+        return changed
+
+    @neo4j_guard(None)
     async def get_company_timeline(self, ticker: str) -> Optional[CompanyTimeline]:
         """Get complete signal timeline for a company - NO SCORES."""
-        query = """
-        MATCH (c:Company {ticker: $ticker})
+        try:
+            record = await self._fetch_timeline_record(ticker)
+        except (ServiceUnavailable, SessionExpired) as e:
+            logger.warning(f"Neo4j connection lost ({e}), reconnecting")
+            await neo4j_service.reconnect()
+            record = await self._fetch_timeline_record(ticker)
 
-        // Get all signals with their filings
-        OPTIONAL MATCH (c)-[:HAS_SIGNAL]->(s:Signal)
-        OPTIONAL MATCH (s)-[:EXTRACTED_FROM]->(sf:Filing)
-        OPTIONAL MATCH (s)-[next:NEXT]->(:Signal)
+        if not record:
+            return None
 
-        WITH c, s, sf, next
-        ORDER BY s.date
+        company_data = record["company"]
+        signals_data = record["signals"]
+        filings_data = record["recent_filings"]
 
-        WITH c, collect(DISTINCT {
-            id: s.id,
-            type: s.type,
-            date: toString(s.date),
-            evidence: s.evidence,
-            fiscal_year: s.fiscal_year,
-            days_to_next: next.days,
-            filing: {
-                type: sf.type,
-                item: sf.item,
-                date: toString(sf.date),
-                url: sf.url,
-                accession: sf.accession
-            }
-        }) as signals
-
-        // Get recent filings (last 12 months)
-        OPTIONAL MATCH (c)-[:FILED]->(rf:Filing)
-        WHERE rf.date >= date() - duration('P12M')
-
-        WITH c, signals, rf
-        ORDER BY rf.date DESC
-
-        WITH c, signals, collect(DISTINCT {
-            accession: rf.accession,
-            type: rf.type,
-            item: rf.item,
-            date: toString(rf.date),
-            url: rf.url,
-            category: rf.category,
-            summary: rf.summary
-        }) as recent_filings
-
-        RETURN {
-            ticker: c.ticker,
-            name: c.name,
-            cik: c.cik,
-            status: c.status,
-            bankruptcy_date: toString(c.bankruptcy_date),
-            first_signal_date: toString(c.first_signal_date),
-            last_signal_date: toString(c.last_signal_date),
-            days_since_last_signal: c.days_since_last_signal,
-            total_signals: c.total_signals,
-            going_concern_status: c.going_concern_status,
-            going_concern_first_seen: toString(c.going_concern_first_seen),
-            going_concern_last_seen: toString(c.going_concern_last_seen)
-        } as company,
-        signals,
-        recent_filings
+        # Build company info
+        company = CompanyInfo(
+            ticker=company_data.get("ticker", ticker),
+            name=company_data.get("name", ""),
+            cik=company_data.get("cik"),
+            status=company_data.get("status", "ACTIVE"),
+            bankruptcy_date=company_data.get("bankruptcy_date"),
+            first_signal_date=company_data.get("first_signal_date"),
+            last_signal_date=company_data.get("last_signal_date"),
+            days_since_last_signal=company_data.get("days_since_last_signal"),
+            total_signals=company_data.get("total_signals") or 0,
+            going_concern_status=company_data.get("going_concern_status", "NEVER"),
+            going_concern_first_seen=company_data.get("going_concern_first_seen"),
+            going_concern_last_seen=company_data.get("going_concern_last_seen")
+        )
+
+        # Build signals list
+        signals = []
+        for s in signals_data:
+            if s.get("id"):
+                filing_data = s.get("filing", {})
+                filing = None
+                if filing_data.get("accession"):
+                    filing = FilingInfo(
+                        type=filing_data.get("type", "8-K"),
+                        item=filing_data.get("item"),
+                        date=filing_data.get("date", ""),
+                        url=filing_data.get("url"),
+                        accession=filing_data.get("accession")
+                    )
+                signals.append(SignalDetail(
+                    id=s["id"],
+                    type=sys.intern(s.get("type") or "UNKNOWN"),
+                    date=s.get("date", ""),
+                    evidence=s.get("evidence", ""),
+                    fiscal_year=s.get("fiscal_year"),
+                    days_to_next=s.get("days_to_next"),
+                    filing=filing
+                ))
+
+        # Build recent filings list
+        recent_filings = []
+        for f in filings_data:
+            if f.get("accession"):
+                recent_filings.append(FilingDetail(
+                    accession=f["accession"],
+                    type=f.get("type", "8-K"),
+                    item=f.get("item"),
+                    date=f.get("date", ""),
+                    url=f.get("url"),
+                    category=f.get("category", "ROUTINE"),
+                    summary=f.get("summary")
+                ))
+
+        return CompanyTimeline(
+            company=company,
+            signals=tuple(signals),
+            recent_filings=tuple(recent_filings)
+        )
+
+    async def _fetch_timeline_record(self, ticker: str) -> Optional[Dict[str, Any]]:
         """
-        try:
-            async with neo4j_service.session() as session:
-                result = await session.run(query, ticker=ticker)
-                record = await result.single()
+        Run the signal and recent-filing queries concurrently and merge them.
 
-                if not record:
-                    return None
-
-                company_data = record["company"]
-                signals_data = record["signals"]
-                filings_data = record["recent_filings"]
-
-                # Build company info
-                company = CompanyInfo(
-                    ticker=company_data.get("ticker", ticker),
-                    name=company_data.get("name", ""),
-                    cik=company_data.get("cik"),
-                    status=company_data.get("status", "ACTIVE"),
-                    bankruptcy_date=company_data.get("bankruptcy_date"),
-                    first_signal_date=company_data.get("first_signal_date"),
-                    last_signal_date=company_data.get("last_signal_date"),
-                    days_since_last_signal=company_data.get("days_since_last_signal"),
-                    total_signals=company_data.get("total_signals") or 0,
-                    going_concern_status=company_data.get("going_concern_status", "NEVER"),
-                    going_concern_first_seen=company_data.get("going_concern_first_seen"),
-                    going_concern_last_seen=company_data.get("going_concern_last_seen")
-                )
+        Kept as two queries so signals and recent filings are never joined into
+        a |signals| x |recent_filings| row product. A session runs one query at
+        a time, so each query gets its own.
 
-                # Build signals list
-                signals = []
-                for s in signals_data:
-                    if s.get("id"):
-                        filing_data = s.get("filing", {})
-                        filing = None
-                        if filing_data.get("accession"):
-                            filing = FilingInfo(
-                                type=filing_data.get("type", "8-K"),
-                                item=filing_data.get("item"),
-                                date=filing_data.get("date", ""),
-                                url=filing_data.get("url"),
-                                accession=filing_data.get("accession")
-                            )
-                        signals.append(SignalDetail(
-                            id=s["id"],
-                            type=s.get("type", "UNKNOWN"),
-                            date=s.get("date", ""),
-                            evidence=s.get("evidence", ""),
-                            fiscal_year=s.get("fiscal_year"),
-                            days_to_next=s.get("days_to_next"),
-                            filing=filing
-                        ))
-
-                # Build recent filings list
-                recent_filings = []
-                for f in filings_data:
-                    if f.get("accession"):
-                        recent_filings.append(FilingDetail(
-                            accession=f["accession"],
-                            type=f.get("type", "8-K"),
-                            item=f.get("item"),
-                            date=f.get("date", ""),
-                            url=f.get("url"),
-                            category=f.get("category", "ROUTINE"),
-                            summary=f.get("summary")
-                        ))
-
-                return CompanyTimeline(
-                    company=company,
-                    signals=signals,
-                    recent_filings=recent_filings
-                )
+        Returns:
+            Dict with company, signals and recent_filings, or None if the
+            company does not exist
+        """
+        async def fetch(query: str):
+            async with neo4j_service.session() as session:
+                result = await session.run(query, ticker=ticker)
+                return await result.single()
 
-        except Exception as e:
-            logger.error(f"Error getting timeline for {ticker}: {e}")
+        company_record, filings_record = await asyncio.gather(
+            fetch(_Q_COMPANY_AND_SIGNALS),
+            fetch(_Q_RECENT_FILINGS),
+        )
+        if not company_record:
             return None
+        return {
+            "company": company_record["company"],
+            "signals": company_record["signals"],
+            "recent_filings": filings_record["recent_filings"] if filings_record else [],
+        }
 
-    async def get_going_concern_history(self, ticker: str) -> GoingConcernHistory:
+    async def get_going_concern_history(
+        self,
+        ticker: str,
+        *,
+        session: Optional[AsyncSession] = None
+    ) -> GoingConcernHistory:
         """Track going concern status across 10-K filings."""
         query = """
         MATCH (c:Company {ticker: $ticker})-[:FILED]->(f:Filing)
@@ -362,17 +878,16 @@ class Neo4jRepository:
         ORDER BY f.fiscal_year DESC
         """
         try:
-            async with neo4j_service.session() as session:
+            async with self._session(session) as session:
                 result = await session.run(query, ticker=ticker)
-                records = await result.data()
 
                 years = []
-                for r in records:
+                async for r in result:
                     years.append(GoingConcernYear(
                         fiscal_year=r["fiscal_year"],
                         has_going_concern=r["has_going_concern"],
                         filing_date=r["filing_date"] or "",
-                        url=r.get("url")
+                        url=r["url"]
                     ))
 
                 return GoingConcernHistory(ticker=ticker, years=years)
@@ -381,112 +896,159 @@ class Neo4jRepository:
             logger.error(f"Error getting going concern history for {ticker}: {e}")
             return GoingConcernHistory(ticker=ticker, years=[])
 
+    @neo4j_guard(list)
     async def get_recent_filings(
         self,
         ticker: str,
         months: int = 12,
-        category: Optional[str] = None
+        category: Optional[str] = None,
+        *,
+        session: Optional[AsyncSession] = None
     ) -> List[FilingDetail]:
         """Get recent filings for a company."""
-        query = f"""
-        MATCH (c:Company {{ticker: $ticker}})-[:FILED]->(f:Filing)
-        WHERE f.date >= date() - duration('P{months}M')
-        {"AND f.category = $category" if category else ""}
-        RETURN f
-        ORDER BY f.date DESC
-        """
-        try:
-            params = {"ticker": ticker}
-            if category:
-                params["category"] = category
+        query = _recent_filings_query(months <= RECENT_FILING_MONTHS)
+        async with self._session(session) as session:
+            result = await session.run(
+                query, ticker=ticker, months=months, category=category or None
+            )
 
-            async with neo4j_service.session() as session:
-                result = await session.run(query, **params)
-                records = await result.data()
-
-                return [
-                    FilingDetail(
-                        accession=r["f"].get("accession", ""),
-                        type=r["f"].get("type", "8-K"),
-                        item=r["f"].get("item"),
-                        date=str(r["f"].get("date", "")),
-                        url=r["f"].get("url"),
-                        category=r["f"].get("category", "ROUTINE"),
-                        summary=r["f"].get("summary")
-                    )
-                    for r in records
-                ]
-
-        except Exception as e:
-            logger.error(f"Error getting recent filings for {ticker}: {e}")
-            return []
+            filings = []
+            async for r in result:
+                filings.append(FilingDetail(
+                    accession=r["accession"] or "",
+                    type=r["type"] or "8-K",
+                    item=r["item"],
+                    date=r["date"] or "",
+                    url=r["url"],
+                    category=r["category"] or "ROUTINE",
+                    summary=r["summary"]
+                ))
+            return filings
 
     # ==================== COMPARISON QUERIES ====================
 
+    @neo4j_guard(list)
     async def get_similar_cases(
         self,
         ticker: str,
-        min_overlap: int = 2
+        min_overlap: int = 2,
+        *,
+        session: Optional[AsyncSession] = None
     ) -> List[SimilarCase]:
-        """Find historical cases with similar signal patterns."""
-        query = """
-        MATCH (target:Company {ticker: $ticker})-[:HAS_SIGNAL]->(ts:Signal)
-        WITH target, collect(DISTINCT ts.type) as targetSignals
-
-        MATCH (other:Company)-[:HAS_SIGNAL]->(os:Signal)
-        WHERE other <> target
-          AND other.status IS NOT NULL
-        WITH target, targetSignals, other, collect(DISTINCT os.type) as otherSignals
-
-        WITH other, targetSignals, otherSignals,
-             [x IN targetSignals WHERE x IN otherSignals] as overlap
-
-        WHERE size(overlap) >= $min_overlap
+        """
+        Find historical cases with similar signal patterns.
 
-        // Get timeline for similar companies
+        Overlap is computed from each company's signal_type_mask (one bit per
+        signal type, kept by update_company_signal_stats) over an in-process
+        snapshot of all masks, so ranking needs no query at all. Timelines are
+        then fetched for the top matches only.
+        """
+        detail_query = """
+        UNWIND $tickers as t
+        MATCH (other:Company {ticker: t})
         OPTIONAL MATCH (other)-[:HAS_SIGNAL]->(s:Signal)
-        WITH other, overlap, otherSignals, s
+        WITH other, s
         ORDER BY s.date
-
         RETURN other.ticker as ticker,
                other.name as name,
                other.status as outcome,
                toString(other.bankruptcy_date) as bankruptcy_date,
                other.going_concern_status as going_concern_status,
-               size(overlap) as overlap_count,
-               overlap as matching_signals,
                collect({
                    type: s.type,
                    date: toString(s.date)
                }) as timeline
-        ORDER BY overlap_count DESC
-        LIMIT 10
         """
-        try:
-            async with neo4j_service.session() as session:
-                result = await session.run(query, ticker=ticker, min_overlap=min_overlap)
-                records = await result.data()
-
-                return [
-                    SimilarCase(
-                        ticker=r["ticker"],
-                        name=r["name"] or "",
-                        outcome=r["outcome"] or "ACTIVE",
-                        bankruptcy_date=r["bankruptcy_date"],
-                        going_concern_status=r["going_concern_status"],
-                        overlap_count=r["overlap_count"],
-                        matching_signals=r["matching_signals"] or [],
-                        timeline=r["timeline"] or []
-                    )
-                    for r in records
-                ]
+        async with self._session(session) as session:
+            masks_by_ticker, candidates = await self._get_mask_snapshot(session)
+            target_mask = masks_by_ticker.get(ticker)
+            if target_mask is None:
+                # Synced after the snapshot was taken (e.g. by the worker)
+                result = await session.run(
+                    "MATCH (c:Company {ticker: $ticker}) RETURN c.signal_type_mask as mask",
+                    ticker=ticker
+                )
+                record = await result.single()
+                target_mask = (record["mask"] if record else None) or 0
 
-        except Exception as e:
-            logger.error(f"Error getting similar cases for {ticker}: {e}")
-            return []
+            matches = []
+            for other_ticker, mask in candidates:
+                overlap = target_mask & mask
+                overlap_count = overlap.bit_count()
+                if overlap_count >= min_overlap and other_ticker != ticker:
+                    matches.append((overlap_count, overlap, other_ticker))
+
+            matches.sort(key=lambda m: m[0], reverse=True)
+            matches = matches[:10]
+            if not matches:
+                return []
+
+            result = await session.run(detail_query, tickers=[m[2] for m in matches])
+            details = {r["ticker"]: r async for r in result}
+
+        cases = []
+        for overlap_count, overlap, other_ticker in matches:
+            r = details.get(other_ticker)
+            if not r:
+                continue
+            cases.append(SimilarCase(
+                ticker=other_ticker,
+                name=r["name"] or "",
+                outcome=r["outcome"] or "ACTIVE",
+                bankruptcy_date=r["bankruptcy_date"],
+                going_concern_status=r["going_concern_status"],
+                overlap_count=overlap_count,
+                matching_signals=list(_types_in_mask(overlap)),
+                timeline=r["timeline"] or []
+            ))
+        return cases
+
+    async def _get_mask_snapshot(
+        self,
+        session: AsyncSession
+    ) -> Tuple[Dict[str, int], List[Tuple[str, int]]]:
+        """
+        Return every company's signal_type_mask, reloading at most once per TTL.
+
+        Returns:
+            (mask by ticker for all companies with signals,
+             (ticker, mask) pairs for those with a recorded status)
+        """
+        snapshot = self._mask_snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < MASK_SNAPSHOT_TTL_SECONDS:
+            return snapshot[1], snapshot[2]
 
-    async def get_companies_by_signal_recency(self) -> Dict[str, List[dict]]:
-        """Group companies by how recent their last signal was."""
+        result = await session.run(
+            """
+            MATCH (c:Company)
+            WHERE c.signal_type_mask > 0
+            RETURN c.ticker as ticker,
+                   c.signal_type_mask as mask,
+                   c.status IS NOT NULL as has_status
+            """
+        )
+        masks_by_ticker: Dict[str, int] = {}
+        candidates: List[Tuple[str, int]] = []
+        async for r in result:
+            masks_by_ticker[r["ticker"]] = r["mask"]
+            if r["has_status"]:
+                candidates.append((r["ticker"], r["mask"]))
+
+        self._mask_snapshot = (time.monotonic(), masks_by_ticker, candidates)
+        return masks_by_ticker, candidates
+
+    @neo4j_guard(dict)
+    async def get_companies_by_signal_recency(
+        self,
+        *,
+        session: Optional[AsyncSession] = None
+    ) -> Dict[str, List[dict]]:
+        """
+        Group companies by how recent their last signal was.
+
+        Rows stream back one per company and are bucketed as they arrive, so no
+        per-bucket list is built in the database or buffered by the driver.
+        """
         query = """
         MATCH (c:Company)
         WHERE c.last_signal_date IS NOT NULL
@@ -498,23 +1060,25 @@ class Neo4jRepository:
                 WHEN days_since <= 180 THEN 'last_180_days'
                 ELSE 'over_180_days'
             END as recency_bucket,
-            collect({
-                ticker: c.ticker,
-                name: c.name,
-                days_since: days_since,
-                last_signal: toString(c.last_signal_date),
-                going_concern_status: c.going_concern_status
-            }) as companies
+            c.ticker as ticker,
+            c.name as name,
+            days_since,
+            toString(c.last_signal_date) as last_signal,
+            c.going_concern_status as going_concern_status
         """
-        try:
-            async with neo4j_service.session() as session:
-                result = await session.run(query)
-                records = await result.data()
-                return {r["recency_bucket"]: r["companies"] for r in records}
+        buckets: Dict[str, List[dict]] = defaultdict(list)
+        async with self._session(session) as session:
+            result = await session.run(query)
+            async for r in result:
+                buckets[r["recency_bucket"]].append({
+                    "ticker": r["ticker"],
+                    "name": r["name"],
+                    "days_since": r["days_since"],
+                    "last_signal": r["last_signal"],
+                    "going_concern_status": r["going_concern_status"],
+                })
+        return dict(buckets)
 
-        except Exception as e:
-            logger.error(f"Error getting companies by recency: {e}")
-            return {}
 
 
 # Singleton instance
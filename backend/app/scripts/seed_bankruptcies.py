@@ -1,7 +1,8 @@
 """Seed known bankruptcy cases into Neo4j for pattern matching."""
 
 import asyncio
-from datetime import datetime
+import sys
+from typing import Any, Dict, List, Tuple
 
 from app.services.neo4j_service import neo4j_service
 from app.core.logging import get_logger
@@ -95,75 +96,102 @@ BANKRUPTCY_CASES = [
 ]
 
 
+# Concurrent per-company reads in verify_seeded_data (well under the driver pool)
+VERIFY_CONCURRENCY = 10
+
+_SEED_COMPANIES_QUERY = """
+UNWIND $rows as row
+MERGE (c:Company {ticker: row.ticker})
+ON CREATE SET c.created_at = datetime()
+WITH c, {
+    cik: row.cik,
+    name: row.name,
+    status: row.status,
+    risk_score: row.risk_score,
+    sector: row.sector,
+    bankruptcy_date: CASE WHEN row.bankruptcy_date IS NOT NULL
+        THEN date(row.bankruptcy_date) ELSE c.bankruptcy_date END
+} as props
+// Re-seeding unchanged companies writes nothing
+WITH c, props, [k IN keys(props)
+                WHERE coalesce(c[k] <> props[k], c[k] IS NOT NULL OR props[k] IS NOT NULL)] as changed
+FOREACH (_ IN CASE WHEN size(changed) > 0 THEN [1] ELSE [] END |
+    SET c += props, c.updated_at = datetime()
+)
+"""
+
+def build_seed_rows() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Flatten BANKRUPTCY_CASES into company, filing and signal rows.
+
+    Returns:
+        (companies, filings, signals) ready to UNWIND
+    """
+    companies, filings, signals = [], [], []
+    for case in BANKRUPTCY_CASES:
+        ticker = case["ticker"]
+        status = "BANKRUPT" if case.get("bankruptcy_date") else "DISTRESSED"
+        companies.append({
+            "ticker": ticker,
+            "cik": case["cik"],
+            "name": case["name"],
+            "status": status,
+            "risk_score": 100 if status == "BANKRUPT" else 75,
+            "sector": case.get("sector", ""),
+            "bankruptcy_date": case.get("bankruptcy_date"),
+        })
+
+        for i, signal in enumerate(case.get("signals", [])):
+            # A handful of type strings repeat across every case
+            signal_type = sys.intern(signal["type"])
+            # One dummy filing per seeded signal
+            filing_accession = f"{ticker}-SEED-{i:04d}"
+            filings.append({
+                "ticker": ticker,
+                "accession_number": filing_accession,
+                "filing_type": "8-K",
+                "filed_at": signal["date"],
+                "url": "",
+            })
+            signals.append({
+                "ticker": ticker,
+                "filing_accession": filing_accession,
+                "signal_id": f"{ticker}-{signal_type}-{signal['date']}",
+                "type": signal_type,
+                "severity": signal["severity"],
+                "confidence": 0.95,
+                "evidence": f"Seeded signal: {signal_type}",
+                "date": signal["date"],
+                "item_number": "5.02",
+                "person": None,
+            })
+
+    return companies, filings, signals
+
+
+# Flat rows for the UNWIND writes, derived once from BANKRUPTCY_CASES
+_COMPANY_ROWS, _FILING_ROWS, _SIGNAL_ROWS = build_seed_rows()
+
+
 async def seed_bankruptcy_cases():
-    """Seed all known bankruptcy cases into Neo4j."""
+    """Seed all known bankruptcy cases into Neo4j (bulk UNWIND writes)."""
     logger.info("Starting bankruptcy case seeding...")
 
     # Connect to Neo4j
     await neo4j_service.connect()
 
-    for case in BANKRUPTCY_CASES:
-        ticker = case["ticker"]
-        logger.info(f"Seeding {ticker}: {case['name']}")
-
-        try:
-            # Store company
-            status = "BANKRUPT" if case.get("bankruptcy_date") else "DISTRESSED"
-            await neo4j_service.store_company({
-                "ticker": ticker,
-                "cik": case["cik"],
-                "name": case["name"],
-                "status": status,
-                "risk_score": 100 if status == "BANKRUPT" else 75,
-                "sector": case.get("sector", ""),
-            })
-
-            # If bankrupt, add bankruptcy date
-            if case.get("bankruptcy_date"):
-                await neo4j_service.add_known_bankruptcy(
-                    ticker=ticker,
-                    cik=case["cik"],
-                    name=case["name"],
-                    bankruptcy_date=case["bankruptcy_date"],
-                    signals=[],
-                )
-
-            # Store each signal
-            for i, signal in enumerate(case.get("signals", [])):
-                # Create a dummy filing for the signal
-                filing_accession = f"{ticker}-SEED-{i:04d}"
-
-                # Store filing
-                await neo4j_service.store_filing(
-                    ticker=ticker,
-                    filing_data={
-                        "accession_number": filing_accession,
-                        "filing_type": "8-K",
-                        "filed_at": signal["date"],
-                        "url": "",
-                    },
-                )
-
-                # Store signal
-                await neo4j_service.store_signal(
-                    ticker=ticker,
-                    filing_accession=filing_accession,
-                    signal_data={
-                        "signal_id": f"{ticker}-{signal['type']}-{signal['date']}",
-                        "type": signal["type"],
-                        "severity": signal["severity"],
-                        "confidence": 0.95,
-                        "evidence": f"Seeded signal: {signal['type']}",
-                        "date": signal["date"],
-                        "item_number": "5.02",
-                        "person": None,
-                    },
-                )
-
-            logger.info(f"  Stored {len(case.get('signals', []))} signals for {ticker}")
-
-        except Exception as e:
-            logger.error(f"Error seeding {ticker}: {e}")
+    try:
+        # One session, one transaction, committed once at the end
+        async with neo4j_service.bulk_tx() as (_, tx):
+            await tx.run(_SEED_COMPANIES_QUERY, rows=_COMPANY_ROWS)
+            await neo4j_service.store_filings_bulk(_FILING_ROWS, session=tx)
+            await neo4j_service.store_signals_bulk(_SIGNAL_ROWS, session=tx)
+        logger.info(
+            f"Stored {len(_COMPANY_ROWS)} companies, {len(_FILING_ROWS)} filings, "
+            f"{len(_SIGNAL_ROWS)} signals"
+        )
+    except Exception as e:
+        logger.error(f"Error seeding bankruptcy cases: {e}")
 
     # Close connection
     await neo4j_service.close()
@@ -171,18 +199,30 @@ async def seed_bankruptcy_cases():
 
 
 async def verify_seeded_data():
-    """Verify the seeded data is accessible."""
+    """Verify the seeded data is accessible, one concurrent read per company."""
     await neo4j_service.connect()
 
-    for case in BANKRUPTCY_CASES[:3]:
-        ticker = case["ticker"]
-        signals = await neo4j_service.get_company_signals(ticker)
-        logger.info(f"{ticker}: {len(signals)} signals in Neo4j")
+    # Each read opens its own pooled session; bound how many run at once
+    sem = asyncio.Semaphore(VERIFY_CONCURRENCY)
+
+    async def count_signals(ticker: str) -> int:
+        async with sem:
+            return len(await neo4j_service.get_company_signals(ticker))
+
+    tickers = [case["ticker"] for case in BANKRUPTCY_CASES]
+    counts = await asyncio.gather(*(count_signals(ticker) for ticker in tickers))
+    for ticker, count in zip(tickers, counts):
+        logger.info(f"{ticker}: {count} signals in Neo4j")
 
     await neo4j_service.close()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # installed with uvicorn[standard], absent on Windows
+        pass
     asyncio.run(seed_bankruptcy_cases())
     print("\nVerifying seeded data...")
     asyncio.run(verify_seeded_data())
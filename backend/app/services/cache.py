@@ -0,0 +1,104 @@
+"""Redis cache-aside for per-ticker Neo4j read results."""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+
+from app.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Reads depend on other companies' writes too (similarity, bankruptcy
+# patterns); the TTL bounds that staleness, per-ticker deletes handle the rest
+GRAPH_CACHE_TTL_SECONDS = 120
+
+# Cached read methods; invalidate() drops every one of them for a ticker
+GRAPH_CACHE_METHODS = ("signals", "similar", "patterns")
+
+
+def graph_cache_key(method: str, ticker: str) -> str:
+    """Build the cache key for one read method's result for a ticker."""
+    return f"neo4j:{method}:{ticker}"
+
+
+class GraphCache:
+    """
+    Redis-backed cache of JSON-encoded Neo4j read results.
+
+    Errors are logged and treated as misses, so the cache never blocks a read.
+    """
+
+    def __init__(self):
+        self._client: Optional[aioredis.Redis] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _get_client(self) -> aioredis.Redis:
+        """Client bound to the running event loop (Celery tasks each run asyncio.run)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = aioredis.from_url(settings.redis_url, decode_responses=True)
+            self._client_loop = loop
+        return self._client
+
+    async def cached(
+        self,
+        key: str,
+        ttl: int,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached value for key, or compute, store and return it.
+
+        Args:
+            key: Cache key (see graph_cache_key)
+            ttl: Seconds to keep a computed value
+            factory: Zero-arg coroutine function computing the value on a miss
+
+        Returns:
+            Cached or freshly computed value (neo4j dates come back as ISO strings on a hit)
+        """
+        try:
+            raw = await self._get_client().get(key)
+        except Exception as e:
+            logger.warning(f"Graph cache read failed for {key}: {e}")
+            raw = None
+
+        if raw is not None:
+            self.hits += 1
+            return json.loads(raw)
+
+        self.misses += 1
+        value = await factory()
+        try:
+            await self._get_client().setex(key, ttl, json.dumps(value, default=str))
+        except Exception as e:
+            logger.warning(f"Graph cache write failed for {key}: {e}")
+        return value
+
+    async def invalidate(self, ticker: str) -> None:
+        """Drop every cached read for a ticker after a write to it."""
+        try:
+            await self._get_client().delete(
+                *(graph_cache_key(method, ticker) for method in GRAPH_CACHE_METHODS)
+            )
+        except Exception as e:
+            logger.warning(f"Graph cache invalidation failed for {ticker}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# Singleton instance
+graph_cache = GraphCache()
@@ -3,19 +3,385 @@
 Stores: Companies, Signals, Filings, Relationships, Pattern matching
 """
 
-from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession, AsyncTransaction
 from neo4j.exceptions import ServiceUnavailable, AuthError
-from typing import List, Dict, Any, Optional
-from contextlib import asynccontextmanager
-import uuid
+from typing import List, Dict, Any, Optional, Set, Union
+from contextlib import asynccontextmanager, nullcontext
+import asyncio
+import hashlib
+import importlib.util
 
 from app.config import get_settings
 from app.core.logging import get_logger
 from app.core.exceptions import DatabaseError
+from app.services.cache import GRAPH_CACHE_TTL_SECONDS, graph_cache, graph_cache_key
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Anything with .run(): a session, or a transaction from bulk_tx()
+QueryRunner = Union[AsyncSession, AsyncTransaction]
+
+# find_similar_companies caches this many rows and slices per call
+SIMILAR_CACHE_LIMIT = 10
+
+# Rows per UNWIND statement in the bulk writers; larger inputs are chunked
+BULK_WRITE_CHUNK_SIZE = 10_000
+
+# Bulk writes larger than BULK_WRITE_CHUNK_SIZE (outside a caller's transaction)
+# go out as one CALL { ... } IN TRANSACTIONS query committing this many rows each
+IN_TRANSACTIONS_ROWS = 5_000
+
+# Neo4jWriteQueue flushes once this many rows are queued, or after this long
+WRITE_QUEUE_BATCH_SIZE = 500
+WRITE_QUEUE_FLUSH_MS = 50
+
+
+# Company upsert; properties (and updated_at) are only written when a value
+# differs, so idempotent re-runs add nothing to the transaction log
+_Q_STORE_COMPANY = """
+MERGE (c:Company {ticker: $ticker})
+ON CREATE SET c.created_at = datetime()
+WITH c, [k IN keys($props)
+         WHERE coalesce(c[k] <> $props[k], c[k] IS NOT NULL OR $props[k] IS NOT NULL)] as changed
+FOREACH (_ IN CASE WHEN size(changed) > 0 THEN [1] ELSE [] END |
+    SET c += $props, c.updated_at = datetime()
+)
+RETURN size(changed) > 0 as changed
+"""
+
+# Filing linked to its company
+_Q_STORE_FILING = """
+MATCH (c:Company {ticker: $ticker})
+MERGE (f:Filing {accession_number: $accession_number})
+SET f.filing_type = $filing_type,
+    f.filed_at = date($filed_at),
+    f.url = $url,
+    f.updated_at = datetime()
+MERGE (c)-[:FILED]->(f)
+RETURN f
+"""
+
+# Signal linked to its filing and SignalType; the type node is looked up
+# before the MERGE so the whole write is one pipeline with no WITH fence.
+# Also keeps the (Company)-[:HAS_SIGNAL_TYPE {count, last_date}]->(SignalType)
+# shortcut current; count only grows when the signal node is new.
+_Q_STORE_SIGNAL = """
+MATCH (c:Company {ticker: $ticker})-[:FILED]->(f:Filing {accession_number: $filing_accession})
+OPTIONAL MATCH (st:SignalType {name: $type})
+OPTIONAL MATCH (existing:Signal {signal_id: $signal_id})
+MERGE (s:Signal {signal_id: $signal_id})
+SET s.type = $type,
+    s.severity = $severity,
+    s.confidence = $confidence,
+    s.evidence = $evidence,
+    s.date = CASE WHEN $date IS NOT NULL AND $date <> '' THEN date($date) ELSE null END,
+    s.item_number = $item_number,
+    s.person = $person,
+    s.detected_at = datetime()
+MERGE (f)-[:CONTAINS]->(s)
+FOREACH (_ IN CASE WHEN st IS NULL THEN [] ELSE [1] END |
+    MERGE (s)-[:IS_TYPE]->(st)
+    MERGE (c)-[ht:HAS_SIGNAL_TYPE]->(st)
+    ON CREATE SET ht.count = 0
+    SET ht.count = ht.count + CASE WHEN existing IS NULL THEN 1 ELSE 0 END,
+        ht.last_date = CASE WHEN ht.last_date IS NULL OR s.date > ht.last_date THEN s.date ELSE ht.last_date END
+)
+RETURN s.signal_id as signal_id
+"""
+
+# Per-row bodies of the bulk writers; the row is bound as r
+_Q_FILING_ROW = """
+MATCH (c:Company {ticker: r.ticker})
+MERGE (f:Filing {accession_number: r.accession_number})
+SET f.filing_type = r.filing_type,
+    f.filed_at = CASE WHEN r.filed_at IS NOT NULL AND r.filed_at <> '' THEN date(r.filed_at) ELSE null END,
+    f.url = r.url,
+    f.updated_at = datetime()
+MERGE (c)-[:FILED]->(f)
+RETURN f.accession_number as accession_number
+"""
+
+_Q_SIGNAL_ROW = """
+MATCH (c:Company {ticker: r.ticker})-[:FILED]->(f:Filing {accession_number: r.filing_accession})
+OPTIONAL MATCH (st:SignalType {name: r.type})
+OPTIONAL MATCH (existing:Signal {signal_id: r.signal_id})
+MERGE (s:Signal {signal_id: r.signal_id})
+SET s.type = r.type,
+    s.severity = r.severity,
+    s.confidence = r.confidence,
+    s.evidence = r.evidence,
+    s.date = CASE WHEN r.date IS NOT NULL AND r.date <> '' THEN date(r.date) ELSE null END,
+    s.item_number = r.item_number,
+    s.person = r.person,
+    s.detected_at = datetime()
+MERGE (f)-[:CONTAINS]->(s)
+FOREACH (_ IN CASE WHEN st IS NULL THEN [] ELSE [1] END |
+    MERGE (s)-[:IS_TYPE]->(st)
+    MERGE (c)-[ht:HAS_SIGNAL_TYPE]->(st)
+    ON CREATE SET ht.count = 0
+    SET ht.count = ht.count + CASE WHEN existing IS NULL THEN 1 ELSE 0 END,
+        ht.last_date = CASE WHEN ht.last_date IS NULL OR s.date > ht.last_date THEN s.date ELSE ht.last_date END
+)
+RETURN s.signal_id as signal_id
+"""
+
+
+def derive_signal_id(
+    ticker: str,
+    filing_accession: str,
+    signal_type: str,
+    date: Optional[str],
+    item_number: Optional[str] = None,
+    person: Optional[str] = None,
+) -> str:
+    """
+    Deterministic signal ID for signals that arrive without one.
+
+    Re-ingesting the same signal MERGEs onto the same node instead of adding
+    a duplicate (a random UUID did). Item number and person are part of the
+    key, so distinct facts of one type in the same filing and date (e.g. a CEO
+    and a CFO departure) keep separate nodes.
+
+    Args:
+        ticker: Company ticker
+        filing_accession: Accession number of the source filing
+        signal_type: Signal type code
+        date: Signal date (may be empty)
+        item_number: Filing item the signal came from (may be empty)
+        person: Person the signal concerns (may be empty)
+
+    Returns:
+        32-char hex digest
+    """
+    key = (
+        f"{ticker}|{signal_type}|{date or ''}|{filing_accession}"
+        f"|{item_number or ''}|{person or ''}"
+    )
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _unwind_in_transactions(row_query: str, columns: str) -> str:
+    """Wrap a per-row body in CALL { ... } IN TRANSACTIONS (auto-commit sessions only)."""
+    return (
+        "UNWIND $rows AS r\nCALL {\nWITH r" + row_query
+        + f"}} IN TRANSACTIONS OF {IN_TRANSACTIONS_ROWS} ROWS\nRETURN {columns}\n"
+    )
+
+
+_Q_STORE_FILINGS = "UNWIND $rows AS r" + _Q_FILING_ROW
+_Q_STORE_FILINGS_LARGE = _unwind_in_transactions(_Q_FILING_ROW, "accession_number")
+_Q_STORE_SIGNALS = "UNWIND $rows AS r" + _Q_SIGNAL_ROW
+_Q_STORE_SIGNALS_LARGE = _unwind_in_transactions(_Q_SIGNAL_ROW, "signal_id")
+
+
+# One-off fill of HAS_SIGNAL_TYPE for signals stored before the shortcut existed
+_Q_BACKFILL_SIGNAL_TYPE_EDGES = """
+MATCH (c:Company)-[:FILED]->(:Filing)-[:CONTAINS]->(s:Signal)-[:IS_TYPE]->(st:SignalType)
+WHERE NOT EXISTS { (c)-[:HAS_SIGNAL_TYPE]->(st) }
+WITH c, st, COUNT(DISTINCT s) as signals, MAX(s.date) as last_date
+MERGE (c)-[ht:HAS_SIGNAL_TYPE]->(st)
+SET ht.count = signals, ht.last_date = last_date
+"""
+
+# All signals of a company, newest first. Dates are projected as strings so
+# cached (JSON) and fresh results have the same shape.
+_Q_COMPANY_SIGNALS = """
+MATCH (c:Company {ticker: $ticker})-[:FILED]->(f:Filing)-[:CONTAINS]->(s:Signal)
+RETURN s.signal_id as id,
+       s.type as type,
+       s.severity as severity,
+       s.confidence as confidence,
+       s.evidence as evidence,
+       toString(s.date) as date,
+       s.item_number as item_number,
+       s.person as person,
+       f.accession_number as filing_accession,
+       f.filing_type as filing_type
+ORDER BY s.date DESC
+"""
+
+# Only signals of the target's types are expanded (seek on Signal.type);
+# the denominator is counted just for candidates sharing 2+ types.
+_Q_SIMILAR_COMPANIES = """
+MATCH (c1:Company {ticker: $ticker})-[:HAS_SIGNAL]->(s1:Signal)
+WITH c1, COLLECT(DISTINCT s1.type) as target_signals
+UNWIND target_signals as signal_type
+MATCH (c2:Company)-[:HAS_SIGNAL]->(:Signal {type: signal_type})
+WHERE c1 <> c2
+WITH c2, COLLECT(DISTINCT signal_type) as common
+WHERE SIZE(common) >= 2
+CALL {
+    WITH c2
+    MATCH (c2)-[:HAS_SIGNAL]->(s2:Signal)
+    RETURN COUNT(DISTINCT s2.type) as other_count
+}
+RETURN c2.ticker as ticker,
+       c2.name as name,
+       c2.status as status,
+       SIZE(common) as common_signals,
+       common as common_signal_types,
+       SIZE(common) * 1.0 / other_count as similarity_score
+ORDER BY similarity_score DESC, common_signals DESC
+LIMIT $limit
+"""
+
+# Intersect through the shared SignalType nodes over the one-hop
+# HAS_SIGNAL_TYPE shortcut instead of Filing -> Signal -> SignalType.
+_Q_BANKRUPTCY_PATTERNS = """
+MATCH (target:Company {ticker: $ticker})-[:HAS_SIGNAL_TYPE]->(st:SignalType)
+      <-[:HAS_SIGNAL_TYPE]-(bankrupt:Company {status: 'BANKRUPT'})
+WITH bankrupt, COLLECT(st.name) as common
+WHERE SIZE(common) >= 2
+WITH bankrupt, common, COUNT { (bankrupt)-[:HAS_SIGNAL_TYPE]->() } as bankrupt_count
+
+RETURN bankrupt.ticker as ticker,
+       bankrupt.name as name,
+       toString(bankrupt.bankruptcy_date) as bankruptcy_date,
+       SIZE(common) as matching_signals,
+       common as common_signal_types,
+       SIZE(common) * 1.0 / bankrupt_count as similarity_score
+ORDER BY similarity_score DESC
+LIMIT 3
+"""
+
+
+class Neo4jWriteQueue:
+    """
+    Coalesces signal writes from concurrent callers into shared UNWIND batches.
+
+    submit() returns once the batch holding its rows is committed, so callers
+    still see their own writes (the scorer reads right after the validator
+    stores) while concurrent analyses share one transaction per flush.
+    """
+
+    def __init__(
+        self,
+        service: "Neo4jService",
+        batch_size: int = WRITE_QUEUE_BATCH_SIZE,
+        flush_ms: int = WRITE_QUEUE_FLUSH_MS,
+    ):
+        self._service = service
+        self._batch_size = batch_size
+        self._flush_seconds = flush_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Queue and flush task bound to the running event loop (Celery tasks each run asyncio.run)."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._task = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def submit(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Queue signal rows and wait until they are written.
+
+        Args:
+            rows: store_signals_bulk rows that also carry filing_type, filed_at
+                and url for their filing; the company must already exist
+
+        Raises:
+            DatabaseError: If the batch containing these rows failed
+        """
+        if not rows:
+            return
+        queue = self._ensure_worker()
+        done = asyncio.get_running_loop().create_future()
+        await queue.put((rows, done))
+        await done
+
+    async def drain(self) -> None:
+        """Flush whatever is queued and stop the worker."""
+        if self._task is None or self._task.done() or self._loop is not asyncio.get_running_loop():
+            return
+        # None tells the worker to flush what it holds and exit
+        await self._queue.put(None)
+        await self._task
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Collect submissions until the batch is full or the flush window ends."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            pending = [item]
+            count = len(item[0])
+            deadline = loop.time() + self._flush_seconds
+            stop = False
+            while count < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                pending.append(item)
+                count += len(item[0])
+            await self._flush(pending)
+            if stop:
+                return
+
+    async def _store(self, rows: List[Dict[str, Any]]) -> None:
+        """Write rows' filings, then the signals, in one transaction."""
+        filings: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            filings.setdefault(row["filing_accession"], {
+                "ticker": row.get("ticker"),
+                "accession_number": row["filing_accession"],
+                "filing_type": row.get("filing_type", ""),
+                "filed_at": row.get("filed_at") or row.get("date", ""),
+                "url": row.get("url", ""),
+            })
+        async with self._service.bulk_tx() as (_, tx):
+            await self._service.store_filings_bulk(list(filings.values()), session=tx)
+            await self._service.store_signals_bulk(rows, session=tx)
+
+    async def _flush(self, pending: List[tuple]) -> None:
+        """
+        Write one batch and wake its submitters.
+
+        If the shared transaction fails, each submission is retried in its own
+        transaction, so one bad row only fails the submitter that sent it.
+        """
+        rows = [row for submitted, _ in pending for row in submitted]
+        try:
+            await self._store(rows)
+        except Exception as e:
+            if len(pending) == 1:
+                logger.error(f"Error flushing Neo4j write queue ({len(rows)} rows): {e}")
+                _, done = pending[0]
+                if not done.done():
+                    done.set_exception(e)
+                return
+            logger.warning(
+                f"Neo4j write queue batch failed ({len(rows)} rows), "
+                f"retrying {len(pending)} submissions separately: {e}"
+            )
+            for submitted, done in pending:
+                try:
+                    await self._store(submitted)
+                except Exception as e:
+                    logger.error(f"Error writing queued Neo4j rows ({len(submitted)} rows): {e}")
+                    if not done.done():
+                        done.set_exception(e)
+                else:
+                    if not done.done():
+                        done.set_result(None)
+            return
+        for _, done in pending:
+            if not done.done():
+                done.set_result(None)
+
 
 class Neo4jService:
     """
@@ -31,6 +397,10 @@ class Neo4jService:
     def __init__(self):
         self._driver: Optional[AsyncDriver] = None
         self._initialized = False
+        self.write_queue = Neo4jWriteQueue(self)
+        # Tickers written inside an open bulk_tx(), by id(tx); their cached
+        # reads are dropped only after the commit
+        self._tx_invalidations: Dict[int, Set[str]] = {}
 
     async def connect(self) -> None:
         """Establish connection to Neo4j with connection pooling."""
@@ -38,14 +408,22 @@ class Neo4jService:
             self._driver = AsyncGraphDatabase.driver(
                 settings.neo4j_uri,
                 auth=(settings.neo4j_username, settings.neo4j_password),
-                max_connection_pool_size=50,
-                connection_acquisition_timeout=30,
+                max_connection_pool_size=settings.neo4j_max_pool_size,
+                connection_acquisition_timeout=settings.neo4j_acquisition_timeout_s,
+                max_connection_lifetime=settings.neo4j_max_connection_lifetime_s,
+                # Records pulled per round trip; sessions may override it
+                fetch_size=settings.neo4j_fetch_size,
             )
             # Verify connection
             async with self._driver.session() as session:
                 await session.run("RETURN 1")
 
             logger.info("Connected to Neo4j successfully")
+            if importlib.util.find_spec("neo4j._rust") is None:
+                logger.warning(
+                    "neo4j-rust-ext not installed, PackStream runs in pure Python "
+                    "(slower bulk UNWIND writes)"
+                )
 
             # Initialize schema
             await self._initialize_schema()
@@ -62,11 +440,27 @@ class Neo4jService:
             raise DatabaseError("Neo4j", str(e))
 
     async def close(self) -> None:
-        """Close the Neo4j connection."""
+        """Close the Neo4j connection (after flushing queued writes)."""
+        await self.write_queue.drain()
         if self._driver:
             await self._driver.close()
             logger.info("Neo4j connection closed")
 
+    async def ensure_driver(self) -> None:
+        """Connect lazily if no driver exists, without a liveness round-trip."""
+        if not self._driver:
+            await self.connect()
+
+    async def reconnect(self) -> None:
+        """Drop the current driver and establish a fresh connection."""
+        if self._driver:
+            try:
+                await self._driver.close()
+            except Exception as e:
+                logger.debug(f"Error closing stale Neo4j driver: {e}")
+            self._driver = None
+        await self.connect()
+
     async def health_check(self) -> bool:
         """Check if Neo4j connection is healthy."""
         if not self._driver:
@@ -80,51 +474,196 @@ class Neo4jService:
             return False
 
     @asynccontextmanager
-    async def session(self):
-        """Get a Neo4j session with automatic cleanup."""
+    async def session(self, **config: Any):
+        """
+        Get a Neo4j session with automatic cleanup.
+
+        Args:
+            **config: Session config overrides (e.g. fetch_size)
+        """
         if not self._driver:
             raise DatabaseError("Neo4j", "Not connected")
-        session = self._driver.session()
+        session = self._driver.session(**config)
         try:
             yield session
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def bulk_tx(self):
+        """
+        One session and one explicit transaction for a run of writes.
+
+        Pass the transaction as ``session=`` to the store_* methods; it commits
+        once when the block exits cleanly and rolls back on error. Graph cache
+        entries of the tickers written are dropped after the commit, so a
+        concurrent read can't re-cache the pre-commit graph.
+
+        Yields:
+            (session, tx) tuple
+        """
+        async with self.session() as session:
+            tx = await session.begin_transaction()
+            tickers: Set[str] = set()
+            self._tx_invalidations[id(tx)] = tickers
+            try:
+                yield session, tx
+            except BaseException:
+                await tx.rollback()
+                raise
+            else:
+                await tx.commit()
+            finally:
+                self._tx_invalidations.pop(id(tx), None)
+                await tx.close()
+        for ticker in tickers:
+            await graph_cache.invalidate(ticker)
+
+    async def _invalidate(self, session: Optional[QueryRunner], *tickers: Optional[str]) -> None:
+        """Drop tickers' cached reads now, or after the commit when inside bulk_tx()."""
+        pending = self._tx_invalidations.get(id(session)) if session is not None else None
+        for ticker in tickers:
+            if not ticker:
+                continue
+            if pending is not None:
+                pending.add(ticker)
+            else:
+                await graph_cache.invalidate(ticker)
+
+    def _runner(self, session: Optional[QueryRunner] = None):
+        """Reuse the caller's session or transaction, or open a session for this call."""
+        return nullcontext(session) if session is not None else self.session()
+
+    async def _write(
+        self,
+        query: str,
+        session: Optional[QueryRunner] = None,
+        **params: Any,
+    ) -> List[Any]:
+        """
+        Run one write query in a managed transaction and return its records.
+
+        A session (given or opened here) runs it through execute_write, which
+        retries transient errors; a transaction from bulk_tx() runs it as is.
+
+        Args:
+            query: Cypher write query
+            session: Session or transaction to reuse (default: a new session)
+            **params: Query parameters
+
+        Returns:
+            List of records
+        """
+        async def work(tx):
+            result = await tx.run(query, **params)
+            return [record async for record in result]
+
+        if session is None:
+            async with self.session() as own_session:
+                return await own_session.execute_write(work)
+        if isinstance(session, AsyncSession):
+            return await session.execute_write(work)
+        return await work(session)
+
+    async def _write_rows(
+        self,
+        query: str,
+        large_query: str,
+        rows: List[Dict[str, Any]],
+        session: Optional[QueryRunner] = None,
+    ) -> List[Any]:
+        """
+        Run a bulk UNWIND write and return one record per written row.
+
+        Up to BULK_WRITE_CHUNK_SIZE rows, or anything inside a caller's
+        transaction, runs as managed transactions of that many rows. Larger
+        inputs run large_query (CALL { ... } IN TRANSACTIONS) as one auto-commit
+        query, so the server commits every IN_TRANSACTIONS_ROWS rows instead of
+        holding one huge transaction.
+
+        Args:
+            query: UNWIND $rows AS r ... query
+            large_query: Same write wrapped in CALL { ... } IN TRANSACTIONS
+            rows: Query rows
+            session: Session or transaction to reuse (default: a new session)
+
+        Returns:
+            List of records
+        """
+        records: List[Any] = []
+        async with self._runner(session) as runner:
+            if len(rows) > BULK_WRITE_CHUNK_SIZE and not isinstance(runner, AsyncTransaction):
+                result = await runner.run(large_query, rows=rows)
+                return [record async for record in result]
+            for start in range(0, len(rows), BULK_WRITE_CHUNK_SIZE):
+                records.extend(await self._write(
+                    query, runner, rows=rows[start:start + BULK_WRITE_CHUNK_SIZE]
+                ))
+        return records
+
     async def _initialize_schema(self) -> None:
-        """Initialize Neo4j schema with constraints and indexes."""
-        constraints = [
-            "CREATE CONSTRAINT company_ticker IF NOT EXISTS FOR (c:Company) REQUIRE c.ticker IS UNIQUE",
-            "CREATE CONSTRAINT company_cik IF NOT EXISTS FOR (c:Company) REQUIRE c.cik IS UNIQUE",
-            "CREATE CONSTRAINT filing_accession IF NOT EXISTS FOR (f:Filing) REQUIRE f.accession_number IS UNIQUE",
-            "CREATE CONSTRAINT signal_id IF NOT EXISTS FOR (s:Signal) REQUIRE s.signal_id IS UNIQUE",
-            "CREATE CONSTRAINT signal_type_name IF NOT EXISTS FOR (st:SignalType) REQUIRE st.name IS UNIQUE",
-        ]
+        """
+        Initialize Neo4j schema with constraints and indexes.
 
-        indexes = [
-            "CREATE INDEX company_status IF NOT EXISTS FOR (c:Company) ON (c.status)",
-            "CREATE INDEX signal_type IF NOT EXISTS FOR (s:Signal) ON (s.type)",
-            "CREATE INDEX signal_date IF NOT EXISTS FOR (s:Signal) ON (s.date)",
-            "CREATE INDEX filing_type IF NOT EXISTS FOR (f:Filing) ON (f.filing_type)",
-        ]
+        Covers the keys used by this service (accession_number, signal_id).
+        The timeline graph written by Neo4jRepository keys on Filing.accession
+        and Signal.id; its constraints come from Neo4jRepository.ensure_schema(),
+        which the app lifespan runs right after connect().
+        """
+        constraints = {
+            "company_ticker": "CREATE CONSTRAINT company_ticker IF NOT EXISTS FOR (c:Company) REQUIRE c.ticker IS UNIQUE",
+            "company_cik": "CREATE CONSTRAINT company_cik IF NOT EXISTS FOR (c:Company) REQUIRE c.cik IS UNIQUE",
+            "filing_accession": "CREATE CONSTRAINT filing_accession IF NOT EXISTS FOR (f:Filing) REQUIRE f.accession_number IS UNIQUE",
+            "signal_id": "CREATE CONSTRAINT signal_id IF NOT EXISTS FOR (s:Signal) REQUIRE s.signal_id IS UNIQUE",
+            "signal_type_name": "CREATE CONSTRAINT signal_type_name IF NOT EXISTS FOR (st:SignalType) REQUIRE st.name IS UNIQUE",
+        }
+
+        indexes = {
+            "company_status": "CREATE INDEX company_status IF NOT EXISTS FOR (c:Company) ON (c.status)",
+            "signal_type": "CREATE INDEX signal_type IF NOT EXISTS FOR (s:Signal) ON (s.type)",
+            "signal_date": "CREATE INDEX signal_date IF NOT EXISTS FOR (s:Signal) ON (s.date)",
+            "filing_type": "CREATE INDEX filing_type IF NOT EXISTS FOR (f:Filing) ON (f.filing_type)",
+        }
 
         async with self.session() as session:
-            for constraint in constraints:
+            # Two reads on a warm start; DDL only for what is missing
+            existing = await self._schema_names(session)
+            missing = {
+                name: statement
+                for name, statement in {**constraints, **indexes}.items()
+                if name not in existing
+            }
+
+            # IF NOT EXISTS makes reruns no-ops, so any error here is real
+            # (e.g. duplicate tickers blocking a unique constraint)
+            for name, statement in missing.items():
                 try:
-                    await session.run(constraint)
+                    await session.run(statement)
                 except Exception as e:
-                    logger.debug(f"Constraint may already exist: {e}")
+                    logger.warning(f"Could not create {name}: {e}")
 
-            for index in indexes:
-                try:
-                    await session.run(index)
-                except Exception as e:
-                    logger.debug(f"Index may already exist: {e}")
+            if missing:
+                # Every MERGE/MATCH on these keys relies on the backing index
+                still_missing = sorted(set(missing) - await self._schema_names(session))
+                if still_missing:
+                    logger.warning(f"Neo4j schema missing after init: {still_missing}")
 
             # Initialize signal types
             await self._initialize_signal_types(session)
 
+            # Only writes for company/type pairs still missing the shortcut
+            await session.run(_Q_BACKFILL_SIGNAL_TYPE_EDGES)
+
         logger.info("Neo4j schema initialized")
 
+    async def _schema_names(self, session) -> Set[str]:
+        """Names of the existing constraints and indexes."""
+        names = set()
+        for statement in ("SHOW CONSTRAINTS YIELD name", "SHOW INDEXES YIELD name"):
+            result = await session.run(statement)
+            names.update([record["name"] async for record in result])
+        return names
+
     async def _initialize_signal_types(self, session) -> None:
         """Initialize SignalType nodes with weights."""
         signal_types = [
@@ -154,68 +693,65 @@ class Neo4jService:
         """
         await session.run(query, types=signal_types)
 
-    async def store_company(self, company_data: Dict[str, Any]) -> None:
+    async def store_company(
+        self,
+        company_data: Dict[str, Any],
+        *,
+        session: Optional[QueryRunner] = None,
+    ) -> None:
         """
         Store or update a company node.
 
         Args:
             company_data: Dict with ticker, cik, name, status, risk_score
-        """
-        query = """
-        MERGE (c:Company {ticker: $ticker})
-        ON CREATE SET c.created_at = datetime()
-        SET c.cik = $cik,
-            c.name = $name,
-            c.status = $status,
-            c.risk_score = $risk_score,
-            c.sector = $sector,
-            c.updated_at = datetime()
-        RETURN c
+            session: Session or transaction to reuse (default: a new session)
         """
         try:
-            async with self.session() as session:
-                await session.run(
-                    query,
-                    ticker=company_data.get("ticker"),
-                    cik=company_data.get("cik"),
-                    name=company_data.get("name", ""),
-                    status=company_data.get("status", "ACTIVE"),
-                    risk_score=company_data.get("risk_score", 0),
-                    sector=company_data.get("sector", ""),
-                )
+            records = await self._write(
+                _Q_STORE_COMPANY,
+                session,
+                ticker=company_data.get("ticker"),
+                props={
+                    "cik": company_data.get("cik"),
+                    "name": company_data.get("name", ""),
+                    "status": company_data.get("status", "ACTIVE"),
+                    "risk_score": company_data.get("risk_score", 0),
+                    "sector": company_data.get("sector", ""),
+                },
+            )
+            if records and records[0]["changed"]:
+                await self._invalidate(session, company_data.get("ticker"))
             logger.info(f"Stored company: {company_data.get('ticker')}")
         except Exception as e:
             logger.error(f"Error storing company: {e}")
             raise DatabaseError("Neo4j", f"Failed to store company: {e}")
 
-    async def store_filing(self, ticker: str, filing_data: Dict[str, Any]) -> None:
+    async def store_filing(
+        self,
+        ticker: str,
+        filing_data: Dict[str, Any],
+        *,
+        session: Optional[QueryRunner] = None,
+    ) -> None:
         """
         Store a filing node linked to a company.
 
         Args:
             ticker: Company ticker
             filing_data: Dict with accession_number, filing_type, filed_at, url
-        """
-        query = """
-        MATCH (c:Company {ticker: $ticker})
-        MERGE (f:Filing {accession_number: $accession_number})
-        SET f.filing_type = $filing_type,
-            f.filed_at = date($filed_at),
-            f.url = $url,
-            f.updated_at = datetime()
-        MERGE (c)-[:FILED]->(f)
-        RETURN f
+            session: Session or transaction to reuse (default: a new session)
         """
         try:
-            async with self.session() as session:
-                await session.run(
-                    query,
-                    ticker=ticker,
-                    accession_number=filing_data.get("accession_number"),
-                    filing_type=filing_data.get("filing_type"),
-                    filed_at=filing_data.get("filed_at"),
-                    url=filing_data.get("url", ""),
-                )
+            await self._write(
+                _Q_STORE_FILING,
+                session,
+                ticker=ticker,
+                accession_number=filing_data.get("accession_number"),
+                filing_type=filing_data.get("filing_type"),
+                filed_at=filing_data.get("filed_at"),
+                url=filing_data.get("url", ""),
+            )
+            await self._invalidate(session, ticker)
         except Exception as e:
             logger.error(f"Error storing filing: {e}")
             raise DatabaseError("Neo4j", f"Failed to store filing: {e}")
@@ -225,6 +761,8 @@ class Neo4jService:
         ticker: str,
         filing_accession: str,
         signal_data: Dict[str, Any],
+        *,
+        session: Optional[QueryRunner] = None,
     ) -> str:
         """
         Store a signal node linked to a filing.
@@ -233,71 +771,141 @@ class Neo4jService:
             ticker: Company ticker
             filing_accession: Filing accession number
             signal_data: Signal data dict
+            session: Session or transaction to reuse (default: a new session)
 
         Returns:
             Signal ID
         """
-        signal_id = signal_data.get("signal_id") or str(uuid.uuid4())
+        signal_id = signal_data.get("signal_id") or derive_signal_id(
+            ticker,
+            filing_accession,
+            signal_data.get("type"),
+            signal_data.get("date"),
+            signal_data.get("item_number"),
+            signal_data.get("person"),
+        )
 
-        query = """
-        MATCH (c:Company {ticker: $ticker})-[:FILED]->(f:Filing {accession_number: $filing_accession})
-        MERGE (s:Signal {signal_id: $signal_id})
-        SET s.type = $type,
-            s.severity = $severity,
-            s.confidence = $confidence,
-            s.evidence = $evidence,
-            s.date = CASE WHEN $date IS NOT NULL AND $date <> '' THEN date($date) ELSE null END,
-            s.item_number = $item_number,
-            s.person = $person,
-            s.detected_at = datetime()
-        MERGE (f)-[:CONTAINS]->(s)
-        WITH s
-        MATCH (st:SignalType {name: $type})
-        MERGE (s)-[:IS_TYPE]->(st)
-        RETURN s.signal_id as signal_id
-        """
         try:
-            async with self.session() as session:
-                result = await session.run(
-                    query,
-                    ticker=ticker,
-                    filing_accession=filing_accession,
-                    signal_id=signal_id,
-                    type=signal_data.get("type"),
-                    severity=signal_data.get("severity", 5),
-                    confidence=signal_data.get("confidence", 0.8),
-                    evidence=signal_data.get("evidence", ""),
-                    date=signal_data.get("date"),
-                    item_number=signal_data.get("item_number", ""),
-                    person=signal_data.get("person"),
-                )
-                record = await result.single()
-                return record["signal_id"] if record else signal_id
+            records = await self._write(
+                _Q_STORE_SIGNAL,
+                session,
+                ticker=ticker,
+                filing_accession=filing_accession,
+                signal_id=signal_id,
+                type=signal_data.get("type"),
+                severity=signal_data.get("severity", 5),
+                confidence=signal_data.get("confidence", 0.8),
+                evidence=signal_data.get("evidence", ""),
+                date=signal_data.get("date"),
+                item_number=signal_data.get("item_number", ""),
+                person=signal_data.get("person"),
+            )
+            await self._invalidate(session, ticker)
+            return records[0]["signal_id"] if records else signal_id
         except Exception as e:
             logger.error(f"Error storing signal: {e}")
             raise DatabaseError("Neo4j", f"Failed to store signal: {e}")
 
-    async def get_company_signals(self, ticker: str) -> List[Dict[str, Any]]:
-        """Get all signals for a company."""
-        query = """
-        MATCH (c:Company {ticker: $ticker})-[:FILED]->(f:Filing)-[:CONTAINS]->(s:Signal)
-        RETURN s.signal_id as id,
-               s.type as type,
-               s.severity as severity,
-               s.confidence as confidence,
-               s.evidence as evidence,
-               s.date as date,
-               s.item_number as item_number,
-               s.person as person,
-               f.accession_number as filing_accession,
-               f.filing_type as filing_type
-        ORDER BY s.date DESC
+    async def store_filings_bulk(
+        self,
+        rows: List[Dict[str, Any]],
+        *,
+        session: Optional[QueryRunner] = None,
+    ) -> int:
+        """
+        Store many filing nodes with bulk UNWIND writes.
+
+        Args:
+            rows: Dicts with ticker, accession_number, filing_type, filed_at, url
+            session: Session or transaction to reuse (default: a new session)
+
+        Returns:
+            Number of filings written
+        """
+        params = [
+            {
+                "ticker": row.get("ticker"),
+                "accession_number": row.get("accession_number"),
+                "filing_type": row.get("filing_type"),
+                "filed_at": row.get("filed_at"),
+                "url": row.get("url", ""),
+            }
+            for row in rows
+        ]
+        try:
+            records = await self._write_rows(
+                _Q_STORE_FILINGS, _Q_STORE_FILINGS_LARGE, params, session
+            )
+            stored = len(records)
+            await self._invalidate(session, *{row["ticker"] for row in params})
+            return stored
+        except Exception as e:
+            logger.error(f"Error storing filings: {e}")
+            raise DatabaseError("Neo4j", f"Failed to store filings: {e}")
+
+    async def store_signals_bulk(
+        self,
+        rows: List[Dict[str, Any]],
+        *,
+        session: Optional[QueryRunner] = None,
+    ) -> List[str]:
         """
+        Store many signal nodes with bulk UNWIND writes.
+
+        Each row's filing must already exist (see store_filings_bulk).
+
+        Args:
+            rows: Signal dicts that also carry ticker and filing_accession
+            session: Session or transaction to reuse (default: a new session)
+
+        Returns:
+            Signal IDs written
+        """
+        params = [
+            {
+                "ticker": row.get("ticker"),
+                "filing_accession": row.get("filing_accession"),
+                "signal_id": row.get("signal_id") or derive_signal_id(
+                    row.get("ticker"),
+                    row.get("filing_accession"),
+                    row.get("type"),
+                    row.get("date"),
+                    row.get("item_number"),
+                    row.get("person"),
+                ),
+                "type": row.get("type"),
+                "severity": row.get("severity", 5),
+                "confidence": row.get("confidence", 0.8),
+                "evidence": row.get("evidence", ""),
+                "date": row.get("date"),
+                "item_number": row.get("item_number", ""),
+                "person": row.get("person"),
+            }
+            for row in rows
+        ]
         try:
+            records = await self._write_rows(
+                _Q_STORE_SIGNALS, _Q_STORE_SIGNALS_LARGE, params, session
+            )
+            signal_ids = [record["signal_id"] for record in records]
+            await self._invalidate(session, *{row["ticker"] for row in params})
+            return signal_ids
+        except Exception as e:
+            logger.error(f"Error storing signals: {e}")
+            raise DatabaseError("Neo4j", f"Failed to store signals: {e}")
+
+    async def get_company_signals(self, ticker: str) -> List[Dict[str, Any]]:
+        """Get all signals for a company."""
+
+        async def fetch() -> List[Dict[str, Any]]:
             async with self.session() as session:
-                result = await session.run(query, ticker=ticker)
-                records = await result.data()
-                return records
+                result = await session.run(_Q_COMPANY_SIGNALS, ticker=ticker)
+                return await result.data()
+
+        try:
+            return await graph_cache.cached(
+                graph_cache_key("signals", ticker), GRAPH_CACHE_TTL_SECONDS, fetch
+            )
         except Exception as e:
             logger.error(f"Error getting company signals: {e}")
             return []
@@ -306,30 +914,21 @@ class Neo4jService:
         self, ticker: str, limit: int = 5
     ) -> List[Dict[str, Any]]:
         """Find companies with similar signal patterns based on shared signal types."""
-        query = """
-        MATCH (c1:Company {ticker: $ticker})-[:HAS_SIGNAL]->(s1:Signal)
-        WITH c1, COLLECT(DISTINCT s1.type) as target_signals
-        MATCH (c2:Company)-[:HAS_SIGNAL]->(s2:Signal)
-        WHERE c1 <> c2
-        WITH c1, target_signals, c2, COLLECT(DISTINCT s2.type) as other_signals
-        WITH c2,
-             [x IN target_signals WHERE x IN other_signals] as common,
-             target_signals, other_signals
-        WHERE SIZE(common) >= 2
-        RETURN c2.ticker as ticker,
-               c2.name as name,
-               c2.status as status,
-               SIZE(common) as common_signals,
-               common as common_signal_types,
-               SIZE(common) * 1.0 / SIZE(other_signals) as similarity_score
-        ORDER BY similarity_score DESC, common_signals DESC
-        LIMIT $limit
-        """
-        try:
+
+        async def fetch(rows: int) -> List[Dict[str, Any]]:
             async with self.session() as session:
-                result = await session.run(query, ticker=ticker, limit=limit)
-                records = await result.data()
-                return records
+                result = await session.run(_Q_SIMILAR_COMPANIES, ticker=ticker, limit=rows)
+                return await result.data()
+
+        try:
+            if limit > SIMILAR_CACHE_LIMIT:
+                return await fetch(limit)
+            records = await graph_cache.cached(
+                graph_cache_key("similar", ticker),
+                GRAPH_CACHE_TTL_SECONDS,
+                lambda: fetch(SIMILAR_CACHE_LIMIT),
+            )
+            return records[:limit]
         except Exception as e:
             logger.error(f"Error finding similar companies: {e}")
             return []
@@ -338,32 +937,17 @@ class Neo4jService:
         self, ticker: str
     ) -> List[Dict[str, Any]]:
         """Match signal patterns to known bankruptcy cases."""
-        query = """
-        MATCH (target:Company {ticker: $ticker})-[:FILED]->(:Filing)-[:CONTAINS]->(s:Signal)
-        WITH target, COLLECT(DISTINCT s.type) as target_signals
-
-        MATCH (bankrupt:Company {status: 'BANKRUPT'})-[:FILED]->(:Filing)-[:CONTAINS]->(bs:Signal)
-        WITH target, target_signals, bankrupt, COLLECT(DISTINCT bs.type) as bankrupt_signals
-
-        WITH target, bankrupt,
-             [x IN target_signals WHERE x IN bankrupt_signals] as common,
-             target_signals, bankrupt_signals
-        WHERE SIZE(common) >= 2
-
-        RETURN bankrupt.ticker as ticker,
-               bankrupt.name as name,
-               bankrupt.bankruptcy_date as bankruptcy_date,
-               SIZE(common) as matching_signals,
-               common as common_signal_types,
-               SIZE(common) * 1.0 / SIZE(bankrupt_signals) as similarity_score
-        ORDER BY similarity_score DESC
-        LIMIT 3
-        """
+
+        async def fetch() -> List[Dict[str, Any]]:
+            # LIMIT 3: one small pull instead of a fetch_size batch
+            async with self.session(fetch_size=10) as session:
+                result = await session.run(_Q_BANKRUPTCY_PATTERNS, ticker=ticker)
+                return await result.data()
+
         try:
-            async with self.session() as session:
-                result = await session.run(query, ticker=ticker)
-                records = await result.data()
-                return records
+            return await graph_cache.cached(
+                graph_cache_key("patterns", ticker), GRAPH_CACHE_TTL_SECONDS, fetch
+            )
         except Exception as e:
             logger.error(f"Error matching bankruptcy patterns: {e}")
             return []
@@ -375,6 +959,8 @@ class Neo4jService:
         name: str,
         bankruptcy_date: str,
         signals: List[Dict[str, Any]],
+        *,
+        session: Optional[QueryRunner] = None,
     ) -> None:
         """
         Add a known bankruptcy case for pattern matching.
@@ -385,6 +971,7 @@ class Neo4jService:
             name: Company name
             bankruptcy_date: Date of bankruptcy filing
             signals: List of signals that preceded the bankruptcy
+            session: Session or transaction to reuse (default: a new session)
         """
         # Store company as bankrupt
         await self.store_company({
@@ -393,15 +980,14 @@ class Neo4jService:
             "name": name,
             "status": "BANKRUPT",
             "risk_score": 100,
-        })
+        }, session=session)
 
         # Update with bankruptcy date
         query = """
         MATCH (c:Company {ticker: $ticker})
         SET c.bankruptcy_date = date($bankruptcy_date)
         """
-        async with self.session() as session:
-            await session.run(query, ticker=ticker, bankruptcy_date=bankruptcy_date)
+        await self._write(query, session, ticker=ticker, bankruptcy_date=bankruptcy_date)
 
         logger.info(f"Added known bankruptcy case: {ticker}")
 
@@ -423,12 +1009,10 @@ class Neo4jService:
         RETURN count(r) as relationships_created
         """
         try:
-            async with self.session() as session:
-                result = await session.run(query, ticker=ticker)
-                record = await result.single()
-                count = record["relationships_created"] if record else 0
-                logger.info(f"Built signal chain for {ticker}: {count} NEXT relationships")
-                return count
+            records = await self._write(query, ticker=ticker)
+            count = records[0]["relationships_created"] if records else 0
+            logger.info(f"Built signal chain for {ticker}: {count} NEXT relationships")
+            return count
         except Exception as e:
             logger.error(f"Error building signal chain: {e}")
             return 0
@@ -568,24 +1152,27 @@ class Neo4jService:
             Number of signals stored
         """
         try:
-            # Store company first
-            await self.store_company(company_data)
+            # Signals without a filing accession have nothing to attach to
+            linked = [signal for signal in signals if signal.get("filing_accession")]
 
-            stored = 0
-            for signal in signals:
-                filing_accession = signal.get("filing_accession", "")
+            async with self.bulk_tx() as (_, tx):
+                # Store company first
+                await self.store_company(company_data, session=tx)
 
-                # Store filing if we have accession
-                if filing_accession:
-                    await self.store_filing(ticker, {
-                        "accession_number": filing_accession,
+                await self.store_filings_bulk([
+                    {
+                        "ticker": ticker,
+                        "accession_number": signal["filing_accession"],
                         "filing_type": signal.get("filing_type", "8-K"),
                         "filed_at": signal.get("date", ""),
                         "url": signal.get("filing_url", ""),
-                    })
-
-                    # Store signal linked to filing
-                    await self.store_signal(ticker, filing_accession, {
+                    }
+                    for signal in linked
+                ], session=tx)
+                await self.store_signals_bulk([
+                    {
+                        "ticker": ticker,
+                        "filing_accession": signal["filing_accession"],
                         "signal_id": signal.get("signal_id") or signal.get("id"),
                         "type": signal.get("type"),
                         "severity": signal.get("severity", 5),
@@ -594,8 +1181,10 @@ class Neo4jService:
                         "date": signal.get("date"),
                         "item_number": signal.get("item_number", ""),
                         "person": signal.get("person"),
-                    })
-                    stored += 1
+                    }
+                    for signal in linked
+                ], session=tx)
+            stored = len(linked)
 
             # Build signal chain after all signals are stored
             if stored > 1:
@@ -4,23 +4,56 @@ Facts-only approach: stores signals with evidence and filing context.
 No scoring, no risk predictions.
 """
 
+import asyncio
+import re
+from collections import defaultdict
 from typing import Dict, Any, List, Optional
 from uuid import uuid4
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from app.repositories.neo4j_repository import neo4j_repository
+from app.services.cache import graph_cache
 from app.models.timeline_models import CompanyNode, SignalNode, FilingNode
 from app.services.supabase_service import supabase_service
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# A going concern not repeated for ~15 months is considered removed
+# (10-K is annual, so 15 months gives buffer)
+GOING_CONCERN_REMOVED_DAYS = 450
+
+# 8-K items and summary keywords used to categorize routine filings
+_DISTRESS_ITEMS = frozenset({"4.02", "2.05", "2.06", "5.02"})
+_CORPORATE_ITEMS = frozenset({"1.01", "1.02", "2.01", "3.02"})
+_CORPORATE_KEYWORDS = re.compile(
+    "acquisition|merger|split|financing|offering", re.IGNORECASE
+)
+
+# Routine filings of one company written at once (each is its own small write)
+ROUTINE_SYNC_CONCURRENCY = 8
+
 
 class Neo4jSyncService:
     """Service for syncing analysis results to Neo4j timeline graph."""
 
     def __init__(self):
         self.repo = neo4j_repository
+        self._ticker_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._locks_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ticker_lock(self, ticker: str) -> asyncio.Lock:
+        """
+        Lock serializing syncs of one company; different tickers run concurrently.
+
+        Two overlapping syncs of the same company would race on its NEXT chain
+        and stats. Locks are per event loop (Celery tasks each run their own).
+        """
+        loop = asyncio.get_running_loop()
+        if self._locks_loop is not loop:
+            self._ticker_locks = defaultdict(asyncio.Lock)
+            self._locks_loop = loop
+        return self._ticker_locks[ticker]
 
     async def sync_from_analysis(
         self,
@@ -56,21 +89,21 @@ class Neo4jSyncService:
             going_concern_last_seen=gc_status.get("last_seen"),
         )
 
-        await self.repo.upsert_company(company_node)
-        logger.info(f"Upserted company {ticker} with going_concern_status={gc_status['status']}")
-
-        # 3. Create signal nodes with filings
-        signals_created = 0
+        # 3. Create signal nodes with filings (one batched write)
+        items = []
         for signal_data in signals:
             if not signal_data.get("type"):
                 continue
 
+            # Shared by the signal and its filing
+            fiscal_year = signal_data.get("fiscal_year") or self._extract_year(signal_data.get("date"))
+
             signal_node = SignalNode(
                 id=signal_data.get("signal_id") or signal_data.get("id") or str(uuid4()),
                 type=signal_data["type"],
                 date=signal_data.get("date", ""),
                 evidence=signal_data.get("evidence", ""),
-                fiscal_year=signal_data.get("fiscal_year") or self._extract_year(signal_data.get("date", "")),
+                fiscal_year=fiscal_year,
             )
 
             filing_node = FilingNode(
@@ -79,24 +112,23 @@ class Neo4jSyncService:
                 item=signal_data.get("item_number"),
                 date=signal_data.get("filing_date") or signal_data.get("date", ""),
                 url=signal_data.get("filing_url", ""),
-                fiscal_year=signal_data.get("fiscal_year") or self._extract_year(signal_data.get("date", "")),
+                fiscal_year=fiscal_year,
                 category="DISTRESS",
                 summary=f"{signal_data['type']} detected",
                 has_going_concern=signal_data["type"] == "GOING_CONCERN",
                 has_material_weakness=signal_data["type"] == "MATERIAL_WEAKNESS",
             )
 
-            success = await self.repo.create_signal(ticker, signal_node, filing_node)
-            if success:
-                signals_created += 1
+            items.append((signal_node, filing_node))
 
-        # 4. Build signal chain (NEXT relationships)
-        chain_count = 0
-        if signals_created > 1:
-            chain_count = await self.repo.build_signal_chain(ticker)
+        # 4-5. Company, signals, chain splice (NEXT relationships) and stats
+        # commit together in one transaction
+        async with self._ticker_lock(ticker):
+            signals_created, chain_count = await self.repo.sync_all(company_node, items)
+        logger.info(f"Upserted company {ticker} with going_concern_status={gc_status['status']}")
 
-        # 5. Update company stats
-        await self.repo.update_company_signal_stats(ticker)
+        # find_similar_companies reads the HAS_SIGNAL edges written above
+        await graph_cache.invalidate(ticker)
 
         result = {
             "ticker": ticker,
@@ -154,13 +186,18 @@ class Neo4jSyncService:
         Returns:
             Number of filings synced
         """
-        count = 0
-        for filing_data in filings:
-            # Determine category based on filing content
-            category = self._categorize_filing(filing_data)
-            if await self.sync_filing(ticker, filing_data, category):
-                count += 1
-        return count
+        sem = asyncio.Semaphore(ROUTINE_SYNC_CONCURRENCY)
+
+        async def sync_one(filing_data: Dict[str, Any]) -> bool:
+            async with sem:
+                # Determine category based on filing content
+                category = self._categorize_filing(filing_data)
+                return await self.sync_filing(ticker, filing_data, category)
+
+        # Each filing is its own node; only other syncs of this company wait
+        async with self._ticker_lock(ticker.upper()):
+            results = await asyncio.gather(*(sync_one(f) for f in filings))
+        return sum(1 for synced in results if synced)
 
     async def sync_from_supabase(self, ticker: str) -> Dict[str, Any]:
         """
@@ -204,77 +241,51 @@ class Neo4jSyncService:
         - first_seen: date when first appeared
         - last_seen: date when last appeared
         """
-        gc_signals = [s for s in signals if s.get("type") == "GOING_CONCERN"]
-
-        if not gc_signals:
-            return {"status": "NEVER"}
-
-        # Sort by date
-        gc_signals_sorted = sorted(
-            [s for s in gc_signals if s.get("date")],
-            key=lambda x: x["date"]
-        )
-
-        if not gc_signals_sorted:
+        gc_dates = [
+            s["date"] for s in signals
+            if s.get("type") == "GOING_CONCERN" and s.get("date")
+        ]
+        if not gc_dates:
             return {"status": "NEVER"}
 
-        first_seen = gc_signals_sorted[0]["date"]
-        last_seen = gc_signals_sorted[-1]["date"]
+        # ISO date strings order chronologically, so min/max replace the sort
+        first_seen = min(gc_dates)[:10]
+        last_seen = max(gc_dates)[:10]
 
         # Determine if going concern is still active
-        # If last going concern was more than 15 months ago, likely removed
-        # (10-K is annual, so 15 months gives buffer)
+        status = "ACTIVE"
         try:
-            last_gc_date = datetime.fromisoformat(last_seen.replace("Z", "+00:00").replace("T", " ").split("+")[0].split(" ")[0])
-            days_since = (datetime.now() - last_gc_date).days
-
-            if days_since > 450:  # ~15 months
-                return {
-                    "status": "REMOVED",
-                    "first_seen": first_seen[:10] if first_seen else None,
-                    "last_seen": last_seen[:10] if last_seen else None,
-                }
-            else:
-                return {
-                    "status": "ACTIVE",
-                    "first_seen": first_seen[:10] if first_seen else None,
-                    "last_seen": last_seen[:10] if last_seen else None,
-                }
+            days_since = (date.today() - date.fromisoformat(last_seen)).days
+            if days_since > GOING_CONCERN_REMOVED_DAYS:
+                status = "REMOVED"
         except (ValueError, TypeError) as e:
             logger.warning(f"Error parsing going concern dates: {e}")
-            return {
-                "status": "ACTIVE",
-                "first_seen": first_seen[:10] if first_seen else None,
-                "last_seen": last_seen[:10] if last_seen else None,
-            }
+
+        return {"status": status, "first_seen": first_seen, "last_seen": last_seen}
 
     def _categorize_filing(self, filing_data: Dict[str, Any]) -> str:
         """Categorize a filing based on its content."""
         item = filing_data.get("item") or filing_data.get("item_number", "")
-        summary = (filing_data.get("summary") or "").lower()
 
         # Distress indicators
-        distress_items = ["4.02", "2.05", "2.06", "5.02"]
-        if item in distress_items:
+        if item in _DISTRESS_ITEMS:
             return "DISTRESS"
 
         # Corporate action indicators
-        corporate_items = ["1.01", "1.02", "2.01", "3.02"]
-        corporate_keywords = ["acquisition", "merger", "split", "financing", "offering"]
-        if item in corporate_items or any(kw in summary for kw in corporate_keywords):
+        if item in _CORPORATE_ITEMS or _CORPORATE_KEYWORDS.search(
+            filing_data.get("summary") or ""
+        ):
             return "CORPORATE_ACTION"
 
         # Default to routine
         return "ROUTINE"
 
-    def _extract_year(self, date_str: str) -> int:
-        """Extract year from date string."""
-        if not date_str:
-            return datetime.now().year
-        try:
-            return int(date_str[:4])
-        except (ValueError, IndexError):
-            return datetime.now().year
+    def _extract_year(self, date_str: Optional[str]) -> int:
+        """Extract year from date string (current year if it doesn't start with one)."""
+        year = (date_str or "")[:4]
+        if len(year) == 4 and year.isascii() and year.isdigit():
+            return int(year)
+        return datetime.now().year
 
 
 # Singleton instance
@@ -5,8 +5,17 @@ Stores: Users, Cached analyses, Filing chunks, Embeddings
 
 from supabase import create_client, Client
 from typing import Dict, Any, Optional, List
-import json
-from datetime import datetime, timedelta
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from uuid import UUID
+
+import asyncpg
+import numpy as np
+import orjson
+from cachetools import TTLCache
+from pgvector import HalfVector
+from pgvector.asyncpg import register_vector
 
 from app.config import get_settings
 from app.core.logging import get_logger
@@ -15,6 +24,107 @@ from app.core.exceptions import DatabaseError
 logger = get_logger(__name__)
 settings = get_settings()
 
+# In-process cache of completed analyses per ticker. Writes made in this
+# process invalidate it; writes from other processes show up within the TTL.
+ANALYSIS_CACHE_SIZE = 4096
+ANALYSIS_CACHE_TTL_SECONDS = 60
+
+# Threads running blocking supabase-py requests off the event loop
+SUPABASE_REST_THREADS = 32
+
+# Prepared statements kept per pooled connection
+DB_STATEMENT_CACHE_SIZE = 256
+
+_SQL_LATEST_ANALYSIS = """
+SELECT * FROM analyses
+WHERE ticker = $1 AND expires_at >= now() AND status = 'completed'
+ORDER BY created_at DESC
+LIMIT 1
+"""
+
+_SQL_ANALYSIS_BY_ID = "SELECT * FROM analyses WHERE id = $1 LIMIT 1"
+
+_SQL_INSERT_ANALYSIS = """
+INSERT INTO analyses (ticker, cik, company_name, status, signal_count, result, expires_at)
+VALUES ($1, $2, $3, 'completed', $4, $5, now() + make_interval(days => $6))
+RETURNING id
+"""
+
+# Unchanged values pass NULL and keep the column as is
+_SQL_UPDATE_ANALYSIS = """
+UPDATE analyses
+SET status = $2,
+    updated_at = now(),
+    message = COALESCE($3, message),
+    result = COALESCE($4, result),
+    signal_count = COALESCE($5, signal_count)
+WHERE id = $1
+"""
+
+# filing_chunks.embedding is halfvec(1536): fp16 halves row size and HNSW index
+# memory, well within the precision cosine ranking needs
+EMBEDDING_DTYPE = np.float16
+
+# Columns streamed by COPY in store_filing_chunks_batch, in record order
+_FILING_CHUNK_COPY_COLUMNS = [
+    "ticker", "cik", "accession_number", "filing_type",
+    "item_number", "content", "embedding", "chunk_index",
+]
+
+# Vector search functions; the query embedding is bound as binary halfvec
+_SQL_MATCH_CHUNKS = """
+SELECT * FROM match_filing_chunks(
+    query_embedding => $1::halfvec, match_threshold => $2, match_count => $3
+)
+"""
+
+_SQL_MATCH_CHUNKS_FOR_TICKER = """
+SELECT * FROM match_filing_chunks(
+    query_embedding => $1::halfvec, match_threshold => $2, match_count => $3,
+    filter_ticker => $4
+)
+"""
+
+_SQL_MATCH_CHUNKS_BY_ACCESSION = """
+SELECT * FROM match_filing_chunks_by_accession(
+    query_embedding => $1::halfvec, match_accession => $2,
+    match_threshold => $3, match_count => $4
+)
+"""
+
+_SQL_FILING_CHUNKS = """
+SELECT * FROM filing_chunks
+WHERE ticker = $1 AND ($2::text IS NULL OR accession_number = $2)
+ORDER BY created_at DESC
+"""
+
+
+def _record_to_dict(record: asyncpg.Record) -> Dict[str, Any]:
+    """Convert a row to a JSON-friendly dict (ids and timestamps as strings, vectors as lists)."""
+    row = dict(record)
+    for key, value in row.items():
+        if isinstance(value, UUID):
+            row[key] = str(value)
+        elif isinstance(value, (datetime, date)):
+            row[key] = value.isoformat()
+        elif isinstance(value, np.ndarray):
+            row[key] = value.tolist()
+        elif isinstance(value, HalfVector):
+            row[key] = value.to_list()
+    return row
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Register codecs: jsonb (analyses.result) via orjson, pgvector's binary vector format."""
+    await register_vector(conn, schema=settings.supabase_db_vector_schema)
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=lambda value: orjson.dumps(value).decode(),
+        decoder=orjson.loads,
+        schema="pg_catalog",
+        format="text",
+    )
+
 
 class SupabaseService:
     """
@@ -29,6 +139,16 @@ class SupabaseService:
     def __init__(self):
         self._client: Optional[Client] = None
         self._initialized = False
+        self._pool: Optional[asyncpg.Pool] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=SUPABASE_REST_THREADS, thread_name_prefix="supabase"
+        )
+        self._pool_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._analysis_cache: TTLCache = TTLCache(
+            maxsize=ANALYSIS_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL_SECONDS
+        )
+        # Analysis reads in progress by ticker, shared by concurrent callers
+        self._analysis_inflight: Dict[str, asyncio.Task] = {}
 
     def connect(self) -> None:
         """Initialize Supabase client."""
@@ -50,10 +170,52 @@ class SupabaseService:
             self.connect()
         return self._client
 
+    async def _get_pool(self) -> asyncpg.Pool:
+        """Connection pool bound to the running event loop (Celery tasks each run their own loop)."""
+        loop = asyncio.get_running_loop()
+        if self._pool is None or self._pool_loop is not loop:
+            if self._pool is not None:
+                # The previous loop is gone, its connections can only be dropped
+                self._pool.terminate()
+            try:
+                self._pool = await asyncpg.create_pool(
+                    settings.supabase_db_url,
+                    min_size=settings.supabase_db_pool_min_size,
+                    max_size=settings.supabase_db_pool_max_size,
+                    statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+                    init=_init_connection,
+                )
+            except Exception as e:
+                self._pool = None
+                logger.error(f"Supabase Postgres pool error: {e}")
+                raise DatabaseError("Supabase", str(e))
+            self._pool_loop = loop
+        return self._pool
+
+    async def close(self) -> None:
+        """Close the Postgres connection pool."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            self._pool_loop = None
+
+    async def _execute(self, query: Any) -> Any:
+        """
+        Run a supabase-py query builder's blocking execute() in the thread pool.
+
+        Args:
+            query: Built query (table/rpc call chain without .execute())
+
+        Returns:
+            The query's APIResponse
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, query.execute)
+
     async def health_check(self) -> bool:
         """Check if Supabase connection is healthy."""
         try:
-            self.client.table("analyses").select("id").limit(1).execute()
+            await self._execute(self.client.table("analyses").select("id").limit(1))
             return True
         except Exception as e:
             logger.warning(f"Supabase health check failed: {e}")
@@ -65,28 +227,49 @@ class SupabaseService:
         """
         Get cached analysis for a ticker if it exists and is not expired.
 
+        Served from the in-process TTL cache when possible; concurrent misses
+        for one ticker share a single Supabase read (single-flight).
+
         Args:
             ticker: Stock ticker symbol
 
         Returns:
             Cached analysis or None
         """
+        ticker = ticker.upper()
+        if analysis := self._analysis_cache.get(ticker):
+            return analysis
+
+        loop = asyncio.get_running_loop()
+        task = self._analysis_inflight.get(ticker)
+        # A task left over from another loop (earlier Celery task) can't be awaited here
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._load_analysis(ticker))
+            self._analysis_inflight[ticker] = task
+
+            def forget(done: asyncio.Task) -> None:
+                if self._analysis_inflight.get(ticker) is done:
+                    del self._analysis_inflight[ticker]
+
+            task.add_done_callback(forget)
+
+        # Shielded: one caller being cancelled must not cancel the shared read
+        return await asyncio.shield(task)
+
+    async def _load_analysis(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Fetch a ticker's analysis and keep it in the TTL cache if found."""
+        analysis = await self._fetch_cached_analysis(ticker)
+        if analysis:
+            self._analysis_cache[ticker] = analysis
+        return analysis
+
+    async def _fetch_cached_analysis(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Read the latest unexpired completed analysis for a ticker from Supabase."""
         try:
-            result = (
-                self.client.table("analyses")
-                .select("*")
-                .eq("ticker", ticker.upper())
-                .gte("expires_at", datetime.utcnow().isoformat())
-                .eq("status", "completed")
-                .order("created_at", desc=True)
-                .limit(1)
-                .execute()
-            )
-            if result.data:
-                analysis = result.data[0]
-                # Parse JSON result if stored as string
-                if isinstance(analysis.get("result"), str):
-                    analysis["result"] = json.loads(analysis["result"])
+            pool = await self._get_pool()
+            record = await pool.fetchrow(_SQL_LATEST_ANALYSIS, ticker.upper())
+            if record:
+                analysis = _record_to_dict(record)
                 logger.info(f"Cache hit for {ticker}")
                 return analysis
             return None
@@ -97,17 +280,10 @@ class SupabaseService:
     async def get_analysis_by_id(self, analysis_id: str) -> Optional[Dict[str, Any]]:
         """Get analysis by ID."""
         try:
-            result = (
-                self.client.table("analyses")
-                .select("*")
-                .eq("id", analysis_id)
-                .limit(1)
-                .execute()
-            )
-            if result.data:
-                analysis = result.data[0]
-                if isinstance(analysis.get("result"), str):
-                    analysis["result"] = json.loads(analysis["result"])
+            pool = await self._get_pool()
+            record = await pool.fetchrow(_SQL_ANALYSIS_BY_ID, UUID(analysis_id))
+            if record:
+                analysis = _record_to_dict(record)
                 return analysis
             return None
         except Exception as e:
@@ -136,18 +312,19 @@ class SupabaseService:
             Analysis ID
         """
         try:
-            data = {
-                "ticker": ticker.upper(),
-                "cik": cik,
-                "company_name": company_name,
-                "status": "completed",
-                "signal_count": result.get("signal_count", 0),
-                "result": json.dumps(result),
-                "expires_at": (datetime.utcnow() + timedelta(days=ttl_days)).isoformat(),
-            }
-
-            response = self.client.table("analyses").insert(data).execute()
-            analysis_id = response.data[0]["id"]
+            pool = await self._get_pool()
+            analysis_id = str(
+                await pool.fetchval(
+                    _SQL_INSERT_ANALYSIS,
+                    ticker.upper(),
+                    cik,
+                    company_name,
+                    result.get("signal_count", 0),
+                    result,
+                    ttl_days,
+                )
+            )
+            self._analysis_cache.pop(ticker.upper(), None)
             logger.info(f"Cached analysis for {ticker}: {analysis_id}")
             return analysis_id
         except Exception as e:
@@ -163,17 +340,17 @@ class SupabaseService:
     ) -> None:
         """Update the status of an analysis (facts only, no scores)."""
         try:
-            data = {
-                "status": status,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-            if message:
-                data["message"] = message
-            if result:
-                data["result"] = json.dumps(result)
-                data["signal_count"] = result.get("signal_count", 0)
-
-            self.client.table("analyses").update(data).eq("id", analysis_id).execute()
+            pool = await self._get_pool()
+            await pool.execute(
+                _SQL_UPDATE_ANALYSIS,
+                UUID(analysis_id),
+                status,
+                message or None,
+                result or None,
+                result.get("signal_count", 0) if result else None,
+            )
+            # The row's ticker isn't known here and updates are rare, drop everything
+            self._analysis_cache.clear()
         except Exception as e:
             logger.error(f"Error updating analysis status: {e}")
 
@@ -218,7 +395,7 @@ class SupabaseService:
                 "chunk_index": chunk_index,
             }
 
-            response = self.client.table("filing_chunks").insert(data).execute()
+            response = await self._execute(self.client.table("filing_chunks").insert(data))
             return response.data[0]["id"]
         except Exception as e:
             logger.error(f"Error storing filing chunk: {e}")
@@ -249,21 +426,26 @@ class SupabaseService:
             return 0
 
         try:
-            data = [
-                {
-                    "ticker": ticker.upper(),
-                    "cik": cik,
-                    "accession_number": accession_number,
-                    "filing_type": filing_type,
-                    "item_number": chunk.get("item_number", ""),
-                    "content": chunk["content"],
-                    "embedding": chunk["embedding"],
-                    "chunk_index": i,
-                }
+            ticker = ticker.upper()
+            records = [
+                (
+                    ticker,
+                    cik,
+                    accession_number,
+                    filing_type,
+                    chunk.get("item_number", ""),
+                    chunk["content"],
+                    np.asarray(chunk["embedding"], dtype=EMBEDDING_DTYPE),
+                    i,
+                )
                 for i, chunk in enumerate(chunks)
             ]
 
-            self.client.table("filing_chunks").insert(data).execute()
+            # Binary COPY, embeddings go over the wire as packed halves
+            pool = await self._get_pool()
+            await pool.copy_records_to_table(
+                "filing_chunks", records=records, columns=_FILING_CHUNK_COPY_COLUMNS
+            )
             logger.info(f"Stored {len(chunks)} chunks for {accession_number}")
             return len(chunks)
         except Exception as e:
@@ -290,17 +472,15 @@ class SupabaseService:
             List of similar chunks with similarity scores
         """
         try:
-            # Call the match_filing_chunks RPC function
-            params = {
-                "query_embedding": embedding,
-                "match_threshold": threshold,
-                "match_count": limit,
-            }
+            pool = await self._get_pool()
+            query_embedding = np.asarray(embedding, dtype=EMBEDDING_DTYPE)
             if ticker:
-                params["filter_ticker"] = ticker.upper()
-
-            result = self.client.rpc("match_filing_chunks", params).execute()
-            return result.data or []
+                records = await pool.fetch(
+                    _SQL_MATCH_CHUNKS_FOR_TICKER, query_embedding, threshold, limit, ticker.upper()
+                )
+            else:
+                records = await pool.fetch(_SQL_MATCH_CHUNKS, query_embedding, threshold, limit)
+            return [_record_to_dict(record) for record in records]
         except Exception as e:
             logger.error(f"Error searching similar chunks: {e}")
             return []
@@ -326,17 +506,15 @@ class SupabaseService:
         """
         try:
             # Use pgvector similarity search filtered by accession number
-            result = self.client.rpc(
-                'match_filing_chunks_by_accession',
-                {
-                    'query_embedding': query_embedding,
-                    'match_accession': filing_accession,
-                    'match_threshold': similarity_threshold,
-                    'match_count': top_k,
-                }
-            ).execute()
-
-            return result.data or []
+            pool = await self._get_pool()
+            records = await pool.fetch(
+                _SQL_MATCH_CHUNKS_BY_ACCESSION,
+                np.asarray(query_embedding, dtype=EMBEDDING_DTYPE),
+                filing_accession,
+                similarity_threshold,
+                top_k,
+            )
+            return [_record_to_dict(record) for record in records]
 
         except Exception as e:
             logger.error(f"Semantic search in filing error: {e}")
@@ -383,10 +561,12 @@ class SupabaseService:
                 for i, chunk in enumerate(chunks)
             ]
 
-            self.client.table('filing_chunks').upsert(
-                records,
-                on_conflict='accession_number,chunk_index'
-            ).execute()
+            await self._execute(
+                self.client.table('filing_chunks').upsert(
+                    records,
+                    on_conflict='accession_number,chunk_index'
+                )
+            )
 
             logger.info(f"Stored {len(records)} chunks for {filing_accession}")
             return True
@@ -406,12 +586,11 @@ class SupabaseService:
             True if chunks exist, False otherwise
         """
         try:
-            result = (
+            result = await self._execute(
                 self.client.table("filing_chunks")
                 .select("id")
                 .eq("accession_number", accession_number)
                 .limit(1)
-                .execute()
             )
             return len(result.data) > 0
         except Exception as e:
@@ -434,16 +613,11 @@ class SupabaseService:
             List of chunks
         """
         try:
-            query = (
-                self.client.table("filing_chunks")
-                .select("*")
-                .eq("ticker", ticker.upper())
+            pool = await self._get_pool()
+            records = await pool.fetch(
+                _SQL_FILING_CHUNKS, ticker.upper(), accession_number or None
             )
-            if accession_number:
-                query = query.eq("accession_number", accession_number)
-
-            result = query.order("created_at", desc=True).execute()
-            return result.data or []
+            return [_record_to_dict(record) for record in records]
         except Exception as e:
             logger.error(f"Error getting filing chunks: {e}")
             return []
@@ -472,7 +646,7 @@ class SupabaseService:
             if accession_number:
                 query = query.eq("accession_number", accession_number)
 
-            result = query.execute()
+            result = await self._execute(query)
             count = len(result.data) if result.data else 0
             logger.info(f"Deleted {count} chunks for {ticker}")
             return count
@@ -485,12 +659,11 @@ class SupabaseService:
     async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID."""
         try:
-            result = (
+            result = await self._execute(
                 self.client.table("users")
                 .select("*")
                 .eq("id", user_id)
                 .limit(1)
-                .execute()
             )
             return result.data[0] if result.data else None
         except Exception as e:
@@ -213,6 +213,21 @@ def run_analysis_task(self, job_id: str, ticker: str) -> Dict[str, Any]:
         raise
 
 
+@celery_app.task(name="refresh_recent_filings")
+def refresh_recent_filings_task() -> int:
+    """Nightly: move the :RecentFiling label to match the 12-month window."""
+    from app.repositories.neo4j_repository import neo4j_repository
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        if not neo4j_service._initialized:
+            loop.run_until_complete(neo4j_service.connect())
+        return loop.run_until_complete(neo4j_repository.refresh_recent_filings())
+    finally:
+        loop.close()
+
+
 def cancel_analysis_task(job_id: str) -> bool:
     """
     Cancel a running analysis task.
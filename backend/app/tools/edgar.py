@@ -117,7 +117,7 @@ class SECEdgarClient:
             # Acquire rate limit token
             wait_time = sec_edgar_limiter.acquire()
             if wait_time > 0:
-                logger.debug(f"Rate limited, waited {wait_time:.2f}s")
+                logger.debug("Rate limited, waited %.2fs", wait_time)
 
             try:
                 response = requests.get(url, headers=self.headers, timeout=30)
@@ -19,6 +19,14 @@ JUNK_PATTERNS = [
     r'^[A-Z_]+$',                      # ALL_CAPS_CONSTANTS
 ]
 
+# All junk patterns as one alternation, tried in list order in a single match
+# call; the named group that matched identifies the pattern for the reason
+_JUNK_REGEX = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(JUNK_PATTERNS))
+)
+_SPECIAL_CHARS = re.compile(r'[<>{}[\]|\\]')
+_NATURAL_LANGUAGE = re.compile(r'[A-Z].*[a-z]')
+
 
 def is_valid_evidence(evidence: str) -> Tuple[bool, str]:
     """
@@ -45,17 +53,17 @@ def is_valid_evidence(evidence: str) -> Tuple[bool, str]:
         return False, f"Too few words ({len(words)} < {MIN_WORD_COUNT})"
 
     # Junk pattern check
-    for pattern in JUNK_PATTERNS:
-        if re.match(pattern, evidence):
-            return False, f"Matches junk pattern: {pattern}"
+    junk = _JUNK_REGEX.match(evidence)
+    if junk:
+        return False, f"Matches junk pattern: {JUNK_PATTERNS[int(junk.lastgroup[1:])]}"
 
     # Check for excessive special characters (likely XML/code)
-    special_char_ratio = len(re.findall(r'[<>{}[\]|\\]', evidence)) / len(evidence)
+    special_char_ratio = len(_SPECIAL_CHARS.findall(evidence)) / len(evidence)
     if special_char_ratio > 0.1:
         return False, "Too many special characters (likely XML/code)"
 
     # Check it contains actual sentences (has periods and capital letters)
-    if not re.search(r'[A-Z].*[a-z]', evidence):
+    if not _NATURAL_LANGUAGE.search(evidence):
         return False, "Doesn't appear to be natural language"
 
     return True, ""
@@ -10,20 +10,83 @@ import json
 
 from app.config import get_settings
 from app.prompts.extraction import (
-    EXTRACT_8K_PROMPT,
-    EXTRACT_10K_GOING_CONCERN_PROMPT,
-    EXTRACT_10K_ITEMS_PROMPT,
+    build_8k_messages,
+    EXTRACT_8K_PROMPT_VERSION,
+    EXTRACT_10K_GOING_CONCERN_PROMPT_VERSION,
+    EXTRACT_10K_ITEMS_PROMPT_VERSION,
+    EXTRACT_10K_GOING_CONCERN_TEMPLATE,
+    EXTRACT_10K_ITEMS_TEMPLATE,
     SIGNAL_TYPES,
 )
+from app.prompts._cache import extraction_cache, extraction_cache_key
+from app.prompts._sizing import filing_text_budget, fit_filing_text
+from app.prompts.schemas import GOING_CONCERN_FORMAT, SIGNAL_EXTRACTION_FORMAT
 from app.tools.edgar import edgar_client, Filing
 from app.tools.embeddings import embedding_service
 from app.services.supabase_service import supabase_service
 from app.core.logging import get_logger
+from app.core.rate_limiter import openai_limiter
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
+# Searched in priority order over the whole lowercased 10-K. Longer phrases such
+# as "continue as a going concern" contain "going concern", so they can never
+# match when it does not and would only add full-text scans.
+GOING_CONCERN_KEYWORDS = ("going concern", "substantial doubt")
+_GOING_CONCERN_KEYWORD_BYTES = tuple(k.encode() for k in GOING_CONCERN_KEYWORDS)
+
+
+def find_going_concern_keyword(text: str) -> Tuple[str, int]:
+    """
+    Find the first going concern keyword (in priority order) in filing text.
+
+    Lowercases a UTF-8 bytes copy: bytes.lower() is ASCII-only, which is all
+    the keywords need, and skips the per-codepoint Unicode case mapping that
+    str.lower() does on non-ASCII text.
+
+    Args:
+        text: Clean filing text
+
+    Returns:
+        (keyword, character offset in text), or ("", -1) if none found
+    """
+    text_bytes = text.encode("utf-8").lower()
+    for keyword, keyword_bytes in zip(GOING_CONCERN_KEYWORDS, _GOING_CONCERN_KEYWORD_BYTES):
+        pos = text_bytes.find(keyword_bytes)
+        if pos != -1:
+            if not text.isascii():
+                # Byte offset -> character offset
+                pos = len(text_bytes[:pos].decode("utf-8", errors="ignore"))
+            return keyword, pos
+    return "", -1
+
+
+def find_marker(text_lower: str, marker_phrase: str) -> Tuple[int, int]:
+    """
+    Locate a marker phrase in lowercased filing text.
+
+    Uses a plain substring search first and only falls back to a regex that
+    tolerates whitespace differences when the verbatim search misses.
+
+    Returns:
+        (start, end) offsets, or (-1, -1) if not found
+    """
+    marker_lower = marker_phrase.lower().strip()
+    pos = text_lower.find(marker_lower)
+    if pos != -1:
+        return pos, pos + len(marker_lower)
+
+    words = marker_lower.split()
+    if not words:
+        return -1, -1
+    match = re.search(r"\s+".join(map(re.escape, words)), text_lower)
+    if match:
+        return match.start(), match.end()
+    return -1, -1
+
+
 @dataclass
 class ExtractedSignal:
     """Extracted signal from a filing."""
@@ -41,6 +104,7 @@ class ExtractedSignal:
     filing_accession: str
     filing_type: str
     evidence_verified: bool  # True if evidence found in source
+    prompt_version: str = ""  # Version of the prompt that produced it
 
 
 class SignalExtractor:
@@ -71,18 +135,47 @@ class SignalExtractor:
         """Create a new semaphore for the current event loop."""
         return asyncio.Semaphore(self.max_concurrent)
 
-    async def _call_with_retry(self, messages: List[Dict], max_retries: int = 5) -> Optional[str]:
-        """Call OpenAI API with exponential backoff retry on rate limit."""
+    async def _call_with_retry(
+        self,
+        messages: List[Dict],
+        response_format: Dict[str, Any] = SIGNAL_EXTRACTION_FORMAT,
+        cache_key: Optional[str] = None,
+        max_retries: int = 5,
+    ) -> Optional[str]:
+        """
+        Call OpenAI API with exponential backoff retry on rate limit.
+
+        With a cache_key, a previously stored response is returned without
+        calling the model, and a fresh response is stored under that key.
+        """
+        if cache_key:
+            cached = await extraction_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Extraction cache hit: {cache_key}")
+                return cached
+
         for attempt in range(max_retries):
+            await openai_limiter.acquire_async()
             try:
                 response = await self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,
-                    response_format={"type": "json_object"},
+                    response_format=response_format,
                     temperature=0.1,
                     max_tokens=2000,
                 )
-                return response.choices[0].message.content
+                usage = response.usage
+                if usage:
+                    details = getattr(usage, "prompt_tokens_details", None)
+                    logger.debug(
+                        f"LLM usage: {usage.prompt_tokens} prompt tokens "
+                        f"({getattr(details, 'cached_tokens', 0) or 0} cached)"
+                    )
+
+                content = response.choices[0].message.content
+                if cache_key and content:
+                    await extraction_cache.set(cache_key, content)
+                return content
             except RateLimitError as e:
                 if attempt < max_retries - 1:
                     # Exponential backoff with jitter
@@ -213,14 +306,11 @@ class SignalExtractor:
         """
         try:
             # First try exact string match (fastest)
-            marker_lower = marker_phrase.lower()
-            source_lower = source_text.lower()
-
-            pos = source_lower.find(marker_lower)
+            pos, marker_end = find_marker(source_text.lower(), marker_phrase)
             if pos != -1:
                 # Found exact match - extract context
                 start = max(0, pos - self.evidence_context_chars)
-                end = min(len(source_text), pos + len(marker_phrase) + self.evidence_context_chars)
+                end = min(len(source_text), marker_end + self.evidence_context_chars)
 
                 # Try to start/end at sentence boundaries
                 if start > 0:
@@ -289,6 +379,7 @@ class SignalExtractor:
                 if len(clean_text) > self.max_filing_chars:
                     logger.info(f"Truncating 8-K from {len(clean_text)} to {self.max_filing_chars} chars")
                     clean_text = clean_text[:self.max_filing_chars]
+                clean_text = fit_filing_text(clean_text, filing_text_budget("8k"))
 
                 filing_date = filing_data.get("filed_at", "")
                 accession = filing_data.get("accession_number", "")
@@ -299,18 +390,16 @@ class SignalExtractor:
                 )
 
                 # Step 2: LLM extracts signals with marker phrases
-                prompt = EXTRACT_8K_PROMPT.format(
+                messages = build_8k_messages(
                     company_name=company_name,
                     filing_date=filing_date,
                     accession_number=accession,
                     filing_text=clean_text,
                 )
-
-                messages = [
-                    {"role": "system", "content": "You are an expert SEC filing analyst. Extract signals with VERBATIM marker phrases. Return valid JSON only."},
-                    {"role": "user", "content": prompt},
-                ]
-                content = await self._call_with_retry(messages)
+                content = await self._call_with_retry(
+                    messages,
+                    cache_key=extraction_cache_key("8k", self.model, accession),
+                )
                 if not content:
                     return []
                 result = json.loads(content)
@@ -349,6 +438,7 @@ class SignalExtractor:
                         filing_accession=accession,
                         filing_type="8-K",
                         evidence_verified=verified,
+                        prompt_version=EXTRACT_8K_PROMPT_VERSION,
                     ))
 
                 logger.info(f"Extracted {len(signals)} signals from 8-K {accession}")
@@ -382,29 +472,12 @@ class SignalExtractor:
                 accession = filing_data.get("accession_number", "")
 
                 # Search on clean text
-                search_text = clean_text.lower()
-
-                going_concern_keywords = [
-                    "going concern",
-                    "substantial doubt",
-                    "ability to continue as a going concern",
-                    "continue as a going concern",
-                ]
-
-                keyword_found = False
-                keyword_position = -1
+                keyword, keyword_position = find_going_concern_keyword(clean_text)
 
-                for keyword in going_concern_keywords:
-                    pos = search_text.find(keyword)
-                    if pos != -1:
-                        keyword_found = True
-                        keyword_position = pos
-                        logger.info(f"Found '{keyword}' in 10-K {accession} at position {pos}")
-                        break
-
-                if not keyword_found:
+                if keyword_position == -1:
                     logger.info(f"No going concern keywords in 10-K {accession}")
                     return []
+                logger.info(f"Found '{keyword}' in 10-K {accession} at position {keyword_position}")
 
                 # Extract context around keyword
                 start = max(0, keyword_position - 3000)
@@ -419,7 +492,7 @@ class SignalExtractor:
                     accession, clean_text, ticker, cik, "10-K"
                 )
 
-                prompt = EXTRACT_10K_GOING_CONCERN_PROMPT.format(
+                prompt = EXTRACT_10K_GOING_CONCERN_TEMPLATE.substitute(
                     company_name=company_name,
                     filing_date=filing_date,
                     accession_number=accession,
@@ -430,7 +503,11 @@ class SignalExtractor:
                     {"role": "system", "content": "You are an expert SEC filing analyst. Return valid JSON only."},
                     {"role": "user", "content": prompt},
                 ]
-                content = await self._call_with_retry(messages)
+                content = await self._call_with_retry(
+                    messages,
+                    GOING_CONCERN_FORMAT,
+                    cache_key=extraction_cache_key("10k_going_concern", self.model, accession),
+                )
                 if not content:
                     return []
                 result = json.loads(content)
@@ -471,6 +548,7 @@ class SignalExtractor:
                     filing_accession=accession,
                     filing_type="10-K",
                     evidence_verified=verified,
+                    prompt_version=EXTRACT_10K_GOING_CONCERN_PROMPT_VERSION,
                 )
 
                 logger.info(f"Extracted GOING_CONCERN from 10-K {accession}")
@@ -544,7 +622,9 @@ class SignalExtractor:
                     logger.info(f"Truncating 10-K items from {len(items_text)} to {max_items_chars} chars")
                     items_text = items_text[:max_items_chars] + "\n... [truncated]"
 
-                clean_text = self._clean_html(items_text)
+                clean_text = fit_filing_text(
+                    self._clean_html(items_text), filing_text_budget("10k_items")
+                )
 
                 # Embed for evidence verification
                 await self._embed_and_store_filing(
@@ -552,7 +632,7 @@ class SignalExtractor:
                 )
 
                 # Use new 10-K items prompt
-                prompt = EXTRACT_10K_ITEMS_PROMPT.format(
+                prompt = EXTRACT_10K_ITEMS_TEMPLATE.substitute(
                     company_name=company_name,
                     filing_date=filing_date,
                     accession_number=accession,
@@ -564,7 +644,10 @@ class SignalExtractor:
                     {"role": "user", "content": prompt},
                 ]
 
-                content = await self._call_with_retry(messages)
+                content = await self._call_with_retry(
+                    messages,
+                    cache_key=extraction_cache_key("10k_items", self.model, accession),
+                )
                 if not content:
                     return []
 
@@ -604,6 +687,7 @@ class SignalExtractor:
                         filing_accession=accession,
                         filing_type="10-K",
                         evidence_verified=verified,
+                        prompt_version=EXTRACT_10K_ITEMS_PROMPT_VERSION,
                     ))
 
                 logger.info(f"Extracted {len(signals)} signals from 10-K {accession} using item extraction")
@@ -86,21 +86,19 @@ class RiskScorer:
         # Check each combination pattern
         detected_combinations = []
 
-        for combo_name, combo_config in SIGNAL_COMBINATIONS.items():
-            required_signals = set(combo_config["signals"])
-
+        for combo_name, combo in SIGNAL_COMBINATIONS.items():
             # Check if all required signals are present in recent signals
-            if required_signals.issubset(recent_types):
+            if combo.signals.issubset(recent_types):
                 detected_combinations.append({
                     "pattern": combo_name,
-                    "signals": list(required_signals),
-                    "multiplier": combo_config["multiplier"],
-                    "description": combo_config["description"],
-                    "risk_level": combo_config["risk_level"],
+                    "signals": list(combo.signals),
+                    "multiplier": combo.multiplier,
+                    "description": combo.description,
+                    "risk_level": combo.risk_level,
                 })
 
                 logger.info(
-                    f"Detected combination: {combo_name} - {combo_config['description']}"
+                    f"Detected combination: {combo_name} - {combo.description}"
                 )
 
         return detected_combinations
@@ -138,19 +136,21 @@ class RiskScorer:
             "signals_per_90_days": recent_count,
         }
 
-        if recent_count >= VELOCITY_THRESHOLDS["EXTREME_VELOCITY"]["signals_count"]:
+        extreme = VELOCITY_THRESHOLDS["EXTREME_VELOCITY"]
+        high = VELOCITY_THRESHOLDS["HIGH_VELOCITY"]
+        if recent_count >= extreme.signals_count:
             velocity_info = {
                 "velocity": "EXTREME",
-                "multiplier": VELOCITY_THRESHOLDS["EXTREME_VELOCITY"]["multiplier"],
+                "multiplier": extreme.multiplier,
                 "signals_per_90_days": recent_count,
-                "description": VELOCITY_THRESHOLDS["EXTREME_VELOCITY"]["description"],
+                "description": extreme.description,
             }
-        elif recent_count >= VELOCITY_THRESHOLDS["HIGH_VELOCITY"]["signals_count"]:
+        elif recent_count >= high.signals_count:
             velocity_info = {
                 "velocity": "HIGH",
-                "multiplier": VELOCITY_THRESHOLDS["HIGH_VELOCITY"]["multiplier"],
+                "multiplier": high.multiplier,
                 "signals_per_90_days": recent_count,
-                "description": VELOCITY_THRESHOLDS["HIGH_VELOCITY"]["description"],
+                "description": high.description,
             }
 
         if velocity_info["velocity"] != "LOW":
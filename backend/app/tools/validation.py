@@ -7,8 +7,16 @@ from typing import List, Dict, Any, Tuple, Optional
 from openai import AsyncOpenAI, RateLimitError
 
 from app.config import get_settings
-from app.prompts.validation import LLM_VALIDATION_PROMPT, VALID_SIGNAL_TYPES
+from app.prompts._bankruptcy_gate import classify_bankruptcy
+from app.prompts.schemas import VALIDATION_FORMAT
+from app.prompts.validation import (
+    LLM_VALIDATION_TEMPLATE,
+    MAX_VALIDATION_BATCH,
+    VALID_SIGNAL_TYPES,
+    VALIDATION_PROMPT_VERSION,
+)
 from app.core.logging import get_logger
+from app.core.rate_limiter import openai_limiter
 from app.core.constants import MIN_CONFIDENCE, MIN_EVIDENCE_LENGTH
 
 logger = get_logger(__name__)
@@ -19,9 +27,10 @@ class SignalValidator:
     """
     Validate extracted signals using LLM.
 
-    Two-stage validation:
+    Three-stage validation:
     1. Basic checks (fast, no API cost)
-    2. LLM validation (accurate, catches semantic issues)
+    2. Keyword gate for clear-cut BANKRUPTCY_FILING evidence (no API cost)
+    3. LLM validation (accurate, catches semantic issues)
     """
 
     def __init__(
@@ -40,13 +49,15 @@ class SignalValidator:
     async def _call_with_retry(self, messages: List[Dict], max_retries: int = 5) -> Optional[str]:
         """Call OpenAI API with exponential backoff retry on rate limit."""
         for attempt in range(max_retries):
+            await openai_limiter.acquire_async()
             try:
                 response = await self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,
-                    response_format={"type": "json_object"},
+                    response_format=VALIDATION_FORMAT,
                     temperature=0.1,
-                    max_tokens=200,
+                    # ~100 tokens per verdict for a full batch
+                    max_tokens=100 * MAX_VALIDATION_BATCH,
                 )
                 return response.choices[0].message.content
             except RateLimitError as e:
@@ -88,27 +99,72 @@ class SignalValidator:
 
         return True, ""
 
-    async def _llm_validate_signal(
+    def _apply_verdict(
         self,
         signal: Dict[str, Any],
-        semaphore: asyncio.Semaphore,
+        verdict: Dict[str, Any],
     ) -> Tuple[bool, Dict[str, Any]]:
         """
-        Validate a single signal using LLM.
+        Apply one LLM verdict to its signal.
 
         Returns:
             Tuple of (is_valid, updated_signal_or_rejection_info)
         """
+        # Only reject if classification is wrong
+        if not verdict.get("is_valid", False):
+            reason = verdict.get("rejection_reason") or "Failed LLM validation"
+            signal["rejection_reason"] = f"LLM: {reason}"
+            logger.info(f"LLM rejected {signal.get('type')}: {reason}")
+            return False, signal
+
+        # Apply corrections if any
+        if verdict.get("corrected_type"):
+            logger.info(
+                f"Correcting signal type: {signal['type']} -> {verdict['corrected_type']}"
+            )
+            signal["type"] = verdict["corrected_type"]
+
+        if verdict.get("corrected_severity"):
+            logger.info(
+                f"Correcting severity: {signal['severity']} -> {verdict['corrected_severity']}"
+            )
+            signal["severity"] = verdict["corrected_severity"]
+
+        # Update confidence from validation
+        if verdict.get("confidence"):
+            signal["validation_confidence"] = verdict["confidence"]
+
+        signal["validated"] = True
+        signal["validation_notes"] = "Passed LLM validation"
+        signal["validation_prompt_version"] = VALIDATION_PROMPT_VERSION
+        return True, signal
+
+    async def _llm_validate_batch(
+        self,
+        signals: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+    ) -> List[Tuple[bool, Dict[str, Any]]]:
+        """
+        Validate a batch of signals with a single LLM call.
+
+        Returns:
+            One (is_valid, updated_signal_or_rejection_info) tuple per signal
+        """
         async with semaphore:
             try:
-                prompt = LLM_VALIDATION_PROMPT.format(
-                    signal_type=signal.get("type", ""),
-                    evidence=signal.get("evidence", ""),
-                    severity=signal.get("severity", 5),
-                    filing_type=signal.get("filing_type", "8-K"),
-                    filing_date=signal.get("date", ""),
-                    person=signal.get("person") or "N/A",
-                )
+                signals_json = json.dumps([
+                    {
+                        "i": i,
+                        "type": signal.get("type", ""),
+                        "evidence": signal.get("evidence", ""),
+                        "severity": signal.get("severity", 5),
+                        "filing_type": signal.get("filing_type", "8-K"),
+                        "filing_date": signal.get("date", ""),
+                        "person": signal.get("person") or "N/A",
+                    }
+                    for i, signal in enumerate(signals)
+                ])
+                prompt = LLM_VALIDATION_TEMPLATE.substitute(signals_json=signals_json)
 
                 messages = [
                     {
@@ -119,46 +175,35 @@ class SignalValidator:
                 ]
                 content = await self._call_with_retry(messages)
                 if not content:
-                    # If retry fails, reject the signal
-                    return (signal, False, "Rate limit exceeded")
-                result = json.loads(content)
-
-                is_valid = result.get("is_valid", False)
-
-                # Only reject if classification is wrong
-                if not is_valid:
-                    reason = result.get("rejection_reason", "Failed LLM validation")
-                    signal["rejection_reason"] = f"LLM: {reason}"
-                    logger.info(f"LLM rejected {signal.get('type')}: {reason}")
-                    return False, signal
-
-                # Apply corrections if any
-                if result.get("corrected_type"):
-                    logger.info(
-                        f"Correcting signal type: {signal['type']} -> {result['corrected_type']}"
-                    )
-                    signal["type"] = result["corrected_type"]
-
-                if result.get("corrected_severity"):
-                    logger.info(
-                        f"Correcting severity: {signal['severity']} -> {result['corrected_severity']}"
-                    )
-                    signal["severity"] = result["corrected_severity"]
-
-                # Update confidence from validation
-                if result.get("confidence"):
-                    signal["validation_confidence"] = result["confidence"]
-
-                signal["validated"] = True
-                signal["validation_notes"] = "Passed LLM validation"
-                return True, signal
+                    # If retry fails, reject the signals
+                    for signal in signals:
+                        signal["rejection_reason"] = "LLM: Rate limit exceeded"
+                    return [(False, signal) for signal in signals]
+
+                verdicts = {
+                    v.get("index"): v
+                    for v in json.loads(content).get("validations", [])
+                }
+
+                results = []
+                for i, signal in enumerate(signals):
+                    verdict = verdicts.get(i)
+                    if verdict is None:
+                        # Missing verdict: let the signal pass (fail open)
+                        signal["validated"] = True
+                        signal["validation_notes"] = "LLM returned no verdict"
+                        results.append((True, signal))
+                    else:
+                        results.append(self._apply_verdict(signal, verdict))
+                return results
 
             except Exception as e:
                 logger.error(f"LLM validation error: {e}")
-                # On error, let the signal pass (fail open)
-                signal["validated"] = True
-                signal["validation_notes"] = f"LLM validation error: {e}"
-                return True, signal
+                # On error, let the signals pass (fail open)
+                for signal in signals:
+                    signal["validated"] = True
+                    signal["validation_notes"] = f"LLM validation error: {e}"
+                return [(True, signal) for signal in signals]
 
     async def validate_signals_async(
         self,
@@ -198,34 +243,58 @@ class SignalValidator:
                 signal["validation_notes"] = "Passed basic validation (LLM skipped)"
             return basic_passed, rejected
 
-        # Stage 2: LLM validation (accurate)
+        # Stage 2: settle clear-cut BANKRUPTCY_FILING evidence without the LLM
+        llm_candidates = []
+        for signal in basic_passed:
+            if signal.get("type") != "BANKRUPTCY_FILING":
+                llm_candidates.append(signal)
+                continue
+
+            verdict = classify_bankruptcy(signal.get("evidence", ""))
+            if verdict == "UNCLEAR":
+                llm_candidates.append(signal)
+                continue
+
+            if verdict == "CONDITIONAL":
+                logger.info("Correcting signal type: BANKRUPTCY_FILING -> GOING_CONCERN (conditional language)")
+                signal["type"] = "GOING_CONCERN"
+            signal["validated"] = True
+            signal["validation_notes"] = f"Passed bankruptcy keyword gate ({verdict})"
+            validated.append(signal)
+
+        gate_validated = len(validated)
+        basic_passed = llm_candidates
+
+        # Stage 3: LLM validation (accurate)
         if not basic_passed:
-            return [], rejected
+            return validated, rejected
 
         # Create semaphore for this event loop
         semaphore = self._get_semaphore()
 
+        # One call per batch amortizes the shared prompt prefix over many signals
         tasks = [
-            self._llm_validate_signal(signal, semaphore)
-            for signal in basic_passed
+            self._llm_validate_batch(basic_passed[i:i + MAX_VALIDATION_BATCH], semaphore)
+            for i in range(0, len(basic_passed), MAX_VALIDATION_BATCH)
         ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Validation task failed: {result}")
+        for batch_results in results:
+            if isinstance(batch_results, Exception):
+                logger.error(f"Validation task failed: {batch_results}")
                 continue
 
-            is_valid, signal = result
-            if is_valid:
-                validated.append(signal)
-            else:
-                rejected.append(signal)
+            for is_valid, signal in batch_results:
+                if is_valid:
+                    validated.append(signal)
+                else:
+                    rejected.append(signal)
 
         logger.info(
-            f"LLM validation: {len(basic_passed)} -> {len(validated)} signals "
-            f"({len(basic_passed) - len(validated)} rejected)"
+            f"LLM validation: {len(basic_passed)} -> {len(validated) - gate_validated} signals "
+            f"({len(basic_passed) - len(validated) + gate_validated} rejected, "
+            f"{gate_validated} settled by keyword gate)"
         )
 
         return validated, rejected
@@ -1,7 +1,7 @@
 #!/bin/bash
 
-# Start Celery worker in background
-celery -A app.celery_app worker --loglevel=info --concurrency=2 &
+# Start Celery worker in background (-B: embedded beat for the nightly label refresh)
+celery -A app.celery_app worker -B --loglevel=info --concurrency=2 &
 
 # Start FastAPI server (foreground)
-uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools